@@ -6,92 +6,109 @@
 #
 
 from PIL import Image
+from concurrent.futures import ProcessPoolExecutor
 import numpy as np
 import sys
 import os
+import time
 
+# File types read from an input directory in batch mode
+IMAGE_EXTENSIONS = (".bmp", ".png", ".gif")
+
+
+def lap(timing, name, step):
+    # Add the time since step to the timing of name and return the current time as start of the next step
+    now = time.perf_counter()
+    timing[name] += now - step
+    return now
+
+
+def extract_sprites(input_path, sprite_size):
+    # Cut an image into sprites and deduplicate them
+    # Returns the unique sprites as array (sprites, size, size, 4) in order of appearance, the map as array
+    # (rows, cols) of sprite numbers (starting with 1) and the timing of the steps - None if the image can not
+    # be used
+    timing = {"load": 0.0, "key": 0.0, "split": 0.0, "deduplicate": 0.0}
+    step = time.perf_counter()
 
-def split_image(input_path, output_path, sprite_size):
     # Open the BMP image that we manually created from the source image
     # Original Image is from https://www.cpc-power.com/
+    # and load it as one RGBA array (height, width, 4)
     image = Image.open(input_path)
+    pixels = np.array(image.convert('RGBA'))
+    step = lap(timing, "load", step)
 
     # Get the dimensions of the input image
-    width, height = image.size
+    height, width = pixels.shape[:2]
 
     # Check if the image is a multiple of the sprite size
     if width % sprite_size != 0 or height % sprite_size != 0:
-        print("The image is not a multiple of the sprite size")
-        return
+        print(f"{input_path}: The image is not a multiple of the sprite size")
+        return None
 
     # Calculate the number of sprites in each dimension
     num_sprites_x = width // sprite_size
     num_sprites_y = height // sprite_size
 
-    spritestorage = []
-    spritepos = 0
+    # Replace the green background with a transparent one - all pixels at once, compared as 32 bit RGBA values
+    # (little endian, so red is the lowest byte and alpha the highest)
+    colors = pixels.view('<u4')[..., 0]
+    colors[(colors & 0xFFFFFF) == 0x006500] = 0
+    step = lap(timing, "key", step)
+
+    # Cut the image into sprites - tiles[y, x] is the sprite at sprite position x, y
+    # (copied once, so the pixels of each sprite are in one piece of memory)
+    tiles = np.ascontiguousarray(pixels.reshape(num_sprites_y, sprite_size, num_sprites_x, sprite_size, 4)
+                                 .swapaxes(1, 2))
+    step = lap(timing, "split", step)
 
-    map = []
+    # Index of the unique sprites - sprite number keyed by the raw RGBA bytes of the sprite
+    # (the dict hashes the bytes and compares them exactly, so a hash collision never merges two sprites)
+    spriteindex = {}
     sprite_arrays = []
+    map = np.zeros((num_sprites_y, num_sprites_x), dtype=np.int32)
 
-    # Iterate over each sprite and save it as a separate image
+    # Look up each sprite in the index - if it is not in there, add it
     for y in range(num_sprites_y):
-        line = []
         for x in range(num_sprites_x):
-            # Calculate the coordinates for each sprite
-            left = x * sprite_size
-            upper = y * sprite_size
-            right = left + sprite_size
-            lower = upper + sprite_size
-
-            # Crop the image to get the sprite and convert it to RGBA
-            sprite = image.crop((left, upper, right, lower))
-            sprite = sprite.convert('RGBA')
-
-            # Get the dimensions of the sprite - but should be same as sprite_size, but anyway
-            width, height = sprite.size
-
-            # Replace the green background with a transparent one
-            # Loop through each pixel in the image
-            for xi in range(width):
-                for yi in range(height):
-                    # Get the color of the current pixel
-                    current_color = sprite.getpixel((xi, yi))
-
-                    # Check if the current pixel color matches the target color
-                    if current_color[:3] == (0, 101, 0):
-                        # Replace the color with a transparent pixel
-                        sprite.putpixel((xi, yi), (0, 0, 0, 0))
-
-            # go trough spritestorage and check if the sprite is already in there
-            # if not, add it
-            if sprite not in spritestorage:
-                spritepos += 1
-                spritnumber = spritepos
-
-                # Convert the sprite to a numpy array
-                sprite_array = np.array(sprite)
-                # Append the sprite array to our list of sprite arrays
+            sprite_bytes = tiles[y, x].tobytes()
+            spritnumber = spriteindex.get(sprite_bytes)
+            if spritnumber is None:
+                sprite_arrays.append(tiles[y, x])
+                spritnumber = spriteindex[sprite_bytes] = len(sprite_arrays)
+                if spritnumber > 255:
+                    print(f"{input_path}: Too many sprites! Max is 255")
+                    return None
+            map[y, x] = spritnumber
+    lap(timing, "deduplicate", step)
+
+    return np.array(sprite_arrays).reshape(-1, sprite_size, sprite_size, 4), map, timing
+
+
+def merge_sprites(results):
+    # Merge the sprites of several images into one table - numbered in order of appearance, first image first
+    # Returns the table as array and the maps of the images renumbered to it
+    spriteindex = {}
+    sprite_arrays = []
+    maps = []
+    for sprites, map, timing in results:
+        # Global sprite number of each sprite number of the image (index 0 is unused)
+        numbers = np.zeros(len(sprites) + 1, dtype=np.int32)
+        for i, sprite_array in enumerate(sprites, 1):
+            sprite_bytes = sprite_array.tobytes()
+            if sprite_bytes not in spriteindex:
                 sprite_arrays.append(sprite_array)
+                spriteindex[sprite_bytes] = len(sprite_arrays)
+            numbers[i] = spriteindex[sprite_bytes]
+        maps.append(numbers[map])
+    return np.array(sprite_arrays), maps
 
-                # Append the sprite pciture to our list of sprites
-                spritestorage.append(sprite)
-                # Save the sprite image
-                sprite.save(f"{output_path}/sprite_{spritepos}.png")
-                print(f"Found unique sprite No {spritepos} - saving to {output_path}/sprite_{spritepos}.png")
-            else:
-                # if it is, find the index of the sprite and save it as that
-                spritnumber = spritestorage.index(sprite) + 1
-
-            line.append(spritnumber)
-
-            if spritepos > 255:
-                print("Too many sprites! Max is 255")
-                return
-        map.append(line)
-    # write map to python file
-    with open(f"{output_path}/map.py", "w") as f:
-        f.write(f"map = {map}")
+
+def save_sprites(sprite_arrays, output_path, sprite_size):
+    # Save each sprite as image and all of them as python code
+    for spritepos, sprite_array in enumerate(sprite_arrays, 1):
+        Image.fromarray(sprite_array, 'RGBA').save(f"{output_path}/sprite_{spritepos}.png")
+        print(f"Found unique sprite No {spritepos} - saving to {output_path}/sprite_{spritepos}.png")
 
     # generate python code for sprite_arrays and save it to file
     code = f'# This array contains {len(sprite_arrays)} sprite arrays\n'
@@ -118,18 +135,123 @@ def split_image(input_path, output_path, sprite_size):
         f.write(code)
 
 
+def save_map(map, path):
+    # write map to python file
+    with open(path, "w") as f:
+        f.write(f"map = {map.tolist()}")
+
+
+def print_timing(input_path, map, sprite_count, timing, seconds):
+    tiles = map.size
+    print(f"{input_path}: {tiles} tiles, {sprite_count} unique sprites in {seconds:.2f} s "
+          f"({tiles / seconds:.0f} tiles/s)")
+    for name, step_seconds in timing.items():
+        print(f"  {name:13s} {step_seconds:8.3f} s")
+
+
+def split_image(input_path, output_path, sprite_size):
+    # Extract the sprites and the map of one image
+    start = time.perf_counter()
+    result = extract_sprites(input_path, sprite_size)
+    if result is None:
+        return
+    sprite_arrays, map, timing = result
+
+    step = time.perf_counter()
+    timing["save sprites"] = timing["write files"] = 0.0
+    save_sprites(sprite_arrays, output_path, sprite_size)
+    step = lap(timing, "save sprites", step)
+    save_map(map, f"{output_path}/map.py")
+    lap(timing, "write files", step)
+
+    # Print the timing summary
+    print_timing(input_path, map, len(sprite_arrays), timing, time.perf_counter() - start)
+
+
+def map_names(input_paths):
+    # Name of the map file of each image - the file name without extension, with as many of its parent
+    # directories as needed to tell images with the same file name apart (day/track.bmp -> day_track)
+    # Returns None if an image is given twice
+    parts = [os.path.normpath(os.path.splitext(os.path.abspath(input_path))[0]).split(os.sep)
+             for input_path in input_paths]
+    for depth in range(1, max(len(path_parts) for path_parts in parts) + 1):
+        names = ["_".join(part for part in path_parts[-depth:] if part) for path_parts in parts]
+        if len(set(names)) == len(names):
+            return names
+    return None
+
+
+def split_images(input_paths, output_path, sprite_size, workers=None):
+    # Extract the sprites of many images in parallel and merge them into one table
+    # Writes the table once and one map per image (map_<name>.py, see map_names) with the sprite numbers of the
+    # table
+    names = map_names(input_paths)
+    if names is None:
+        print("An input file is given more than once")
+        return
+    names = dict(zip(input_paths, names))
+
+    start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        results = list(pool.map(extract_sprites, input_paths, [sprite_size] * len(input_paths)))
+    extracted = time.perf_counter()
+
+    # Images that can not be used are skipped
+    inputs = [(input_path, result) for input_path, result in zip(input_paths, results) if result is not None]
+    if not inputs:
+        return
+
+    step = time.perf_counter()
+    sprite_arrays, maps = merge_sprites([result for input_path, result in inputs])
+    merged = time.perf_counter() - step
+    if len(sprite_arrays) > 255:
+        print(f"Too many sprites in all images ({len(sprite_arrays)})! Max is 255")
+        return
+
+    step = time.perf_counter()
+    save_sprites(sprite_arrays, output_path, sprite_size)
+    for (input_path, result), map in zip(inputs, maps):
+        save_map(map, f"{output_path}/map_{names[input_path]}.py")
+    written = time.perf_counter() - step
+
+    # Print the timing summary - per image the time of its worker process
+    for input_path, (sprites, map, timing) in inputs:
+        print_timing(input_path, map, len(sprites), timing, sum(timing.values()))
+    tiles = sum(map.size for map in maps)
+    total = time.perf_counter() - start
+    print(f"{len(inputs)} images: {tiles} tiles, {len(sprite_arrays)} unique sprites in {total:.2f} s "
+          f"({tiles / total:.0f} tiles/s) - extract {extracted - start:.2f} s, merge {merged:.3f} s, "
+          f"write {written:.3f} s")
+
+
+def find_images(paths):
+    # Input files of batch mode - directories are replaced by the images in them
+    input_paths = []
+    for path in paths:
+        if os.path.isdir(path):
+            input_paths += sorted(os.path.join(path, name) for name in os.listdir(path)
+                                  if name.lower().endswith(IMAGE_EXTENSIONS))
+        else:
+            input_paths.append(path)
+    return input_paths
+
+
 if __name__ == "__main__":
     # Check if the user provided an input file
     if len(sys.argv) < 2:
         print("Please provide an input file")
         sys.exit()
-    # Input Name from Commandline argument
-    input_path = sys.argv[1]
-    # Check if the input file exists
-    if not os.path.isfile(input_path):
-        print("The input file does not exist")
-        sys.exit()
+    # Input Names from Commandline arguments - more than one file or a directory runs the batch mode
+    input_paths = find_images(sys.argv[1:])
+    # Check if the input files exist
+    for input_path in input_paths:
+        if not os.path.isfile(input_path):
+            print(f"The input file {input_path} does not exist")
+            sys.exit()
     output_path = "export"
     sprite_size = 16
 
-    split_image(input_path, output_path, sprite_size)
+    if len(input_paths) == 1 and not os.path.isdir(sys.argv[1]):
+        split_image(input_paths[0], output_path, sprite_size)
+    else:
+        split_images(input_paths, output_path, sprite_size)
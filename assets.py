@@ -0,0 +1,231 @@
+#
+# Author: Marco Alexander Reinke (DG1YIQ)
+# Date: December 2023
+# License: GNU GPL 3.0
+# Description: This is a simple clone of StreetMachine for the CPC 464
+#
+# Binary assets - sprites, player sprite and the three palettes in one file and the map in another
+#
+# Layout of files/sprites.bin (all little endian):
+#   header   magic b'SMSP', version, sprite count, sprite size, palette count, palette size (5 x uint16)
+#   palettes palette count x palette size x RGB (uint8) - summer, night, winter
+#   player   sprite size x sprite size x (color index, alpha) (uint8)
+#   sprites  sprite count x sprite size x sprite size x (color index, alpha) (uint8)
+#
+# Layout of files/map.bin (all little endian):
+#   header   magic b'SMMP', version, width, height (3 x uint16)
+#   map      height x width sprite numbers (uint8, row by row)
+#
+# Track metadata in files/map.json:
+#   name            name of the track
+#   allowed_sprites sprite numbers the car may drive on (streets and green areas)
+#
+# Create the files out of sprites_array.py and map_array.py with "python assets.py" and
+# python files out of the binary files with "python assets.py --export-py" - these are written to
+# sprites_array_export.py and map_array_export.py, the hand-commented sources are never overwritten
+#
+# Zoomed sprite atlases are cached in the cache directory (see settings.SPRITE_CACHE_DIR), one file per zoom:
+#   header   magic b'SMAT', version, width, height (3 x uint16), SHA-1 of the source (20 bytes)
+#   atlas    height x width palette indices (uint8, row by row)
+#
+
+import functools
+import hashlib
+import json
+import mmap
+import os
+import struct
+import sys
+import numpy as np
+
+SPRITES_FILE = "files/sprites.bin"
+SPRITES_MAGIC = b'SMSP'
+SPRITES_VERSION = 1
+SPRITES_HEADER = struct.Struct('<4s5H')
+
+MAP_FILE = "files/map.bin"
+MAP_MAGIC = b'SMMP'
+MAP_VERSION = 1
+MAP_HEADER = struct.Struct('<4s3H')
+MAP_INFO_FILE = "files/map.json"
+
+ATLAS_MAGIC = b'SMAT'
+ATLAS_VERSION = 1
+ATLAS_HEADER = struct.Struct('<4s3H20s')
+
+
+class SpriteAssets:
+    def __init__(self, sprites, player_sprite, summer_color, night_color, winter_color, buffer=None):
+        # Sprites as array (sprites, size, size, 2) and player sprite as array (size, size, 2)
+        # with color index and alpha of each pixel
+        self.sprites = sprites
+        self.player_sprite = player_sprite
+        # Palettes as lists of RGB tuples
+        self.summer_color = summer_color
+        self.night_color = night_color
+        self.winter_color = winter_color
+        # Memory map the arrays are read from (kept open as long as the arrays are used)
+        self.buffer = buffer
+
+
+@functools.cache
+def load_sprite_assets(path=SPRITES_FILE):
+    # Load the sprite assets from the binary file without copying - fall back to sprites_array.py without it
+    if not os.path.isfile(path):
+        print(f'{path} not found - using sprites_array.py')
+        return load_sprite_assets_from_py()
+
+    with open(path, "rb") as file:
+        buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+    magic, version, count, size, palette_count, palette_size = SPRITES_HEADER.unpack_from(buffer)
+    if magic != SPRITES_MAGIC or version != SPRITES_VERSION or palette_count != 3:
+        raise ValueError(f'{path} is not a sprite file of version {SPRITES_VERSION}')
+
+    offset = SPRITES_HEADER.size
+    palettes = np.frombuffer(buffer, np.uint8, palette_count * palette_size * 3, offset)
+    palettes = [[tuple(color) for color in palette] for palette in palettes.reshape(palette_count, palette_size, 3)
+                .tolist()]
+    offset += palette_count * palette_size * 3
+    player_sprite = np.frombuffer(buffer, np.uint8, size * size * 2, offset).reshape(size, size, 2)
+    offset += size * size * 2
+    sprites = np.frombuffer(buffer, np.uint8, count * size * size * 2, offset).reshape(count, size, size, 2)
+    return SpriteAssets(sprites, player_sprite, *palettes, buffer=buffer)
+
+
+def load_sprite_assets_from_py():
+    # Load the sprite assets from the python source sprites_array.py
+    import sprites_array
+    return SpriteAssets(np.array(sprites_array.sprites, dtype=np.uint8),
+                        np.array(sprites_array.player_sprite, dtype=np.uint8),
+                        sprites_array.summer_color, sprites_array.night_color, sprites_array.winter_color)
+
+
+def save_sprite_assets(assets, path=SPRITES_FILE):
+    # Write the sprite assets to the binary file
+    count, size = assets.sprites.shape[0], assets.sprites.shape[1]
+    palettes = [assets.summer_color, assets.night_color, assets.winter_color]
+    with open(path, "wb") as file:
+        file.write(SPRITES_HEADER.pack(SPRITES_MAGIC, SPRITES_VERSION, count, size, len(palettes), len(palettes[0])))
+        file.write(np.array(palettes, dtype=np.uint8).tobytes())
+        file.write(np.ascontiguousarray(assets.player_sprite, dtype=np.uint8).tobytes())
+        file.write(np.ascontiguousarray(assets.sprites, dtype=np.uint8).tobytes())
+    print(f'Saved {count} sprites to {path} - {os.path.getsize(path)} bytes')
+
+
+def export_sprites_py(assets, path="sprites_array_export.py"):
+    # Write the sprite assets as python source in the format of sprites_array.py
+    def sprite_code(sprite, indent):
+        return "".join(f"{indent}[{', '.join(f'({index}, {alpha})' for index, alpha in row)}],\n"
+                       for row in sprite.tolist())
+
+    code = "#\n# Generated by assets.py out of " + SPRITES_FILE + " - compare with sprites_array.py\n#\n\n"
+    for name in ("summer_color", "night_color", "winter_color"):
+        code += f"{name} = [\n" + "".join(f"    {tuple(color)},\n" for color in getattr(assets, name)) + "]\n\n"
+    code += "# This array contains the car sprite 2d array x,y coordinates and color index (0-15) and Alpha (0-255)\n\n"
+    code += "player_sprite = [\n" + sprite_code(assets.player_sprite, "    ") + "]\n\n"
+    code += f"# This array contains {len(assets.sprites)} sprite arrays\n\n"
+    code += "sprites = [\n" + "".join("    [\n" + sprite_code(sprite, "        ") + "    ],\n"
+                                      for sprite in assets.sprites) + "]\n"
+    with open(path, "w") as file:
+        file.write(code)
+    print(f'Exported {len(assets.sprites)} sprites to {path}')
+
+
+@functools.cache
+def load_map(path=MAP_FILE):
+    # Load the map as array (height, width) of sprite numbers from the binary file without copying
+    # fall back to map_array.py without it
+    if not os.path.isfile(path):
+        print(f'{path} not found - using map_array.py')
+        return load_map_from_py()
+
+    with open(path, "rb") as file:
+        buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+    magic, version, width, height = MAP_HEADER.unpack_from(buffer)
+    if magic != MAP_MAGIC or version != MAP_VERSION:
+        raise ValueError(f'{path} is not a map file of version {MAP_VERSION}')
+    # The array keeps the memory map open
+    return np.frombuffer(buffer, np.uint8, width * height, MAP_HEADER.size).reshape(height, width)
+
+
+@functools.cache
+def load_map_info(path=MAP_INFO_FILE):
+    # Load the track metadata
+    with open(path, "r") as file:
+        return json.load(file)
+
+
+def load_map_from_py():
+    # Load the map from the python source map_array.py
+    from map_array import map_data
+    return np.array(map_data, dtype=np.uint8)
+
+
+def save_map(map_data, path=MAP_FILE):
+    # Write the map to the binary file
+    height, width = map_data.shape
+    with open(path, "wb") as file:
+        file.write(MAP_HEADER.pack(MAP_MAGIC, MAP_VERSION, width, height))
+        file.write(np.ascontiguousarray(map_data, dtype=np.uint8).tobytes())
+    print(f'Saved {width} x {height} map to {path} - {os.path.getsize(path)} bytes')
+
+
+def export_map_py(map_data, path="map_array_export.py"):
+    # Write the map as python source in the format of map_array.py
+    code = "#\n# Generated by assets.py out of " + MAP_FILE + " - compare with map_array.py\n#\n\n"
+    code += f"# Map Data {map_data.shape[1]} by {map_data.shape[0]} Sprites\n"
+    code += "map_data = [\n" + "".join(f"    {row},\n" for row in map_data.tolist()) + "]\n"
+    with open(path, "w") as file:
+        file.write(code)
+    print(f'Exported {map_data.shape[1]} x {map_data.shape[0]} map to {path}')
+
+
+def get_atlas_key(sprites, zoom_factor):
+    # Hash of everything a zoomed atlas is built from - sprite pixels, sprite size and zoom factor
+    # (the palette is not part of it, the atlas holds palette indices)
+    digest = hashlib.sha1(struct.pack('<4s2H', ATLAS_MAGIC, ATLAS_VERSION, zoom_factor))
+    digest.update(struct.pack('<2H', *sprites.shape[:2]))
+    digest.update(np.ascontiguousarray(sprites).tobytes())
+    return digest.digest()
+
+
+def get_atlas_path(directory, zoom_factor):
+    return os.path.join(directory, f"atlas_x{zoom_factor}.bin")
+
+
+def load_atlas(directory, key, zoom_factor, width, height):
+    # Load the cached palette indices of a zoomed atlas as array (height, width) without copying
+    # None if there is no cache file or it was built from other sprites
+    path = get_atlas_path(directory, zoom_factor)
+    if not os.path.isfile(path) or os.path.getsize(path) != ATLAS_HEADER.size + width * height:
+        return None
+    with open(path, "rb") as file:
+        # Copy on write - the pixels of the atlas are never changed, but the file must not be by accident
+        buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_COPY)
+    if ATLAS_HEADER.unpack_from(buffer) != (ATLAS_MAGIC, ATLAS_VERSION, width, height, key):
+        return None
+    return np.frombuffer(buffer, np.uint8, width * height, ATLAS_HEADER.size).reshape(height, width)
+
+
+def save_atlas(directory, key, zoom_factor, pixels):
+    # Write the palette indices of a zoomed atlas to the cache - a failing cache only costs startup time
+    height, width = pixels.shape
+    path = get_atlas_path(directory, zoom_factor)
+    try:
+        os.makedirs(directory, exist_ok=True)
+        # Write to a temporary file first, so a cache file is never read half written
+        with open(path + ".tmp", "wb") as file:
+            file.write(ATLAS_HEADER.pack(ATLAS_MAGIC, ATLAS_VERSION, width, height, key))
+            file.write(np.ascontiguousarray(pixels, dtype=np.uint8).tobytes())
+        os.replace(path + ".tmp", path)
+    except OSError as error:
+        print(f'Sprite cache not written: {error}')
+
+
+if __name__ == "__main__":
+    if "--export-py" in sys.argv:
+        export_sprites_py(load_sprite_assets())
+        export_map_py(load_map())
+    else:
+        save_sprite_assets(load_sprite_assets_from_py())
+        save_map(load_map_from_py())
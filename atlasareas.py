@@ -0,0 +1,27 @@
+#
+# Author: Marco Alexander Reinke (DG1YIQ)
+# Date: December 2023
+# License: GNU GPL 3.0
+# Description: This is a simple clone of StreetMachine for the CPC 464
+#
+
+import pygame as pg
+
+
+class AtlasAreas(dict):
+    # Areas of the sprite numbers in an atlas (the sprites are below each other) - indexed like a list with
+    # areas[sprite number], an area is created the first time it is used
+    def __init__(self, tile_size, draw_sprite=None):
+        super().__init__()
+        self.tile_size = tile_size
+        # Called with sprite number and area before an area is used the first time - draws the sprite into the
+        # atlas (None if the atlas already contains all sprites)
+        self.draw_sprite = draw_sprite
+
+    def __missing__(self, sprite_number):
+        # Only called for sprites that were not used yet - all later lookups are plain dict lookups
+        area = pg.Rect(0, (sprite_number - 1) * self.tile_size, self.tile_size, self.tile_size)
+        if self.draw_sprite is not None:
+            self.draw_sprite(sprite_number, area)
+        self[sprite_number] = area
+        return area
@@ -0,0 +1,145 @@
+#
+# Author: Marco Alexander Reinke (DG1YIQ)
+# Date: December 2023
+# License: GNU GPL 3.0
+# Description: This is a simple clone of StreetMachine for the CPC 464
+#
+# Benchmarks - run all with "python benchmark.py" or single ones with "python benchmark.py load_sprites"
+#
+
+import os
+import subprocess
+import sys
+import time
+from types import SimpleNamespace
+
+# Benchmarks do not need a window
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+import pygame as pg
+
+
+def create_sprite_image_loop(sprite_array, color, sprite_size):
+    # Sprite creation as it was before the NumPy version - one set_at per pixel (for comparison)
+    surface = pg.Surface((sprite_size, sprite_size), pg.SRCALPHA)
+    for y, row in enumerate(sprite_array):
+        for x, pixel in enumerate(row):
+            finalpixel = color[pixel[0]] + (pixel[1],)
+            surface.set_at((x, y), finalpixel)
+    return surface
+
+
+def bench_load_sprites(repeat=5):
+    # Time the sprite creation for all modes - per pixel loop versus NumPy - and the mode switch
+    from sprites import Sprites
+    from sprites_array import sprites, summer_color, night_color, winter_color
+
+    game = SimpleNamespace(mode='day', map=None)
+    loader = Sprites(game, size=16)
+    palettes = {'day': summer_color, 'night': night_color, 'winter': winter_color}
+
+    print(f'load_sprites - {len(sprites)} sprites, best of {repeat}')
+    for mode, color in palettes.items():
+        loop_time = float('inf')
+        for _ in range(repeat):
+            start = time.perf_counter()
+            loop_images = [create_sprite_image_loop(sprite_array, color, 16) for sprite_array in sprites]
+            loop_time = min(loop_time, time.perf_counter() - start)
+
+        numpy_time = float('inf')
+        for _ in range(repeat):
+            start = time.perf_counter()
+            pixels, strip, images = loader.create_sprite_images(loader.sprites, loader.get_palette(mode), 16)
+            numpy_time = min(numpy_time, time.perf_counter() - start)
+
+        # Switching to this mode from the mode before it in a race
+        previous_mode = {following: preceding for preceding, following in Sprites.NEXT_MODE.items()}[mode]
+        switch_time = float('inf')
+        for _ in range(repeat):
+            game.mode = previous_mode
+            loader.load_sprites()
+            game.mode = mode
+            # During a race the worker has a whole lap to prepare the sprites of the next mode
+            if loader.prepared is not None:
+                loader.prepared.result()
+            start = time.perf_counter()
+            loader.load_sprites()
+            switch_time = min(switch_time, time.perf_counter() - start)
+
+        # Both versions must create the same pixels
+        same = all(pg.image.tobytes(a, 'RGBA') == pg.image.tobytes(b, 'RGBA')
+                   for a, b in zip(loop_images, images))
+        print(f'  {mode:6s}  loop: {loop_time * 1000:8.2f} ms  numpy: {numpy_time * 1000:8.2f} ms  '
+              f'speedup: {loop_time / numpy_time:6.1f}x  mode switch: {switch_time * 1000:6.2f} ms  '
+              f'same pixels: {same}')
+
+
+def bench_startup(repeat=5):
+    # Cold start time and memory of loading the sprite assets - each run in a new python process
+    variants = {
+        'sprites_array.py (pyc)': 'import sprites_array',
+        'sprites_array.py (compile)': 'exec(compile(open("sprites_array.py").read(), "sprites_array.py", "exec"), {})',
+        'files/sprites.bin': 'import assets; assets.load_sprite_assets()',
+    }
+    measure = ('import resource, time, numpy\n'
+               'rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss\n'
+               'start = time.perf_counter()\n'
+               '{load}\n'
+               'print(time.perf_counter() - start, resource.getrusage(resource.RUSAGE_SELF).ru_maxrss - rss)\n')
+
+    print(f'startup - sprite assets, best of {repeat}')
+    for name, load in variants.items():
+        results = [subprocess.run([sys.executable, '-c', measure.format(load=load)], capture_output=True,
+                                  text=True, check=True).stdout.split() for _ in range(repeat)]
+        load_time = min(float(result[0]) for result in results)
+        rss = min(int(result[1]) for result in results)
+        print(f'  {name:28s}  load: {load_time * 1000:8.2f} ms  RSS: +{rss / 1024:6.2f} MB')
+
+
+def bench_vehicles(repeat=5, frames=30):
+    # Time one frame of many cars with tile based collision - each car drives at random on the streets
+    import numpy as np
+    import settings
+    from main import SMach
+    from vehicles import Vehicles
+
+    game = SMach()
+    game.load_game()
+    collision, settings.COLLISION = settings.COLLISION, 'tiles'
+    rng = np.random.default_rng(0)
+    # Street tiles inside the area the cars are kept in
+    tile_y, tile_x = np.nonzero(game.map.walkable)
+    inside = ((tile_x >= game.sizex // 2) & (tile_x < game.map.mapsize_x - game.sizex // 2 - 1) &
+              (tile_y >= game.sizey // 2) & (tile_y < game.map.mapsize_y - game.sizey // 2 - 1))
+    tile_x, tile_y = tile_x[inside], tile_y[inside]
+
+    print(f'vehicles - {frames} frames, best of {repeat}')
+    for count in (1, 100, 1000, 10000, 100000):
+        step_time = float('inf')
+        for _ in range(repeat):
+            vehicles = Vehicles(game, count)
+            tiles = rng.integers(0, len(tile_x), count)
+            vehicles.x[:] = (tile_x[tiles] + 0.5) * game.sprite_size
+            vehicles.y[:] = (tile_y[tiles] + 0.5) * game.sprite_size
+            vehicles.direction[:] = rng.integers(0, 360, count)
+            vehicles.speed[:] = rng.integers(20, 101, count)
+            start = time.perf_counter()
+            for _ in range(frames):
+                vehicles.step()
+            step_time = min(step_time, (time.perf_counter() - start) / frames)
+        print(f'  {count:6d} cars  step: {step_time * 1000:8.3f} ms  {count / step_time:12.0f} cars/s  '
+              f'crashed: {np.count_nonzero(vehicles.damage)}')
+    settings.COLLISION = collision
+
+
+benchmarks = {
+    'load_sprites': bench_load_sprites,
+    'startup': bench_startup,
+    'vehicles': bench_vehicles,
+}
+
+
+if __name__ == "__main__":
+    pg.init()
+    for name in sys.argv[1:] or benchmarks:
+        benchmarks[name]()
@@ -0,0 +1,70 @@
+#
+# Author: Marco Alexander Reinke (DG1YIQ)
+# Date: December 2023
+# License: GNU GPL 3.0
+# Description: This is a simple clone of StreetMachine for the CPC 464
+#
+
+import pygame as pg
+import numpy as np
+
+
+class Collision:
+    def __init__(self, game):
+        self.game = game
+        self.size = game.sprites.size
+        # Solid pixels of each sprite - masks[sprite number] (index 0 is unused)
+        # Sprites the car may drive on have no solid pixels, in the others every opaque pixel is solid
+        # (transparent pixels show the grass, the car may drive there)
+        self.masks = [None] + self.create_tile_masks(game.sprites.sprites, game.map.info['allowed_sprites'])
+        # Sprite numbers with at least one solid pixel - tiles without are skipped
+        self.solid = [False] + [mask.count() > 0 for mask in self.masks[1:]]
+        # Masks of the car in map pixels and the offset of their top left corner to the center of the car
+        # keyed by direction in degrees - each direction is created only once
+        self.car_masks = {}
+
+    def create_tile_masks(self, sprites, allowed_sprites):
+        walkable_sprites = np.zeros(len(sprites) + 1, dtype=bool)
+        walkable_sprites[allowed_sprites] = True
+        solid = (sprites[..., 1] != 0) & ~walkable_sprites[1:, None, None]
+        # One 8 bit surface with all sprites below each other - 1 for solid pixels, 0 (colorkey) for the others
+        strip = pg.image.frombuffer(solid.astype(np.uint8), (self.size, self.size * len(sprites)), 'P')
+        strip.set_colorkey(0)
+        return [pg.mask.from_surface(strip.subsurface((0, i * self.size, self.size, self.size)))
+                for i in range(len(sprites))]
+
+    def get_car_mask(self, direction):
+        # Mask of the car rotated by direction in map pixels (cropped to the car) and the offset of its top left
+        # corner to the center of the car
+        direction %= 360
+        car_mask = self.car_masks.get(direction)
+        if car_mask is None:
+            # Rotate the unzoomed player sprite - the mask is the same in every render mode and zoom
+            mask = pg.mask.from_surface(pg.transform.rotate(self.game.player.map_sprite, direction))
+            rects = mask.get_bounding_rects()
+            if rects:
+                rect = rects[0].unionall(rects[1:])
+                cropped = pg.mask.Mask(rect.size)
+                cropped.draw(mask, (-rect.x, -rect.y))
+            else:
+                rect, cropped = pg.Rect(0, 0, 0, 0), mask
+            car_mask = (cropped, (rect.x - mask.get_size()[0] // 2, rect.y - mask.get_size()[1] // 2))
+            self.car_masks[direction] = car_mask
+        return car_mask
+
+    def collides(self, x, y, direction):
+        # True if a pixel of the car at map pixel position x, y (its center) rotated by direction touches a solid
+        # pixel of the map or the car is outside the map - only the tiles under the car are tested
+        mask, (offset_x, offset_y) = self.get_car_mask(direction)
+        left, top = int(x) + offset_x, int(y) + offset_y
+        width, height = mask.get_size()
+        map_data = self.game.map.map_data
+        for tile_y in range(top // self.size, (top + height - 1) // self.size + 1):
+            for tile_x in range(left // self.size, (left + width - 1) // self.size + 1):
+                if not (0 <= tile_x < self.game.map.mapsize_x and 0 <= tile_y < self.game.map.mapsize_y):
+                    return True
+                sprite_number = map_data[tile_y, tile_x]
+                if self.solid[sprite_number] and self.masks[sprite_number].overlap(
+                        mask, (left - tile_x * self.size, top - tile_y * self.size)):
+                    return True
+        return False
@@ -0,0 +1,54 @@
+#
+# Author: Marco Alexander Reinke (DG1YIQ)
+# Date: December 2023
+# License: GNU GPL 3.0
+# Description: This is a simple clone of StreetMachine for the CPC 464
+#
+
+import pygame as pg
+import settings
+
+
+class DirtyRects:
+    def __init__(self, game):
+        self.game = game
+        # Rects of the screen that changed in this frame and in the previous frame
+        # (the previous ones must be updated too, so the old content gets removed from the display)
+        self.rects = []
+        self.last_rects = []
+        # Background of the last frame (mode and camera position) - if it changes the whole screen is updated
+        self.background = None
+        self.full_update = True
+        # Counters of full and partial display updates
+        self.full_updates = 0
+        self.partial_updates = 0
+
+    def add(self, rect):
+        # Report a changed rect of the screen
+        self.rects.append(pg.Rect(rect))
+        return rect
+
+    def set_background(self, background):
+        # Report the background of this frame - any value that changes when the whole background changes
+        if background != self.background:
+            self.background = background
+            self.full_update = True
+
+    def invalidate(self):
+        # The whole screen changed
+        self.full_update = True
+
+    def update(self):
+        # Update the changed parts of the display
+        if self.game.renderer is not None:
+            # The texture renderer always presents the whole frame
+            self.game.renderer.present()
+        elif self.full_update or not settings.DIRTY_RECTS:
+            pg.display.flip()
+            self.full_updates += 1
+        else:
+            pg.display.update(self.last_rects + self.rects)
+            self.partial_updates += 1
+        self.last_rects = self.rects
+        self.rects = []
+        self.full_update = False
@@ -8,6 +8,8 @@ class Highscore:
         self.highscore = []
         self.highscore_max = 9
         self.highscore_file = "files/highscore.txt"
+        # Background image of the highscore screen
+        self.image = pg.image.load("files/highscore.png").convert()
         self.load_highscore()
 
     def load_highscore(self):
@@ -38,8 +40,7 @@ class Highscore:
                         text += event.unicode
 
             # Render the input box
-            image = pg.image.load("files/highscore.png")
-            self.game.screen.blit(image, (0, 0))
+            self.game.screen.blit(self.image, (0, 0))
             # Draw "Highscore" Text
             text1 = self.game.font_big.render(f'Highscore', True, (255, 255, 0))
             self.game.screen.blit(text1, (self.game.screen_width // 2 - 150, 50))
@@ -54,7 +55,8 @@ class Highscore:
             input_box.w = width
             self.game.screen.blit(txt_surface, (input_box.x + 5, input_box.y + 5))
 
-            pg.display.flip()
+            self.game.dirty.invalidate()
+            self.game.dirty.update()
 
         # Add the player to the highscore list
         self.highscore.append([text, score])
@@ -67,8 +69,9 @@ class Highscore:
 
     def draw(self):
         # Draw an Image "highscore.png" in the middle of the screen as background
-        image = pg.image.load("files/highscore.png")
-        self.game.screen.blit(image, (0, 0))
+        self.game.screen.blit(self.image, (0, 0))
+        # Nothing moves on the highscore screen - the display is updated only when it is shown first
+        self.game.dirty.set_background('highscore')
 
         # Calculate the time since the last frame
         self.game.delta_time = self.game.clock.tick(30)
@@ -92,5 +95,5 @@ class Highscore:
         text = self.game.font_small.render(f'Press Space to Start', True, (255, 255, 0))
         self.game.screen.blit(text, (self.game.screen_width // 2 - 150, self.game.screen_height - 50))
 
-        # Update the display
-        pg.display.flip()
\ No newline at end of file
+        # Update the changed parts of the display
+        self.game.dirty.update()
\ No newline at end of file
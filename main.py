@@ -7,18 +7,20 @@
 # Todo: geht noch nicht: python -m PyInstaller --add-data="files/highscore.png:files" main.py
 #
 
+from startupprofile import StartupProfile
 import settings as settings
 import pygame as pg
 import sys
 import os
-from map import *
-from sprites import *
-from player import *
 from highscore import *
+from dirtyrects import *
 
 
 class SMach:
     def __init__(self):
+        # Timing of the startup phases (see --startup-report)
+        self.profile = StartupProfile()
+        self.profile.phase('imports')
         pg.init()
         # Debug Mode
         self.debug = settings.DEBUG
@@ -36,24 +38,33 @@ class SMach:
         self.screen_width, self.screen_height = (self.sizex * self.sprite_size * self.zoom_factor,
                                                  self.sizey * self.sprite_size * self.zoom_factor)
         print(f"Display size: {self.screen_width} x {self.screen_height}")
-        self.screen = pg.display.set_mode((self.screen_width, self.screen_height))
+        if settings.RENDERER == 'texture':
+            # A SCALED display comes with an SDL renderer - the texture renderer draws with it
+            if settings.TEXTURE_RENDERER_SOFTWARE:
+                os.environ['SDL_RENDER_DRIVER'] = 'software'
+            self.screen = pg.display.set_mode((self.screen_width, self.screen_height), pg.SCALED)
+        else:
+            self.screen = pg.display.set_mode((self.screen_width, self.screen_height))
+        # Map and player are drawn on the canvas - either the screen itself (zoomed sprites) or a surface
+        # in CPC resolution that is scaled to the screen once per frame
+        if settings.NATIVE_RESOLUTION:
+            self.canvas = pg.Surface((self.sizex * self.sprite_size, self.sizey * self.sprite_size)).convert()
+            self.render_zoom = 1
+        else:
+            self.canvas = self.screen
+            self.render_zoom = self.zoom_factor
+        # Changed parts of the screen - only these are updated on the display
+        self.dirty = DirtyRects(self)
+        self.profile.phase('pygame init')
 
         # Your game clock
         self.clock = pg.time.Clock()
         self.delta_time = 1
 
-        # Players position in the world at start in pixel coordinates on the map
+        # Players position in the world at start in sprites on the map - position, direction, speed, damage and
+        # allowed area of the player are the ones of car 0 of the vehicles (see load_game)
         self.player_map_x = 44
         self.player_map_y = 99
-        self.player_x = self.player_map_x * self.sprite_size
-        self.player_y = self.player_map_y * self.sprite_size
-
-        # Player direction and speed
-        self.player_direction = 0
-        self.player_speed = 0
-
-        # Player is an allowed area (street or green area)
-        self.player_allowed = True
 
         # Activate Check if player is in allowed area
         self.check_allowed_area = True
@@ -62,28 +73,120 @@ class SMach:
         self.player_starttime = 0
         self.player_endtime = 0
         self.player_time_running = False
-
-        # Player Car Damage
-        self.player_damage = 0
+        # Split times of the checkpoints passed in this race keyed by checkpoint name
+        self.player_splits = {}
 
         # Player Time for Day, Night and Winter
         self.player_time_day = 0
         self.player_time_night = 0
         self.player_time_winter = 0
 
-        # Initialize the sprites
-        self.sprites = Sprites(self, size=self.sprite_size)
-        # Initialize the player
-        self.player = Player(self, size=self.sprite_size)
-        # Initialize the map
-        self.map = Map(self)
+        # Sprites, player, map, collision masks, vehicles and trigger zones are loaded after the highscore screen
+        # is shown (see load_game)
+        self.sprites = None
+        self.player = None
+        self.map = None
+        self.collision = None
+        self.vehicles = None
+        self.triggers = None
         # Initialize the highscore
         self.highscore = Highscore(self)
+        self.profile.phase('highscore load')
 
         # Font initialization
         self.font_small = pg.font.Font(None, 36)
         self.font_big = pg.font.Font(None, 100)
         self.font_normal = pg.font.Font(None, 55)
+        self.profile.phase('font load')
+
+        # Optional texture renderer - it draws map and player, the screen only holds HUD and highscore
+        self.renderer = None
+        if settings.RENDERER == 'texture':
+            from renderer import TextureRenderer
+            self.renderer = TextureRenderer(self)
+            self.screen = pg.Surface((self.screen_width, self.screen_height), pg.SRCALPHA)
+            self.profile.phase('renderer')
+
+    def load_game(self):
+        # Load everything the race needs - NumPy, sprite assets and map are not needed for the highscore screen
+        if self.map is not None:
+            return
+        from sprites import Sprites
+        from player import Player
+        from map import Map
+        from collision import Collision
+        from vehicles import Vehicles
+        from triggers import Triggers
+        self.profile.phase('game imports')
+        # Initialize the sprites
+        self.sprites = Sprites(self, size=self.sprite_size)
+        self.profile.phase('sprite build')
+        # Initialize the player
+        self.player = Player(self, size=self.sprite_size)
+        self.profile.phase('player')
+        # Initialize the map
+        self.map = Map(self)
+        self.profile.phase('map load')
+        # Pixel masks of the map and the car for the collision check
+        self.collision = Collision(self)
+        self.profile.phase('collision masks')
+        # State of all cars as arrays - the player is car 0
+        self.vehicles = Vehicles(self)
+        self.player_x = self.player_map_x * self.sprite_size
+        self.player_y = self.player_map_y * self.sprite_size
+        # Start and finish line and checkpoints of the track
+        self.triggers = Triggers(self)
+        self.profile.phase('triggers')
+
+        # How the sprite atlas of the map was created (a cold start builds it, a warm start loads it from disk)
+        atlas_time, source = self.sprites.atlas_stats[self.render_zoom]
+        self.profile.info['sprite atlas'] = f'x{self.render_zoom} {source} in {atlas_time * 1000:.2f} ms'
+        self.profile.finish()
+
+    # The player is car 0 of the vehicles
+    @property
+    def player_x(self):
+        return float(self.vehicles.x[0])
+
+    @player_x.setter
+    def player_x(self, x):
+        self.vehicles.x[0] = x
+
+    @property
+    def player_y(self):
+        return float(self.vehicles.y[0])
+
+    @player_y.setter
+    def player_y(self, y):
+        self.vehicles.y[0] = y
+
+    @property
+    def player_direction(self):
+        return int(self.vehicles.direction[0])
+
+    @player_direction.setter
+    def player_direction(self, direction):
+        self.vehicles.direction[0] = direction
+
+    @property
+    def player_speed(self):
+        return float(self.vehicles.speed[0])
+
+    @player_speed.setter
+    def player_speed(self, speed):
+        self.vehicles.speed[0] = speed
+
+    @property
+    def player_damage(self):
+        return float(self.vehicles.damage[0])
+
+    @player_damage.setter
+    def player_damage(self, damage):
+        self.vehicles.damage[0] = damage
+
+    @property
+    def player_allowed(self):
+        return bool(self.vehicles.allowed[0])
 
     def event_handler(self):
         # Handle events
@@ -107,6 +210,7 @@ class SMach:
         if keys[pg.K_SPACE] and self.mode == 'highscore':
             self.player_starttime = 0
             self.player_endtime = 0
+            self.player_splits = {}
             self.mode = 'day'
 
         if self.mode != 'highscore':
@@ -167,16 +271,31 @@ class SMach:
                     self.player_damage = 0
 
     def draw_game(self):
-        # Clear the screen fill with Background color
-        if self.mode == 'day':
-            self.screen.fill(settings.BG_COLOR_DAY)
-        elif self.mode == 'night':
-            self.screen.fill(settings.BG_COLOR_NIGHT)
-        elif self.mode == 'winter':
-            self.screen.fill(settings.BG_COLOR_WINTER)
-
-        # Draw the background
-        self.map.draw(self.player_x-(self.sizex//2), self.player_y-(self.sizey//2))
+        if self.renderer is not None:
+            # Draw the background and the player as textures
+            self.renderer.draw_map(self.player_x-(self.sizex//2), self.player_y-(self.sizey//2))
+            self.renderer.draw_player(self.player_direction)
+        else:
+            # Clear the canvas fill with Background color
+            if self.mode == 'day':
+                self.canvas.fill(settings.BG_COLOR_DAY)
+            elif self.mode == 'night':
+                self.canvas.fill(settings.BG_COLOR_NIGHT)
+            elif self.mode == 'winter':
+                self.canvas.fill(settings.BG_COLOR_WINTER)
+
+            # Draw the background
+            self.map.draw(self.player_x-(self.sizex//2), self.player_y-(self.sizey//2))
+
+            # Draw the player
+            player_rect = self.player.draw(self.player_direction)
+
+            if self.canvas is not self.screen:
+                # Scale the frame in CPC resolution to the screen (nearest neighbour - integer zoom stays exact)
+                pg.transform.scale(self.canvas, (self.screen_width, self.screen_height), self.screen)
+                player_rect = pg.Rect(player_rect.x * self.zoom_factor, player_rect.y * self.zoom_factor,
+                                      player_rect.w * self.zoom_factor, player_rect.h * self.zoom_factor)
+            self.dirty.add(player_rect)
 
         # Draw Debug
         if self.debug:
@@ -187,63 +306,43 @@ class SMach:
                                           f'dir:{self.player_direction:.1f} spd:{self.player_speed:.1f} '
                                           f'dmg: {self.player_damage}', True,
                                           (255, 0, 0))  # You can change the text and color here
-            self.screen.blit(text, (10, 10))  # Adjust the position of the text
+            self.dirty.add(self.screen.blit(text, (10, 10)))  # Adjust the position of the text
 
             text = self.font_small.render(f'Map x: {self.player_map_x} y:{self.player_map_y} - '
                                           f'Shitf x: {int(self.player_x % self.sprites.size - 8)} '
                                           f'y:{int(self.player_y % self.sprites.size - 8)} Pixel - '
                                           f'Alwd: {self.player_allowed} - ChkAlwd: {self.check_allowed_area}',
                                           True, (255, 0, 0))
-            self.screen.blit(text, (10, 40))
+            self.dirty.add(self.screen.blit(text, (10, 40)))
+
+            stats = self.map.get_cache_stats()
+            if stats:
+                text = self.font_small.render(stats, True, (255, 0, 0))
+                self.dirty.add(self.screen.blit(text, (10, 70)))
 
         # Draw the Timewatch
         text = self.font_small.render(f'{self.formattime(self.player_starttime, self.player_endtime)}',
                                       True, (255, 0, 0))
-        self.screen.blit(text, (10, self.screen_height-40))
+        self.dirty.add(self.screen.blit(text, (10, self.screen_height-40)))
+        # Split time of the last checkpoint
+        if self.player_splits:
+            name, split = next(reversed(self.player_splits.items()))
+            text = self.font_small.render(f'{name} {self.formattime(0, split)}', True, (255, 0, 0))
+            self.dirty.add(self.screen.blit(text, (200, self.screen_height - 40)))
 
         # Dram the Damage Level as yellow bar in an red rectangle - range 0-100
         text = self.font_small.render(f'Damage', True, (255, 0, 0))
-        self.screen.blit(text, (800, self.screen_height - 40))
+        self.dirty.add(self.screen.blit(text, (800, self.screen_height - 40)))
         pg.draw.rect(self.screen, (255, 255, 0), (910, self.screen_height-38, self.player_damage, 20))
-        pg.draw.rect(self.screen, (255, 0, 0), (910, self.screen_height - 38, 100, 20), 2)
-
-        # Draw the player
-        self.player.draw(self.player_direction)
+        self.dirty.add(pg.draw.rect(self.screen, (255, 0, 0), (910, self.screen_height - 38, 100, 20), 2))
 
-        # Update the display
-        pg.display.flip()
+        # Update the changed parts of the display (everything if the camera moved)
+        self.dirty.update()
 
         # Calculate the time since the last frame
         self.delta_time = self.clock.tick(30)
         pg.display.set_caption(f'Street Machine - {self.clock.get_fps():.1f} fps')
 
-    def calculate_new_position(self, x, y, speed, direction):
-        # calculate new postion for x and y out of speed and direction
-        # speed is divided by 10 to get a better feeling of speed
-        speed = speed / 10
-
-        # Calculating difference in x and y direction
-        dx = math.sin(math.radians(direction)) * speed
-        dy = math.cos(math.radians(direction)) * speed
-
-        # Calculating new position
-        x = x - dx
-        y = y - dy
-
-        # Check if player is out of bounds
-        # If so set player back to the border
-        if x > self.map.mapsize_x*self.sprite_size-(self.sizex//2*self.sprite_size)-self.sprite_size:
-            x = self.map.mapsize_x*self.sprite_size-(self.sizex//2*self.sprite_size)-self.sprite_size
-        if x < (self.sizex//2*self.sprite_size):
-            x = self.sizex//2*self.sprite_size
-        if y > self.map.mapsize_y*self.sprite_size-(self.sizey//2*self.sprite_size)-self.sprite_size:
-            y = self.map.mapsize_y*self.sprite_size-(self.sizey//2*self.sprite_size)-self.sprite_size
-        if y < (self.sizey//2*self.sprite_size):
-            y = self.sizey//2*self.sprite_size
-
-        # Return new position
-        return x, y
-
     def formattime(self, starttime, endtime):
         ticks = endtime - starttime
         millis = int(ticks) % 100
@@ -254,6 +353,10 @@ class SMach:
 
     # Game loop
     def mainloop(self):
+        # Show the highscore screen before everything else is loaded
+        self.highscore.draw()
+        self.profile.phase('first frame')
+        self.load_game()
         while True:
             # Handle events
             self.event_handler()
@@ -268,28 +371,29 @@ class SMach:
             if self.player_time_running:
                 self.player_endtime = ticks
 
-            # Calculate new player position
-            self.player_x, self.player_y = self.calculate_new_position(self.player_x,
-                                                                       self.player_y,
-                                                                       self.player_speed,
-                                                                       self.player_direction)
+            # Calculate new position of all cars
+            self.vehicles.move()
             # Calculate the players position on the map
             self.player_map_x = int(self.player_x // self.sprite_size)
             self.player_map_y = int(self.player_y // self.sprite_size)
 
+            # Trigger zone the player drives over (tiles and directions are defined in the map info)
+            zone = self.triggers.get(self.player_map_x, self.player_map_y, self.player_direction)
+            action = zone['action'] if zone is not None else None
+
             # Check if we drive over the start line
-            # y=97 and x is 42,43,44 and direction is between 0 +- 90 degree
-            if ((self.player_map_y == 97) and (self.player_map_x in [42, 43, 44]) and
-                    ((self.player_direction in range(0, 89)) or (self.player_direction in range(271, 360)))
-                    and not self.player_time_running):
+            if action == 'start' and not self.player_time_running:
                 self.player_time_running = True
                 self.player_starttime = ticks
                 self.player_endtime = ticks
+                self.player_splits = {}
+
+            # Check if we drive over a checkpoint - its split time is taken the first time
+            elif action == 'checkpoint' and self.player_time_running and zone['name'] not in self.player_splits:
+                self.player_splits[zone['name']] = ticks - self.player_starttime
 
             # Check if we are driving over the finish line
-            # x=46 and y is 100,101,102 and direction is between 90 +- 90 degree
-            if ((self.player_map_x == 46) and (self.player_map_y in [100, 101, 102]) and
-                    (self.player_direction in range(1, 179)) and self.player_time_running):
+            elif action == 'finish' and self.player_time_running:
                 self.player_time_running = False
                 self.player_endtime = ticks
                 self.player_x = 44 * self.sprite_size
@@ -314,28 +418,23 @@ class SMach:
                     self.mode = 'highscore'
 
             # Check if we are trying to drive over the finish line in the wrong direction
-            # x=46 and y is 100,101,102 and direction is between 270 +- 90 degree
-            if ((self.player_map_x == 46) and (self.player_map_y in [100, 101, 102]) and
-                    (self.player_direction in range(181, 359))):
+            elif action == 'wrong way':
                 self.player_x = 44 * self.sprite_size
                 self.player_y = 101 * self.sprite_size
                 self.player_speed = 0
 
-            # Check if Player is in allowed area
-            self.player_allowed = self.player.check_allowed_area(self.player_map_x, self.player_map_y)
-
-            # if player is not in allowed area set damag level and set speed to 0
-            if not self.player_allowed and self.check_allowed_area:
-                if self.player_speed > 20:
-                    self.player_damage += self.player_speed * 1.5
-                    # Car was too fast... crash...
-                    if self.player_damage > 100:
-                        self.player_damage = 100
-                        self.player_speed = 0
-                        # Todo - Car Repair
-                self.player_speed = 0
+            # Check if the cars are in an allowed area, if not set damage level and set speed to 0
+            # Todo - Car Repair
+            self.vehicles.collide()
+            self.vehicles.apply_damage()
 
 
 if __name__ == "__main__":
     game = SMach()
+    # --startup-report prints the startup phases, --startup-report=FILE writes them as JSON too
+    for arg in sys.argv[1:]:
+        name, _, path = arg.partition('=')
+        if name == '--startup-report':
+            game.profile.report = True
+            game.profile.path = path or None
     game.mainloop()
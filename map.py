@@ -7,140 +7,261 @@
 
 import pygame as pg
 import math
+import settings
+from collections import OrderedDict
+import numpy as np
+from assets import load_map, load_map_info
 
-#
-# Important Note:
-# In the original game image from CPC-Power there is the car sprite printed - these will be split up in 3 sprites,
-# because the car sprite is not centered in one sprite space on the map.
-# Therefor we have the sprites No. 120, 121, 122 that are three parts of the car - we do not need them.
-# We replace place in the map with sprite No 55 (grey street) - I did replace the occurrences of sprite 120, 121, 122
-# with sprite 55 in the map_data list below.
-#
-# Map Data 160 by 110 Sprites - all occurrences of sprite 120, 121, 122 are replaced with sprite 55 (grey street)
-map_data = [
-    [1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 2, 3, 3, 3, 4, 3, 3, 3, 3, 3, 3, 4, 3, 3, 3, 3, 5, 3, 4, 3, 6, 7, 6, 7, 6, 7, 6, 7, 6, 7, 3, 6, 7, 6, 7, 6, 7, 8, 7, 9, 9, 9, 9, 10, 11, 9, 9, 12, 13, 14, 9, 15, 16, 14, 9, 10, 11, 17, 3, 18, 11, 15, 14, 10, 11, 3, 9, 6, 7, 10, 11, 10, 11, 15, 14, 10, 11, 10, 11, 18, 11, 15, 14, 10, 11, 10, 11, 10, 11, 15, 15, 10, 11, 10, 11, 10, 11, 18, 11, 18, 11, 19, 20, 3, 9, 3, 12, 13, 3, 6, 7, 8, 7, 6, 21, 6, 7, 8, 21, 6, 7, 6, 21, 6, 7, 8, 21, 8, 1],
-    [1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 2, 3, 3, 3, 4, 3, 3, 3, 22, 3, 3, 4, 3, 22, 3, 3, 3, 3, 4, 3, 10, 11, 10, 11, 23, 24, 10, 11, 10, 11, 25, 10, 11, 10, 11, 15, 14, 23, 24, 9, 9, 9, 9, 6, 7, 9, 9, 9, 16, 14, 9, 14, 14, 15, 9, 6, 21, 3, 3, 8, 21, 14, 15, 6, 21, 3, 12, 13, 3, 6, 7, 6, 7, 14, 15, 6, 7, 6, 7, 6, 21, 14, 15, 6, 7, 6, 7, 6, 7, 14, 14, 6, 7, 6, 7, 8, 21, 6, 7, 6, 21, 3, 26, 3, 26, 27, 28, 29, 3, 3, 9, 9, 15, 9, 15, 9, 16, 9, 15, 16, 14, 9, 9, 9, 16, 16, 16, 15, 1],
-    [1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 2, 3, 3, 3, 4, 3, 3, 3, 3, 3, 3, 4, 5, 3, 3, 3, 30, 3, 4, 3, 6, 7, 6, 7, 25, 14, 6, 7, 6, 7, 3, 6, 7, 6, 7, 14, 15, 23, 24, 9, 3, 26, 19, 20, 25, 3, 17, 9, 9, 9, 9, 16, 9, 16, 9, 9, 17, 27, 28, 29, 3, 18, 11, 10, 11, 18, 11, 10, 11, 14, 15, 18, 11, 18, 11, 10, 11, 18, 11, 10, 11, 18, 11, 18, 11, 10, 11, 23, 24, 10, 11, 10, 11, 23, 11, 10, 11, 10, 11, 23, 24, 26, 19, 3, 3, 31, 32, 33, 3, 18, 11, 10, 11, 23, 24, 18, 11, 18, 11, 23, 11, 10, 11, 18, 11, 10, 11, 18, 1],
-    [1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 2, 3, 3, 3, 34, 35, 36, 37, 37, 37, 37, 25, 37, 37, 37, 37, 37, 37, 4, 9, 15, 14, 10, 11, 10, 11, 18, 11, 17, 3, 17, 14, 15, 10, 11, 18, 11, 10, 11, 3, 16, 17, 27, 28, 29, 9, 17, 14, 14, 16, 9, 14, 15, 9, 14, 17, 9, 31, 32, 33, 17, 6, 7, 8, 21, 6, 7, 23, 21, 15, 9, 6, 21, 6, 7, 8, 21, 23, 7, 6, 7, 8, 21, 6, 7, 6, 7, 15, 14, 6, 7, 6, 7, 8, 7, 6, 7, 6, 7, 8, 7, 26, 19, 20, 3, 3, 3, 3, 9, 6, 21, 8, 7, 14, 15, 8, 7, 6, 21, 23, 24, 8, 7, 6, 7, 8, 21, 8, 1],
-    [1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 2, 9, 10, 11, 38, 39, 40, 41, 41, 41, 41, 42, 3, 3, 3, 3, 3, 4, 25, 3, 23, 24, 6, 21, 6, 7, 8, 21, 3, 25, 16, 23, 24, 6, 7, 6, 7, 8, 7, 9, 25, 3, 31, 32, 33, 16, 3, 9, 9, 16, 9, 16, 14, 9, 9, 17, 3, 10, 11, 3, 3, 10, 11, 15, 14, 9, 27, 28, 29, 18, 11, 14, 15, 9, 3, 17, 3, 10, 11, 14, 15, 18, 11, 14, 14, 23, 11, 18, 11, 18, 11, 23, 24, 18, 11, 10, 11, 10, 24, 10, 11, 3, 27, 28, 29, 3, 3, 3, 3, 9, 16, 14, 14, 9, 14, 16, 14, 9, 15, 14, 15, 16, 9, 9, 15, 9, 16, 15, 43],
-    [43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 44, 17, 6, 7, 41, 41, 41, 41, 34, 35, 36, 42, 3, 3, 3, 3, 3, 4, 3, 9, 18, 11, 18, 11, 25, 15, 17, 3, 9, 17, 3, 18, 11, 10, 11, 15, 14, 10, 11, 12, 13, 3, 9, 25, 10, 11, 17, 16, 3, 14, 15, 9, 15, 16, 9, 9, 14, 6, 7, 14, 25, 8, 7, 23, 24, 3, 31, 32, 33, 8, 7, 23, 24, 17, 12, 13, 17, 6, 24, 23, 24, 6, 21, 15, 15, 8, 21, 6, 7, 8, 21, 14, 15, 23, 7, 8, 24, 6, 7, 8, 21, 17, 31, 32, 33, 16, 9, 3, 3, 14, 15, 18, 11, 23, 11, 18, 11, 23, 24, 15, 14, 10, 11, 14, 15, 10, 11, 10, 45],
-    [45, 45, 45, 45, 45, 45, 45, 45, 45, 45, 45, 25, 15, 23, 24, 14, 15, 9, 17, 14, 16, 17, 9, 16, 23, 24, 15, 14, 9, 17, 16, 25, 16, 9, 46, 41, 41, 41, 41, 38, 47, 40, 42, 3, 3, 5, 3, 3, 4, 9, 14, 6, 7, 8, 21, 23, 24, 12, 13, 25, 9, 17, 8, 21, 6, 7, 23, 24, 6, 7, 12, 13, 9, 25, 16, 6, 7, 15, 9, 15, 14, 16, 14, 9, 9, 17, 16, 23, 24, 14, 15, 16, 17, 9, 14, 15, 12, 13, 14, 15, 23, 24, 15, 14, 16, 17, 9, 25, 9, 16, 14, 15, 23, 24, 16, 25, 17, 9, 16, 9, 18, 11, 16, 15, 16, 14, 15, 16, 9, 14, 15, 9, 3, 3, 12, 13, 12, 13, 14, 15, 23, 24, 6, 21, 6, 21, 8, 21, 23, 24, 15, 14, 6, 21, 23, 24, 8, 21, 6, 48],
-    [48, 48, 48, 48, 48, 48, 48, 48, 48, 48, 48, 46, 49, 50, 51, 51, 51, 51, 51, 51, 51, 51, 51, 51, 51, 51, 51, 51, 51, 51, 51, 52, 53, 17, 3, 41, 41, 41, 41, 41, 41, 41, 42, 3, 3, 3, 3, 3, 4, 49, 50, 51, 51, 51, 51, 51, 51, 51, 51, 51, 51, 51, 51, 51, 51, 51, 51, 51, 51, 51, 51, 51, 51, 51, 51, 51, 51, 51, 52, 53, 16, 9, 15, 12, 19, 54, 3, 3, 3, 12, 13, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 19, 20, 3, 49, 50, 51, 51, 55, 55, 55, 55, 55, 55, 55, 55, 55, 52, 53, 16, 6, 7, 15, 49, 50, 51, 51, 51, 51, 51, 52, 53, 14, 3, 12, 13, 3, 49, 50, 51, 51, 51, 51, 51, 51, 51, 51, 52, 53, 9, 15, 16, 9, 16, 15, 9, 14, 9, 15, 48],
-    [48, 48, 48, 48, 48, 48, 48, 48, 48, 48, 48, 46, 56, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 57, 42, 3, 3, 3, 41, 41, 41, 41, 41, 42, 3, 3, 3, 3, 3, 4, 56, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 57, 9, 15, 15, 14, 9, 3, 3, 16, 3, 3, 3, 3, 3, 12, 13, 16, 3, 3, 3, 16, 3, 3, 3, 3, 56, 55, 55, 55, 58, 58, 58, 58, 58, 58, 58, 58, 55, 55, 57, 14, 15, 14, 9, 56, 55, 55, 55, 55, 55, 55, 55, 57, 15, 3, 3, 3, 9, 56, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 57, 9, 14, 10, 11, 17, 23, 11, 14, 23, 24, 48],
-    [48, 48, 48, 48, 48, 48, 48, 48, 48, 48, 48, 46, 59, 55, 55, 60, 61, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 62, 63, 55, 55, 64, 42, 3, 3, 41, 41, 41, 41, 41, 41, 42, 3, 3, 3, 22, 3, 4, 59, 55, 60, 10, 11, 14, 23, 24, 9, 25, 9, 9, 9, 17, 17, 14, 10, 11, 25, 9, 14, 9, 15, 14, 15, 14, 16, 15, 63, 55, 64, 14, 16, 9, 9, 16, 17, 3, 3, 3, 16, 9, 23, 24, 9, 17, 14, 15, 25, 3, 9, 3, 14, 15, 9, 59, 55, 55, 60, 9, 16, 25, 3, 23, 24, 17, 16, 63, 55, 55, 16, 14, 15, 16, 59, 55, 55, 58, 58, 58, 55, 55, 64, 23, 11, 10, 11, 16, 59, 55, 55, 58, 58, 58, 58, 58, 55, 55, 55, 64, 15, 9, 8, 21, 17, 8, 21, 9, 15, 14, 48],
-    [48, 48, 48, 48, 48, 48, 48, 48, 48, 48, 48, 46, 59, 55, 64, 10, 11, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 2, 3, 59, 55, 64, 42, 3, 41, 41, 41, 41, 41, 41, 41, 25, 65, 65, 65, 3, 3, 4, 59, 55, 17, 6, 7, 15, 10, 11, 9, 9, 15, 10, 11, 9, 23, 24, 6, 7, 17, 9, 16, 15, 16, 15, 16, 16, 15, 9, 17, 55, 64, 15, 14, 16, 9, 9, 3, 3, 3, 3, 3, 3, 3, 3, 3, 19, 54, 3, 3, 26, 3, 19, 54, 3, 3, 59, 55, 55, 66, 3, 17, 9, 9, 16, 3, 3, 3, 3, 55, 55, 15, 18, 11, 14, 59, 55, 60, 14, 14, 16, 63, 55, 55, 15, 14, 6, 7, 16, 59, 55, 60, 26, 19, 54, 12, 13, 63, 55, 55, 64, 9, 14, 23, 24, 15, 10, 11, 15, 14, 15, 48],
-    [48, 48, 48, 48, 48, 48, 48, 48, 48, 48, 48, 46, 59, 55, 64, 6, 7, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 2, 3, 59, 55, 64, 42, 3, 41, 34, 35, 36, 41, 41, 41, 41, 41, 41, 67, 37, 37, 4, 59, 55, 66, 25, 17, 9, 6, 7, 14, 17, 25, 6, 7, 14, 17, 15, 14, 9, 15, 25, 14, 14, 14, 15, 16, 9, 16, 9, 68, 55, 64, 9, 14, 15, 14, 10, 11, 3, 16, 12, 13, 3, 3, 16, 3, 3, 3, 12, 13, 3, 3, 3, 3, 16, 3, 69, 55, 55, 55, 52, 53, 23, 24, 10, 11, 15, 23, 24, 55, 55, 16, 6, 21, 9, 59, 55, 15, 9, 16, 16, 9, 55, 55, 10, 11, 23, 24, 9, 59, 55, 9, 14, 15, 16, 9, 16, 17, 59, 55, 55, 15, 16, 15, 14, 14, 6, 24, 9, 15, 14, 48],
-    [48, 48, 48, 48, 48, 48, 48, 48, 48, 48, 48, 46, 59, 55, 64, 9, 2, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 2, 3, 59, 55, 64, 42, 3, 41, 38, 39, 40, 41, 41, 41, 41, 41, 41, 41, 41, 41, 41, 59, 55, 55, 51, 51, 51, 51, 51, 51, 51, 51, 51, 51, 51, 51, 51, 52, 53, 12, 13, 9, 15, 16, 9, 15, 49, 50, 51, 55, 55, 70, 15, 9, 16, 9, 6, 7, 3, 3, 3, 3, 3, 3, 3, 3, 3, 12, 13, 3, 3, 12, 13, 3, 3, 3, 71, 72, 55, 55, 55, 57, 14, 15, 6, 7, 14, 15, 9, 55, 55, 66, 9, 15, 68, 55, 55, 16, 9, 14, 16, 15, 55, 55, 6, 7, 14, 15, 9, 59, 55, 14, 15, 15, 10, 11, 15, 14, 59, 55, 55, 16, 14, 23, 24, 14, 15, 15, 14, 10, 11, 48],
-    [48, 48, 48, 48, 48, 48, 48, 48, 48, 48, 48, 46, 59, 55, 55, 66, 73, 43, 43, 43, 25, 1, 1, 1, 1, 43, 43, 43, 44, 68, 55, 55, 64, 25, 74, 74, 74, 74, 74, 74, 74, 74, 74, 74, 74, 17, 41, 74, 25, 69, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 57, 25, 9, 14, 16, 15, 15, 14, 56, 55, 55, 55, 75, 76, 16, 9, 9, 14, 17, 27, 28, 29, 12, 13, 16, 15, 16, 9, 16, 16, 9, 10, 11, 16, 17, 9, 16, 23, 24, 10, 11, 63, 55, 64, 18, 11, 15, 9, 18, 11, 16, 69, 55, 55, 51, 51, 55, 55, 70, 15, 15, 9, 15, 15, 55, 55, 15, 14, 23, 24, 16, 59, 55, 16, 23, 24, 23, 21, 16, 17, 59, 55, 55, 15, 15, 14, 15, 15, 23, 24, 16, 8, 21, 48],
-    [48, 48, 48, 48, 48, 48, 48, 48, 48, 48, 48, 25, 59, 55, 55, 55, 51, 51, 51, 52, 53, 1, 1, 1, 1, 49, 50, 51, 51, 55, 55, 55, 64, 42, 3, 9, 3, 9, 77, 78, 3, 3, 3, 3, 9, 3, 41, 3, 46, 71, 72, 58, 58, 58, 58, 58, 58, 58, 58, 58, 58, 58, 58, 55, 55, 55, 64, 9, 9, 14, 15, 9, 16, 15, 59, 55, 60, 3, 9, 3, 10, 11, 12, 9, 16, 31, 32, 33, 16, 3, 12, 15, 16, 14, 23, 24, 3, 6, 7, 15, 16, 14, 9, 17, 3, 6, 7, 17, 55, 64, 6, 7, 17, 14, 6, 21, 16, 71, 72, 55, 55, 55, 55, 75, 76, 16, 16, 9, 16, 14, 55, 55, 23, 24, 14, 15, 9, 59, 55, 14, 18, 11, 10, 11, 15, 14, 59, 55, 55, 14, 9, 23, 24, 17, 18, 11, 15, 14, 15, 65],
-    [65, 65, 65, 65, 3, 41, 3, 65, 65, 65, 10, 11, 69, 55, 55, 55, 55, 55, 55, 55, 57, 1, 1, 1, 1, 56, 55, 55, 55, 55, 55, 55, 70, 42, 17, 3, 3, 9, 79, 80, 3, 3, 3, 3, 3, 3, 41, 17, 3, 45, 45, 45, 25, 9, 3, 9, 3, 3, 16, 16, 3, 10, 11, 63, 55, 55, 64, 25, 15, 17, 14, 9, 9, 14, 59, 55, 17, 10, 11, 16, 6, 7, 14, 3, 16, 9, 15, 49, 50, 51, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 52, 53, 14, 15, 14, 55, 64, 15, 14, 10, 11, 23, 24, 27, 28, 29, 12, 13, 9, 9, 15, 9, 15, 14, 15, 23, 24, 55, 55, 10, 11, 10, 11, 9, 59, 55, 16, 8, 7, 8, 21, 9, 17, 59, 55, 55, 9, 9, 15, 14, 14, 8, 7, 14, 23, 24, 3],
-    [3, 3, 3, 3, 3, 41, 3, 3, 3, 3, 6, 7, 71, 72, 58, 58, 58, 55, 55, 55, 64, 1, 1, 1, 1, 59, 55, 55, 55, 55, 58, 75, 76, 25, 65, 65, 65, 65, 65, 65, 65, 65, 65, 65, 25, 42, 41, 3, 3, 3, 3, 3, 46, 3, 3, 16, 10, 11, 9, 3, 3, 6, 7, 16, 55, 55, 64, 9, 14, 9, 16, 25, 9, 15, 59, 55, 12, 6, 7, 15, 10, 11, 16, 14, 14, 9, 14, 56, 55, 55, 58, 58, 58, 58, 58, 58, 58, 58, 58, 58, 58, 58, 55, 55, 57, 23, 24, 3, 55, 64, 23, 24, 6, 21, 14, 15, 31, 32, 33, 9, 15, 14, 15, 14, 16, 15, 15, 14, 14, 15, 55, 55, 6, 7, 6, 7, 16, 59, 55, 14, 10, 11, 14, 24, 14, 14, 59, 55, 55, 16, 15, 23, 24, 17, 15, 14, 16, 10, 11, 37],
-    [37, 37, 37, 37, 37, 41, 37, 37, 37, 37, 37, 37, 37, 37, 37, 37, 25, 63, 55, 55, 55, 1, 1, 1, 1, 55, 55, 55, 60, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 62, 42, 41, 3, 3, 3, 3, 3, 46, 3, 3, 3, 6, 7, 3, 3, 3, 3, 3, 68, 55, 55, 64, 15, 15, 9, 9, 14, 9, 9, 59, 55, 66, 17, 9, 16, 6, 7, 15, 9, 25, 10, 11, 59, 55, 60, 3, 26, 9, 12, 13, 12, 13, 17, 10, 11, 12, 13, 63, 55, 55, 10, 11, 25, 55, 64, 18, 11, 14, 15, 18, 24, 16, 49, 50, 51, 51, 51, 51, 51, 51, 52, 53, 14, 15, 16, 59, 55, 66, 9, 16, 9, 68, 55, 64, 16, 8, 7, 23, 21, 16, 14, 59, 55, 55, 15, 9, 14, 15, 15, 15, 14, 9, 8, 21, 48],
-    [48, 48, 48, 48, 48, 48, 48, 48, 48, 48, 48, 48, 48, 48, 48, 48, 4, 9, 55, 55, 55, 1, 1, 1, 1, 55, 55, 64, 2, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 2, 42, 34, 81, 35, 81, 36, 3, 46, 49, 50, 51, 51, 51, 51, 51, 51, 51, 51, 55, 55, 55, 64, 9, 10, 11, 9, 9, 17, 9, 69, 55, 55, 52, 53, 15, 10, 11, 16, 15, 16, 6, 7, 59, 55, 3, 26, 3, 3, 17, 9, 17, 25, 3, 6, 7, 3, 9, 3, 59, 55, 6, 7, 9, 55, 64, 6, 7, 23, 24, 6, 7, 3, 56, 55, 55, 55, 55, 55, 55, 55, 55, 57, 16, 16, 15, 69, 55, 55, 55, 55, 55, 55, 55, 70, 15, 14, 15, 10, 11, 14, 15, 59, 55, 55, 9, 14, 18, 11, 14, 10, 11, 15, 14, 15, 48],
-    [48, 48, 48, 48, 48, 48, 48, 48, 48, 48, 48, 48, 48, 48, 48, 48, 4, 3, 55, 55, 55, 1, 1, 1, 1, 55, 55, 64, 2, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 2, 42, 38, 39, 47, 39, 40, 3, 46, 56, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 70, 9, 6, 7, 14, 15, 10, 11, 71, 72, 55, 55, 57, 17, 6, 7, 9, 17, 14, 9, 3, 59, 55, 9, 17, 3, 12, 13, 3, 9, 17, 3, 25, 9, 25, 17, 68, 55, 55, 10, 11, 3, 55, 64, 16, 25, 15, 17, 17, 15, 14, 59, 55, 55, 55, 55, 55, 55, 55, 55, 64, 15, 15, 14, 71, 72, 58, 58, 58, 58, 58, 75, 76, 9, 23, 24, 8, 7, 16, 17, 59, 55, 55, 9, 16, 6, 21, 17, 8, 7, 14, 23, 24, 48],
-    [48, 48, 48, 48, 48, 48, 48, 48, 48, 48, 48, 48, 48, 48, 48, 48, 4, 17, 55, 55, 55, 61, 43, 43, 43, 55, 55, 64, 2, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 2, 42, 82, 83, 41, 41, 41, 41, 41, 59, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 58, 75, 76, 14, 9, 15, 9, 17, 6, 7, 9, 25, 63, 55, 64, 84, 9, 17, 14, 15, 3, 25, 17, 59, 55, 3, 3, 19, 20, 12, 13, 49, 50, 51, 51, 51, 51, 51, 55, 55, 70, 6, 7, 25, 55, 64, 12, 13, 17, 23, 24, 16, 15, 55, 55, 55, 60, 9, 16, 63, 55, 55, 64, 9, 14, 15, 23, 11, 18, 24, 15, 14, 18, 11, 23, 24, 27, 28, 29, 12, 13, 17, 59, 55, 55, 15, 15, 15, 23, 24, 14, 15, 14, 10, 11, 48],
-    [48, 48, 48, 48, 48, 48, 48, 48, 48, 48, 48, 48, 48, 48, 48, 48, 4, 3, 55, 55, 55, 2, 85, 55, 85, 55, 55, 55, 41, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 2, 42, 3, 41, 41, 25, 45, 45, 25, 55, 55, 55, 60, 9, 16, 15, 16, 9, 15, 14, 16, 9, 15, 9, 14, 9, 9, 12, 13, 3, 12, 13, 9, 55, 64, 86, 17, 77, 87, 87, 87, 87, 88, 59, 55, 89, 87, 78, 9, 10, 11, 56, 55, 55, 55, 55, 55, 55, 55, 75, 76, 25, 9, 3, 55, 64, 17, 9, 9, 16, 14, 17, 14, 55, 55, 64, 16, 16, 23, 24, 59, 55, 55, 66, 16, 15, 6, 21, 8, 7, 23, 24, 8, 7, 14, 15, 31, 32, 33, 7, 16, 68, 55, 55, 55, 23, 24, 14, 15, 14, 15, 23, 24, 8, 7, 48],
-    [48, 48, 48, 48, 48, 48, 48, 48, 48, 48, 48, 48, 48, 48, 48, 48, 4, 3, 55, 55, 55, 2, 85, 55, 85, 55, 55, 55, 66, 25, 43, 43, 43, 43, 44, 3, 3, 43, 43, 43, 43, 43, 43, 43, 44, 25, 65, 65, 65, 25, 3, 3, 16, 55, 55, 64, 9, 15, 9, 15, 14, 9, 27, 28, 29, 15, 16, 15, 16, 16, 9, 12, 13, 3, 27, 28, 29, 55, 64, 3, 3, 87, 87, 87, 87, 87, 88, 59, 55, 89, 87, 87, 9, 6, 7, 59, 55, 60, 9, 3, 10, 11, 25, 9, 3, 3, 12, 25, 55, 64, 10, 24, 17, 14, 14, 17, 17, 55, 55, 64, 9, 14, 16, 16, 59, 55, 55, 55, 51, 51, 51, 51, 51, 51, 51, 51, 51, 51, 51, 51, 51, 51, 51, 51, 51, 55, 55, 55, 64, 14, 14, 18, 11, 17, 18, 11, 23, 24, 14, 48],
-    [48, 48, 48, 48, 48, 48, 48, 48, 48, 48, 48, 48, 48, 48, 48, 48, 4, 25, 55, 55, 55, 2, 85, 55, 85, 59, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 51, 52, 53, 62, 3, 46, 55, 55, 64, 14, 9, 16, 9, 9, 14, 31, 32, 33, 14, 9, 14, 15, 19, 54, 26, 3, 3, 31, 32, 33, 55, 64, 17, 77, 87, 87, 17, 9, 17, 17, 59, 55, 25, 87, 87, 3, 3, 9, 59, 55, 17, 25, 14, 6, 7, 9, 27, 28, 29, 25, 3, 55, 64, 6, 7, 23, 24, 17, 15, 15, 55, 55, 64, 23, 24, 15, 14, 69, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 70, 23, 24, 6, 21, 17, 8, 7, 9, 14, 15, 48],
-    [48, 48, 48, 48, 48, 48, 48, 48, 48, 48, 48, 48, 48, 48, 48, 48, 4, 3, 55, 55, 55, 2, 85, 55, 85, 69, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 57, 2, 9, 46, 55, 55, 55, 66, 9, 15, 14, 16, 15, 3, 3, 3, 9, 16, 16, 9, 15, 3, 3, 3, 77, 90, 91, 88, 55, 64, 89, 87, 87, 80, 3, 17, 3, 9, 59, 55, 17, 87, 87, 17, 9, 3, 59, 55, 66, 17, 9, 25, 9, 17, 31, 32, 33, 9, 68, 55, 64, 9, 17, 17, 15, 17, 17, 17, 55, 55, 64, 16, 16, 9, 9, 71, 72, 58, 58, 58, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 58, 75, 76, 9, 3, 27, 28, 29, 3, 12, 13, 16, 3, 48],
-    [48, 48, 48, 48, 48, 48, 48, 48, 48, 48, 48, 48, 48, 48, 48, 48, 4, 9, 55, 55, 55, 2, 34, 81, 36, 71, 72, 58, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 64, 2, 3, 46, 59, 55, 55, 55, 51, 51, 51, 51, 51, 51, 51, 52, 53, 15, 9, 14, 9, 9, 15, 16, 87, 87, 87, 88, 55, 64, 89, 87, 80, 9, 25, 17, 9, 25, 59, 55, 14, 87, 87, 9, 3, 25, 69, 55, 55, 51, 51, 51, 51, 51, 51, 51, 51, 51, 55, 55, 70, 3, 14, 17, 14, 14, 17, 15, 55, 55, 64, 15, 16, 15, 15, 23, 24, 16, 15, 15, 9, 15, 16, 3, 92, 3, 3, 3, 3, 3, 92, 3, 3, 3, 92, 92, 3, 3, 9, 3, 15, 3, 31, 32, 33, 3, 3, 12, 13, 3, 48],
-    [48, 48, 48, 48, 48, 48, 48, 48, 48, 48, 48, 48, 48, 48, 93, 48, 3, 3, 55, 55, 55, 2, 38, 39, 40, 16, 12, 13, 9, 65, 65, 25, 9, 17, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 34, 36, 63, 55, 55, 64, 16, 3, 46, 69, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 57, 16, 16, 14, 15, 14, 9, 77, 87, 87, 87, 88, 55, 64, 89, 80, 3, 17, 3, 17, 9, 3, 59, 55, 17, 87, 87, 3, 9, 3, 71, 72, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 58, 75, 76, 17, 17, 14, 9, 14, 23, 24, 55, 55, 64, 14, 15, 9, 16, 16, 16, 15, 16, 14, 9, 14, 15, 3, 3, 94, 92, 92, 3, 94, 94, 92, 3, 94, 92, 94, 94, 94, 92, 94, 3, 16, 3, 3, 3, 3, 3, 3, 12, 13, 43],
-    [43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 44, 95, 55, 55, 85, 95, 85, 85, 85, 85, 85, 4, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 38, 40, 95, 55, 55, 64, 95, 3, 96, 71, 72, 58, 58, 58, 58, 58, 58, 58, 55, 55, 55, 64, 15, 9, 9, 77, 87, 87, 87, 87, 87, 80, 25, 55, 64, 9, 97, 9, 17, 9, 3, 96, 3, 59, 55, 9, 87, 87, 25, 3, 9, 94, 73, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 44, 96, 55, 55, 64, 9, 14, 97, 3, 9, 15, 23, 24, 96, 3, 49, 50, 51, 51, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 52, 53, 92, 94, 9, 9, 12, 13, 3, 3, 12, 13, 9, 98],
-    [98, 98, 98, 98, 98, 98, 98, 98, 98, 98, 98, 98, 98, 98, 98, 98, 98, 98, 99, 99, 99, 98, 98, 98, 98, 98, 98, 98, 98, 98, 98, 98, 98, 98, 98, 98, 98, 98, 98, 98, 98, 98, 98, 98, 98, 98, 98, 99, 99, 99, 98, 98, 100, 94, 9, 16, 9, 15, 17, 9, 14, 9, 63, 55, 55, 55, 16, 15, 77, 87, 87, 87, 87, 87, 80, 17, 16, 55, 64, 25, 101, 98, 98, 98, 98, 100, 92, 59, 55, 15, 87, 87, 78, 25, 92, 101, 98, 98, 98, 98, 98, 98, 98, 98, 98, 98, 98, 98, 98, 98, 98, 98, 98, 98, 98, 98, 100, 55, 55, 55, 66, 94, 101, 98, 98, 98, 98, 98, 100, 92, 56, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 57, 94, 92, 9, 23, 24, 9, 3, 12, 13, 9, 9, 43],
-    [43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 62, 95, 55, 55, 55, 95, 25, 61, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 62, 95, 55, 55, 64, 95, 3, 102, 94, 92, 94, 3, 92, 94, 77, 87, 87, 88, 55, 55, 55, 89, 87, 87, 87, 80, 10, 11, 3, 25, 3, 9, 55, 64, 3, 103, 9, 9, 3, 17, 102, 68, 55, 64, 25, 87, 87, 87, 87, 78, 103, 61, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 27, 28, 29, 12, 13, 43, 43, 43, 62, 102, 55, 55, 55, 55, 51, 51, 51, 52, 53, 3, 92, 102, 94, 59, 55, 55, 55, 58, 58, 58, 58, 58, 58, 104, 105, 106, 58, 58, 55, 55, 55, 92, 94, 3, 9, 16, 15, 9, 9, 9, 9, 9, 48],
-    [48, 48, 48, 48, 48, 48, 48, 48, 48, 48, 48, 48, 48, 48, 48, 48, 4, 9, 85, 55, 55, 2, 9, 2, 49, 50, 51, 51, 51, 51, 51, 51, 52, 53, 2, 48, 93, 48, 48, 48, 48, 48, 48, 48, 48, 2, 3, 55, 55, 64, 2, 9, 3, 77, 87, 87, 87, 87, 87, 87, 87, 87, 88, 55, 55, 55, 89, 87, 87, 80, 17, 6, 7, 17, 9, 16, 25, 55, 64, 9, 102, 49, 50, 51, 51, 51, 55, 55, 70, 9, 79, 87, 87, 87, 87, 25, 3, 3, 3, 17, 9, 3, 17, 9, 3, 17, 16, 31, 32, 33, 9, 9, 3, 16, 3, 9, 16, 69, 55, 55, 55, 55, 55, 55, 55, 57, 16, 9, 94, 94, 59, 55, 55, 60, 94, 107, 94, 43, 43, 43, 43, 43, 43, 43, 9, 63, 55, 55, 92, 92, 3, 15, 9, 9, 16, 16, 9, 9, 9, 48],
-    [48, 48, 48, 48, 48, 48, 48, 48, 48, 48, 48, 48, 48, 48, 48, 48, 4, 3, 55, 55, 55, 2, 9, 2, 56, 55, 55, 55, 55, 55, 55, 55, 55, 57, 2, 48, 48, 48, 48, 48, 48, 48, 48, 48, 48, 2, 3, 55, 55, 64, 2, 3, 3, 87, 87, 87, 87, 87, 87, 87, 87, 80, 9, 59, 55, 55, 16, 3, 17, 3, 16, 17, 3, 16, 17, 17, 3, 59, 55, 66, 68, 55, 55, 55, 55, 55, 58, 75, 76, 9, 17, 3, 79, 87, 87, 16, 3, 17, 3, 3, 3, 25, 3, 9, 9, 3, 9, 16, 16, 16, 3, 16, 16, 23, 11, 16, 3, 71, 72, 55, 55, 55, 55, 55, 55, 64, 9, 9, 3, 92, 59, 55, 55, 2, 108, 109, 110, 111, 94, 92, 94, 92, 92, 94, 94, 2, 55, 55, 92, 92, 92, 16, 9, 9, 16, 23, 24, 16, 9, 48],
-    [48, 48, 48, 48, 48, 48, 48, 48, 48, 48, 48, 48, 48, 48, 48, 48, 4, 9, 55, 55, 55, 2, 25, 2, 59, 55, 55, 55, 58, 58, 55, 55, 55, 64, 2, 48, 48, 48, 48, 48, 48, 48, 48, 48, 48, 2, 3, 55, 55, 64, 16, 3, 16, 87, 87, 80, 3, 3, 3, 9, 3, 3, 3, 59, 55, 55, 3, 15, 14, 3, 16, 9, 25, 9, 3, 16, 17, 59, 55, 55, 55, 55, 55, 60, 25, 9, 10, 11, 17, 25, 9, 9, 9, 87, 87, 3, 3, 9, 3, 25, 3, 3, 3, 49, 50, 55, 55, 55, 55, 55, 51, 52, 53, 15, 14, 10, 11, 14, 15, 14, 15, 3, 63, 55, 55, 55, 23, 24, 3, 94, 59, 55, 55, 2, 112, 109, 109, 109, 109, 107, 94, 111, 107, 108, 113, 2, 55, 55, 94, 92, 3, 3, 9, 14, 9, 9, 9, 9, 15, 48],
-    [48, 48, 48, 48, 48, 48, 48, 48, 48, 48, 48, 48, 48, 48, 48, 48, 4, 3, 55, 55, 55, 2, 9, 2, 55, 55, 55, 60, 9, 17, 63, 55, 55, 64, 2, 48, 48, 48, 48, 48, 48, 48, 48, 48, 48, 2, 3, 55, 55, 64, 2, 3, 3, 87, 87, 25, 3, 3, 3, 3, 3, 3, 3, 59, 55, 55, 66, 3, 9, 16, 3, 3, 3, 3, 17, 9, 17, 69, 55, 55, 55, 55, 70, 9, 17, 16, 6, 7, 3, 9, 15, 16, 9, 87, 87, 3, 17, 3, 16, 3, 16, 17, 16, 56, 55, 55, 58, 58, 58, 58, 55, 55, 57, 10, 11, 6, 7, 14, 23, 24, 14, 16, 3, 59, 55, 55, 9, 3, 92, 3, 59, 55, 55, 2, 94, 114, 109, 109, 109, 109, 109, 109, 115, 109, 110, 2, 55, 55, 92, 92, 92, 3, 3, 23, 24, 16, 9, 9, 9, 74],
-    [74, 74, 74, 74, 74, 74, 74, 74, 74, 74, 74, 74, 74, 74, 74, 74, 25, 68, 55, 55, 55, 2, 9, 2, 55, 55, 64, 61, 43, 43, 62, 55, 55, 64, 2, 48, 48, 48, 48, 48, 48, 48, 48, 48, 48, 2, 3, 55, 55, 64, 2, 3, 3, 87, 87, 78, 3, 3, 3, 3, 3, 3, 9, 59, 55, 55, 55, 52, 53, 3, 9, 3, 17, 16, 17, 3, 16, 71, 72, 58, 58, 75, 76, 15, 9, 9, 9, 25, 17, 3, 9, 23, 24, 87, 87, 10, 11, 10, 11, 18, 11, 23, 24, 55, 55, 60, 9, 16, 9, 9, 63, 55, 64, 6, 7, 14, 15, 10, 11, 18, 11, 3, 9, 59, 55, 55, 16, 15, 3, 94, 59, 55, 55, 2, 92, 112, 109, 109, 109, 115, 109, 109, 109, 109, 107, 92, 55, 55, 94, 92, 3, 3, 3, 3, 3, 9, 14, 16, 9, 43],
-    [43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 62, 49, 50, 51, 55, 55, 55, 55, 64, 2, 25, 2, 55, 55, 64, 2, 1, 1, 2, 55, 55, 64, 2, 48, 48, 48, 48, 48, 48, 48, 48, 48, 48, 2, 3, 55, 55, 64, 2, 3, 16, 79, 87, 87, 87, 78, 3, 9, 3, 3, 3, 69, 55, 55, 55, 55, 57, 3, 17, 25, 14, 9, 17, 25, 9, 17, 9, 10, 11, 15, 16, 17, 25, 9, 3, 9, 3, 9, 16, 16, 16, 87, 87, 8, 24, 6, 21, 6, 7, 14, 15, 55, 64, 9, 23, 24, 16, 16, 3, 55, 64, 16, 9, 23, 24, 6, 7, 6, 21, 9, 16, 59, 55, 55, 14, 3, 94, 92, 59, 55, 55, 2, 108, 116, 109, 109, 109, 109, 109, 109, 109, 109, 109, 110, 55, 55, 92, 92, 3, 3, 16, 3, 15, 14, 16, 9, 9, 1],
-    [1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 2, 56, 55, 55, 55, 55, 55, 55, 70, 2, 17, 2, 55, 55, 64, 2, 1, 1, 2, 55, 55, 64, 2, 48, 48, 48, 48, 48, 48, 48, 48, 48, 48, 2, 3, 55, 55, 64, 73, 62, 3, 9, 3, 79, 87, 87, 87, 87, 87, 87, 78, 71, 72, 55, 55, 55, 64, 3, 14, 9, 9, 14, 3, 3, 16, 9, 3, 6, 7, 9, 3, 9, 17, 3, 3, 3, 3, 14, 9, 9, 16, 87, 87, 23, 11, 14, 23, 24, 15, 10, 11, 55, 64, 9, 16, 9, 9, 14, 16, 55, 55, 66, 9, 16, 3, 9, 16, 9, 3, 9, 68, 55, 55, 55, 16, 9, 94, 94, 59, 55, 55, 2, 92, 108, 109, 109, 109, 109, 109, 109, 109, 109, 109, 111, 55, 55, 92, 92, 92, 3, 18, 11, 14, 15, 3, 9, 9, 1],
-    [1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 2, 59, 55, 55, 55, 58, 58, 75, 76, 2, 9, 2, 55, 55, 64, 2, 1, 1, 2, 55, 55, 64, 2, 48, 48, 48, 48, 48, 48, 48, 48, 48, 48, 2, 3, 55, 55, 55, 66, 73, 43, 43, 43, 16, 79, 87, 87, 87, 87, 87, 87, 3, 3, 63, 55, 55, 55, 9, 14, 14, 14, 25, 9, 17, 9, 3, 17, 17, 3, 9, 25, 3, 10, 11, 16, 9, 16, 9, 23, 24, 15, 87, 87, 14, 21, 15, 15, 14, 15, 8, 7, 55, 64, 16, 9, 14, 15, 9, 16, 69, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 70, 15, 3, 94, 92, 59, 55, 55, 2, 94, 108, 109, 109, 109, 109, 109, 109, 109, 109, 109, 116, 55, 55, 94, 92, 3, 3, 8, 7, 10, 11, 3, 16, 3, 1],
-    [1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 2, 55, 55, 55, 60, 9, 74, 74, 74, 44, 17, 25, 55, 55, 64, 2, 1, 1, 73, 55, 55, 64, 44, 48, 48, 48, 48, 48, 48, 48, 48, 48, 48, 2, 3, 59, 55, 55, 55, 51, 51, 51, 51, 51, 52, 53, 3, 25, 79, 87, 87, 10, 11, 3, 59, 55, 55, 9, 15, 16, 16, 9, 9, 15, 3, 3, 25, 3, 3, 3, 3, 16, 6, 7, 3, 9, 3, 9, 15, 14, 9, 87, 87, 18, 11, 15, 14, 18, 11, 7, 16, 55, 64, 9, 9, 16, 23, 24, 3, 71, 72, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 75, 76, 14, 16, 3, 94, 59, 55, 55, 2, 94, 112, 109, 109, 109, 109, 109, 109, 109, 109, 116, 2, 55, 55, 92, 92, 3, 16, 3, 16, 6, 7, 15, 14, 16, 1],
-    [1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 2, 55, 55, 55, 3, 9, 9, 9, 17, 25, 9, 46, 55, 55, 64, 2, 1, 1, 3, 55, 55, 64, 3, 93, 48, 48, 48, 48, 48, 48, 48, 48, 48, 2, 3, 69, 55, 55, 55, 55, 55, 55, 55, 55, 55, 57, 34, 36, 117, 115, 87, 6, 7, 3, 59, 55, 55, 14, 15, 14, 15, 9, 16, 16, 3, 9, 3, 3, 25, 3, 16, 3, 3, 16, 3, 9, 14, 9, 16, 14, 9, 118, 118, 6, 21, 23, 24, 8, 21, 16, 68, 55, 64, 23, 24, 16, 9, 9, 16, 3, 16, 3, 14, 9, 15, 16, 16, 27, 28, 29, 12, 13, 16, 16, 16, 9, 3, 3, 59, 55, 55, 2, 92, 108, 109, 109, 109, 109, 109, 109, 109, 109, 113, 2, 55, 55, 94, 92, 92, 3, 23, 24, 23, 11, 23, 24, 17, 1],
-    [1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 73, 55, 55, 55, 84, 25, 9, 25, 9, 9, 25, 46, 55, 55, 64, 2, 1, 1, 2, 55, 55, 64, 2, 48, 48, 48, 48, 48, 48, 48, 48, 48, 48, 2, 3, 71, 72, 58, 58, 58, 58, 58, 58, 55, 55, 64, 38, 40, 41, 115, 87, 3, 3, 3, 59, 55, 55, 15, 9, 16, 9, 15, 16, 9, 25, 15, 3, 9, 3, 3, 3, 9, 49, 50, 51, 51, 51, 51, 51, 51, 51, 51, 51, 51, 51, 51, 51, 51, 51, 51, 55, 55, 70, 16, 18, 11, 16, 3, 3, 18, 11, 16, 18, 11, 16, 23, 24, 31, 32, 33, 15, 23, 24, 16, 14, 16, 15, 9, 59, 55, 55, 94, 108, 115, 109, 109, 109, 109, 109, 109, 109, 109, 110, 2, 55, 55, 92, 92, 92, 3, 14, 15, 6, 7, 10, 11, 3, 1],
-    [1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 3, 55, 55, 55, 86, 9, 17, 9, 17, 25, 9, 46, 55, 55, 64, 2, 1, 1, 2, 55, 55, 64, 2, 48, 48, 48, 48, 48, 48, 48, 48, 48, 48, 2, 43, 43, 43, 43, 43, 43, 43, 43, 25, 63, 55, 55, 41, 41, 77, 87, 87, 9, 3, 9, 59, 55, 55, 16, 14, 15, 16, 16, 16, 15, 16, 9, 16, 3, 10, 11, 3, 16, 56, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 58, 75, 76, 9, 8, 21, 10, 24, 16, 23, 7, 3, 8, 21, 14, 9, 14, 16, 16, 9, 14, 9, 15, 9, 15, 9, 9, 68, 55, 55, 55, 108, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 113, 2, 55, 55, 94, 92, 3, 3, 10, 11, 18, 24, 8, 21, 16, 1],
-    [1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 2, 55, 55, 55, 3, 17, 9, 17, 3, 10, 11, 46, 55, 55, 64, 2, 1, 1, 2, 55, 55, 64, 2, 48, 48, 48, 48, 48, 48, 48, 48, 48, 48, 2, 82, 82, 82, 82, 82, 82, 82, 82, 77, 88, 59, 55, 89, 115, 87, 87, 87, 9, 3, 3, 59, 55, 55, 16, 12, 13, 9, 15, 9, 14, 9, 15, 3, 3, 8, 21, 3, 9, 59, 55, 60, 16, 27, 28, 29, 16, 16, 119, 119, 78, 9, 9, 10, 11, 18, 11, 18, 11, 14, 15, 3, 9, 6, 7, 49, 50, 51, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 70, 108, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 110, 55, 55, 94, 92, 3, 3, 6, 7, 6, 21, 10, 24, 3, 1],
-    [1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 2, 55, 55, 55, 3, 9, 3, 3, 3, 6, 7, 68, 55, 55, 64, 2, 1, 1, 2, 55, 55, 64, 73, 43, 62, 48, 48, 48, 48, 48, 48, 48, 48, 2, 82, 82, 82, 82, 82, 82, 82, 82, 87, 88, 59, 55, 89, 87, 87, 87, 80, 3, 3, 3, 59, 55, 55, 27, 28, 29, 23, 24, 14, 9, 16, 3, 9, 3, 16, 3, 9, 68, 55, 64, 16, 16, 31, 32, 33, 9, 16, 79, 87, 87, 87, 78, 8, 24, 6, 7, 23, 21, 15, 14, 3, 18, 11, 9, 56, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 75, 76, 108, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 110, 92, 55, 55, 92, 94, 3, 3, 23, 24, 10, 11, 23, 7, 25, 1],
-    [1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 2, 55, 55, 55, 10, 11, 46, 49, 50, 55, 55, 55, 55, 55, 64, 2, 1, 1, 2, 55, 55, 55, 66, 9, 73, 43, 43, 43, 43, 43, 43, 43, 43, 44, 43, 43, 62, 82, 82, 82, 82, 77, 87, 88, 59, 55, 66, 17, 9, 3, 3, 9, 3, 68, 55, 55, 55, 31, 32, 33, 15, 14, 49, 50, 51, 55, 55, 55, 55, 55, 55, 55, 55, 70, 3, 16, 3, 3, 9, 3, 16, 16, 3, 79, 87, 87, 87, 87, 87, 87, 87, 87, 78, 16, 9, 6, 21, 3, 59, 55, 60, 43, 43, 43, 43, 94, 107, 111, 107, 107, 111, 107, 107, 94, 43, 43, 43, 43, 43, 94, 94, 107, 109, 109, 109, 109, 109, 109, 109, 109, 109, 116, 92, 2, 55, 55, 92, 92, 94, 3, 14, 15, 6, 7, 18, 11, 3, 43],
-    [43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 10, 11, 55, 55, 55, 6, 7, 17, 56, 55, 55, 55, 55, 55, 55, 70, 2, 1, 1, 2, 59, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 51, 52, 53, 2, 82, 82, 82, 3, 87, 87, 87, 59, 55, 55, 51, 51, 51, 51, 51, 51, 55, 55, 55, 64, 14, 16, 15, 9, 9, 56, 55, 55, 55, 55, 55, 55, 55, 55, 58, 75, 76, 9, 9, 12, 13, 3, 9, 3, 9, 16, 9, 79, 87, 87, 87, 87, 87, 87, 87, 87, 78, 3, 10, 11, 9, 55, 64, 2, 94, 107, 111, 107, 108, 109, 109, 109, 109, 109, 109, 109, 113, 94, 94, 92, 94, 107, 111, 108, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 113, 92, 2, 55, 55, 92, 92, 3, 3, 10, 11, 23, 24, 6, 7, 16, 43],
-    [43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 6, 7, 55, 55, 55, 66, 3, 68, 55, 55, 55, 55, 55, 58, 75, 76, 73, 43, 43, 44, 69, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 57, 73, 43, 43, 43, 43, 87, 87, 80, 69, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 70, 9, 9, 16, 23, 24, 59, 55, 60, 3, 16, 16, 9, 9, 3, 9, 3, 16, 9, 3, 3, 9, 3, 9, 16, 3, 16, 15, 14, 14, 16, 9, 23, 24, 9, 79, 87, 87, 9, 8, 7, 3, 55, 64, 2, 108, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 107, 107, 111, 107, 108, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 110, 92, 2, 55, 55, 94, 92, 92, 3, 6, 7, 15, 15, 18, 11, 3, 3],
-    [3, 3, 3, 3, 22, 3, 3, 3, 3, 3, 30, 2, 22, 55, 55, 55, 55, 51, 55, 55, 55, 55, 60, 117, 117, 42, 61, 43, 43, 43, 62, 71, 72, 58, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 64, 3, 62, 3, 3, 9, 87, 87, 25, 71, 72, 58, 55, 55, 55, 55, 55, 55, 55, 58, 75, 76, 14, 15, 15, 14, 9, 55, 64, 16, 14, 15, 14, 15, 14, 15, 23, 24, 10, 11, 10, 11, 3, 16, 49, 50, 51, 51, 51, 51, 51, 51, 51, 51, 52, 53, 16, 87, 87, 78, 16, 23, 24, 55, 64, 2, 94, 114, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 113, 92, 2, 55, 55, 92, 92, 3, 3, 14, 15, 10, 11, 6, 21, 16, 3],
-    [30, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 2, 9, 69, 55, 55, 55, 55, 55, 55, 55, 70, 46, 41, 41, 42, 2, 22, 3, 3, 73, 43, 43, 43, 43, 43, 37, 43, 43, 43, 43, 43, 43, 62, 63, 55, 55, 55, 3, 2, 3, 3, 3, 87, 87, 9, 17, 3, 17, 3, 3, 3, 16, 3, 9, 3, 3, 3, 14, 16, 14, 23, 24, 16, 55, 64, 25, 23, 24, 15, 14, 23, 24, 15, 14, 8, 7, 6, 7, 16, 16, 56, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 57, 3, 87, 87, 87, 3, 15, 14, 55, 64, 2, 92, 108, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 111, 92, 2, 55, 55, 94, 92, 94, 3, 15, 14, 6, 7, 10, 11, 3, 3],
-    [3, 3, 3, 3, 3, 3, 3, 3, 22, 3, 3, 2, 17, 71, 72, 55, 55, 55, 55, 55, 75, 76, 46, 41, 41, 42, 2, 3, 3, 3, 3, 3, 5, 3, 30, 3, 4, 3, 30, 3, 3, 3, 5, 2, 3, 59, 55, 55, 3, 2, 3, 3, 3, 87, 87, 87, 87, 87, 78, 16, 3, 3, 3, 16, 3, 9, 3, 16, 9, 9, 9, 15, 9, 16, 55, 64, 9, 18, 11, 10, 11, 23, 24, 18, 11, 14, 15, 18, 11, 16, 9, 55, 55, 60, 10, 11, 3, 3, 3, 3, 63, 55, 64, 16, 79, 87, 87, 9, 10, 11, 55, 64, 2, 92, 112, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 111, 107, 55, 55, 94, 92, 3, 16, 12, 13, 3, 16, 6, 21, 3, 5],
-    [3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 2, 67, 25, 3, 34, 81, 36, 41, 41, 41, 41, 41, 41, 41, 41, 2, 5, 3, 3, 5, 3, 3, 3, 3, 22, 4, 3, 3, 3, 22, 30, 3, 2, 16, 59, 55, 55, 3, 2, 9, 3, 3, 79, 87, 87, 87, 87, 87, 87, 78, 3, 3, 3, 3, 3, 3, 9, 9, 14, 3, 16, 14, 9, 59, 55, 66, 6, 21, 8, 7, 14, 15, 8, 7, 23, 24, 8, 21, 9, 68, 55, 64, 3, 6, 7, 3, 3, 3, 3, 3, 59, 55, 9, 77, 87, 87, 16, 8, 7, 55, 64, 2, 94, 112, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 116, 114, 113, 114, 114, 114, 114, 116, 109, 109, 109, 109, 109, 110, 55, 55, 92, 92, 3, 3, 3, 16, 18, 11, 3, 3, 3, 3],
-    [3, 3, 3, 3, 5, 3, 3, 3, 3, 30, 3, 2, 67, 37, 37, 38, 39, 40, 74, 74, 74, 74, 74, 74, 74, 74, 74, 43, 43, 43, 43, 43, 43, 43, 43, 43, 4, 3, 5, 3, 3, 3, 3, 2, 3, 59, 55, 55, 66, 73, 43, 62, 3, 3, 3, 9, 79, 87, 87, 87, 87, 78, 9, 16, 3, 16, 3, 16, 3, 3, 3, 9, 9, 3, 69, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 70, 3, 3, 3, 3, 3, 77, 87, 88, 59, 55, 89, 87, 87, 87, 15, 14, 9, 55, 64, 2, 94, 108, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 116, 116, 114, 116, 116, 114, 43, 43, 43, 22, 43, 43, 43, 43, 114, 114, 114, 116, 114, 68, 55, 55, 94, 94, 92, 3, 9, 17, 8, 21, 16, 3, 3, 43],
-    [43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 25, 49, 50, 51, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 51, 52, 53, 3, 2, 30, 3, 3, 5, 3, 3, 2, 3, 59, 55, 55, 55, 52, 53, 2, 3, 3, 3, 3, 3, 3, 79, 87, 87, 87, 87, 78, 17, 3, 3, 3, 3, 16, 3, 3, 3, 16, 71, 72, 58, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 58, 75, 76, 3, 3, 3, 3, 77, 87, 87, 88, 59, 55, 89, 87, 87, 80, 23, 24, 3, 55, 64, 2, 108, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 113, 49, 50, 51, 51, 51, 51, 51, 51, 51, 51, 51, 51, 51, 51, 51, 51, 51, 51, 51, 55, 55, 55, 92, 94, 3, 3, 17, 9, 17, 3, 17, 9, 17, 3],
-    [3, 3, 3, 5, 3, 22, 3, 3, 3, 3, 3, 2, 56, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 57, 3, 2, 3, 3, 3, 3, 3, 22, 2, 3, 69, 55, 55, 55, 55, 57, 2, 16, 3, 3, 3, 3, 3, 3, 9, 79, 87, 87, 87, 3, 3, 9, 3, 3, 3, 3, 3, 3, 3, 23, 24, 3, 15, 3, 9, 3, 14, 3, 15, 3, 17, 3, 3, 16, 16, 3, 3, 17, 3, 3, 77, 87, 87, 87, 87, 80, 59, 55, 9, 18, 11, 10, 11, 9, 3, 55, 64, 2, 108, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 113, 92, 56, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 70, 92, 92, 3, 9, 16, 23, 24, 17, 14, 17, 17, 30],
-    [3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 22, 2, 59, 55, 55, 55, 58, 58, 58, 58, 58, 58, 58, 58, 58, 58, 58, 58, 58, 58, 58, 55, 55, 55, 64, 3, 2, 3, 3, 3, 3, 5, 3, 2, 3, 71, 72, 55, 55, 55, 64, 2, 3, 3, 10, 11, 3, 3, 3, 3, 3, 17, 87, 87, 3, 3, 16, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 14, 3, 10, 11, 3, 3, 15, 14, 15, 16, 3, 3, 3, 3, 3, 3, 77, 87, 87, 87, 87, 80, 3, 59, 55, 66, 23, 21, 8, 21, 3, 68, 55, 64, 2, 112, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 110, 92, 59, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 75, 76, 94, 94, 3, 3, 17, 17, 16, 17, 16, 16, 16, 3],
-    [3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 2, 59, 55, 55, 60, 10, 11, 3, 17, 45, 3, 3, 10, 11, 3, 3, 3, 3, 3, 9, 63, 55, 55, 55, 3, 2, 5, 22, 3, 30, 3, 3, 2, 3, 3, 3, 63, 55, 55, 55, 2, 3, 3, 6, 7, 3, 3, 3, 3, 3, 16, 87, 87, 16, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 14, 3, 3, 3, 3, 6, 7, 23, 24, 92, 92, 3, 14, 3, 16, 3, 3, 3, 77, 87, 87, 87, 80, 94, 3, 3, 69, 55, 55, 51, 51, 51, 51, 51, 55, 55, 70, 94, 108, 109, 109, 109, 109, 109, 109, 109, 109, 109, 113, 92, 92, 55, 55, 55, 60, 94, 92, 94, 92, 92, 94, 92, 94, 92, 92, 92, 94, 92, 94, 94, 94, 92, 3, 92, 94, 94, 3, 9, 17, 16, 9, 23, 24, 16, 3],
-    [3, 3, 3, 3, 3, 3, 30, 30, 3, 3, 3, 2, 59, 55, 55, 66, 6, 7, 9, 65, 9, 3, 17, 6, 7, 25, 17, 9, 10, 11, 3, 17, 55, 55, 55, 66, 73, 43, 43, 43, 43, 43, 43, 44, 3, 3, 3, 3, 55, 55, 55, 2, 3, 3, 3, 3, 3, 9, 3, 3, 77, 87, 87, 87, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 15, 3, 9, 3, 14, 15, 9, 92, 94, 3, 14, 3, 3, 3, 87, 109, 87, 110, 94, 3, 94, 3, 71, 72, 58, 55, 55, 55, 55, 55, 58, 75, 76, 94, 108, 109, 109, 109, 109, 109, 109, 109, 109, 109, 110, 94, 92, 55, 55, 64, 94, 92, 92, 3, 92, 3, 3, 92, 3, 17, 3, 3, 3, 3, 92, 3, 3, 3, 92, 3, 92, 3, 9, 17, 23, 24, 9, 17, 17, 17, 22],
-    [3, 3, 3, 5, 3, 3, 3, 3, 3, 3, 5, 2, 59, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 51, 52, 53, 6, 7, 3, 3, 59, 55, 55, 55, 55, 51, 51, 51, 51, 52, 53, 9, 3, 9, 3, 3, 55, 55, 55, 2, 3, 9, 3, 3, 77, 87, 87, 87, 87, 87, 87, 80, 3, 3, 9, 3, 3, 49, 50, 51, 51, 51, 51, 51, 51, 51, 51, 51, 51, 51, 51, 52, 53, 3, 14, 3, 94, 3, 3, 94, 77, 87, 109, 109, 107, 107, 94, 94, 94, 3, 94, 94, 111, 94, 94, 94, 94, 92, 107, 107, 111, 108, 109, 109, 109, 109, 109, 109, 109, 109, 109, 107, 94, 92, 55, 55, 64, 94, 92, 3, 94, 3, 94, 3, 3, 3, 3, 94, 94, 3, 9, 3, 3, 94, 3, 3, 3, 3, 3, 3, 16, 16, 16, 17, 14, 16, 17, 3],
-    [3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 2, 69, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 57, 17, 3, 3, 25, 69, 55, 55, 55, 55, 55, 55, 55, 55, 55, 57, 17, 3, 3, 3, 3, 55, 55, 55, 2, 3, 3, 77, 87, 87, 87, 87, 87, 87, 87, 80, 9, 3, 3, 3, 3, 9, 56, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 57, 16, 3, 14, 3, 94, 94, 92, 109, 109, 109, 109, 109, 109, 107, 111, 107, 107, 108, 109, 109, 107, 107, 111, 107, 108, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 113, 92, 55, 55, 55, 66, 92, 94, 94, 94, 92, 94, 92, 92, 92, 94, 92, 92, 92, 94, 92, 92, 92, 3, 94, 92, 3, 3, 9, 17, 15, 17, 17, 17, 17, 3],
-    [3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 30, 2, 71, 72, 58, 58, 58, 58, 58, 58, 58, 58, 58, 58, 55, 55, 55, 64, 42, 3, 3, 3, 71, 72, 58, 55, 55, 55, 55, 55, 55, 55, 64, 9, 3, 3, 3, 3, 55, 55, 55, 44, 3, 77, 87, 87, 87, 87, 80, 46, 45, 45, 45, 45, 17, 45, 45, 45, 42, 59, 55, 55, 55, 58, 58, 58, 58, 58, 58, 58, 58, 55, 55, 55, 64, 2, 3, 14, 15, 3, 92, 77, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 110, 92, 55, 55, 55, 55, 51, 51, 51, 51, 51, 51, 51, 51, 51, 51, 51, 51, 51, 51, 52, 53, 94, 92, 3, 94, 3, 3, 3, 17, 9, 16, 3, 9, 17, 3],
-    [3, 3, 3, 3, 3, 22, 3, 3, 3, 3, 3, 2, 10, 11, 9, 9, 25, 45, 45, 45, 45, 45, 45, 9, 63, 55, 55, 55, 42, 3, 3, 3, 3, 10, 11, 43, 43, 43, 62, 63, 55, 55, 64, 17, 3, 9, 77, 88, 55, 55, 55, 89, 87, 87, 87, 80, 3, 9, 3, 46, 34, 81, 36, 41, 42, 34, 81, 36, 42, 55, 55, 55, 60, 9, 46, 34, 81, 36, 34, 81, 36, 63, 55, 55, 55, 2, 3, 15, 92, 3, 108, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 107, 94, 69, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 57, 92, 92, 3, 92, 92, 3, 3, 3, 17, 9, 17, 17, 17, 3],
-    [3, 30, 3, 3, 3, 3, 3, 3, 5, 3, 3, 2, 6, 7, 3, 3, 3, 3, 3, 9, 3, 3, 3, 3, 17, 55, 55, 55, 16, 3, 3, 3, 9, 6, 7, 3, 3, 3, 2, 17, 55, 55, 64, 9, 9, 77, 87, 88, 55, 55, 55, 89, 87, 87, 80, 16, 3, 3, 3, 46, 38, 39, 40, 41, 42, 38, 39, 40, 42, 55, 55, 64, 3, 3, 46, 38, 39, 40, 38, 39, 40, 3, 59, 55, 55, 2, 3, 3, 3, 94, 112, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 110, 71, 72, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 64, 92, 3, 92, 92, 3, 3, 3, 16, 17, 14, 17, 16, 17, 3],
-    [3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 2, 3, 3, 3, 3, 3, 3, 3, 3, 3, 9, 25, 65, 9, 55, 55, 55, 17, 3, 3, 77, 87, 87, 78, 73, 43, 43, 44, 9, 55, 55, 64, 77, 87, 87, 87, 88, 55, 55, 55, 89, 80, 3, 3, 3, 3, 3, 16, 46, 65, 83, 41, 41, 17, 65, 65, 3, 68, 55, 55, 64, 16, 16, 46, 65, 65, 65, 25, 65, 65, 65, 59, 55, 55, 2, 3, 3, 3, 92, 108, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 107, 111, 107, 107, 94, 43, 43, 43, 43, 43, 43, 43, 94, 92, 43, 108, 107, 63, 55, 55, 64, 94, 94, 94, 92, 92, 3, 3, 3, 14, 17, 9, 3, 9, 5],
-    [3, 3, 3, 5, 3, 3, 30, 3, 3, 3, 22, 2, 3, 3, 3, 3, 9, 3, 3, 3, 10, 11, 77, 87, 88, 55, 55, 55, 89, 87, 87, 87, 87, 87, 87, 87, 87, 87, 87, 88, 55, 55, 55, 89, 87, 80, 3, 3, 55, 55, 55, 46, 45, 45, 45, 42, 3, 3, 3, 49, 50, 51, 51, 51, 51, 51, 51, 51, 55, 55, 55, 64, 16, 3, 3, 3, 3, 3, 9, 3, 9, 3, 59, 55, 55, 9, 3, 3, 92, 3, 108, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 115, 109, 109, 109, 110, 92, 92, 94, 92, 94, 108, 111, 107, 107, 108, 109, 109, 110, 59, 55, 64, 92, 92, 3, 94, 92, 3, 9, 3, 9, 9, 3, 9, 17, 43],
-    [43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 9, 44, 17, 3, 3, 3, 3, 3, 3, 3, 6, 7, 87, 87, 88, 55, 55, 55, 89, 87, 87, 87, 80, 9, 79, 87, 87, 87, 87, 88, 55, 55, 55, 89, 80, 3, 3, 16, 55, 55, 55, 46, 17, 3, 3, 42, 9, 3, 3, 56, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 70, 3, 3, 3, 3, 17, 3, 3, 3, 3, 84, 59, 55, 55, 66, 3, 3, 3, 92, 112, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 107, 111, 107, 107, 111, 108, 115, 109, 109, 109, 109, 109, 109, 110, 59, 55, 64, 92, 92, 94, 92, 3, 3, 3, 18, 11, 9, 3, 3, 3, 17],
-    [3, 3, 3, 3, 10, 11, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 9, 3, 3, 46, 87, 87, 25, 55, 55, 55, 10, 11, 43, 43, 43, 62, 17, 3, 3, 16, 3, 9, 55, 55, 55, 66, 3, 16, 3, 68, 55, 55, 55, 46, 3, 3, 3, 42, 3, 10, 11, 59, 55, 55, 55, 55, 55, 55, 55, 55, 55, 58, 75, 76, 9, 3, 3, 3, 3, 3, 3, 3, 9, 86, 59, 55, 55, 55, 51, 52, 53, 94, 108, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 115, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 113, 59, 55, 64, 92, 94, 3, 92, 3, 16, 3, 8, 21, 3, 10, 11, 3, 3],
-    [3, 3, 3, 17, 6, 7, 3, 3, 3, 3, 3, 3, 9, 3, 3, 3, 3, 3, 3, 16, 3, 16, 87, 87, 42, 55, 55, 55, 6, 7, 3, 3, 3, 2, 3, 3, 3, 3, 3, 3, 59, 55, 55, 55, 55, 51, 51, 55, 55, 55, 64, 46, 34, 81, 36, 42, 3, 6, 7, 55, 55, 55, 60, 46, 45, 41, 45, 25, 45, 45, 45, 17, 45, 45, 17, 45, 45, 42, 3, 3, 3, 17, 69, 55, 55, 55, 55, 55, 57, 92, 108, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 115, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 110, 59, 55, 64, 94, 92, 94, 94, 3, 3, 23, 11, 3, 3, 8, 21, 9, 10],
-    [11, 3, 3, 3, 3, 3, 3, 3, 9, 3, 3, 3, 3, 3, 3, 3, 3, 16, 3, 42, 3, 25, 87, 87, 2, 55, 55, 55, 25, 34, 81, 36, 3, 2, 16, 3, 25, 3, 3, 16, 69, 55, 55, 55, 55, 55, 55, 55, 55, 55, 70, 46, 38, 39, 40, 25, 9, 3, 3, 55, 55, 64, 9, 46, 34, 81, 36, 42, 34, 81, 36, 34, 81, 36, 34, 81, 36, 42, 9, 3, 3, 3, 71, 72, 58, 55, 55, 55, 64, 92, 112, 109, 109, 109, 115, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 116, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 110, 59, 55, 64, 94, 92, 3, 92, 94, 3, 6, 21, 18, 11, 10, 11, 3, 6],
-    [7, 9, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 10, 11, 3, 3, 3, 3, 9, 3, 77, 87, 87, 9, 55, 55, 55, 2, 38, 39, 40, 41, 2, 3, 9, 3, 3, 3, 16, 71, 72, 58, 55, 55, 55, 55, 55, 55, 75, 76, 46, 117, 83, 117, 41, 42, 3, 68, 55, 55, 64, 9, 46, 38, 39, 40, 42, 38, 39, 40, 38, 39, 40, 38, 39, 40, 42, 3, 3, 3, 3, 9, 10, 11, 63, 55, 55, 55, 66, 92, 114, 116, 116, 114, 114, 116, 116, 114, 114, 116, 116, 116, 116, 116, 114, 116, 116, 116, 114, 114, 114, 116, 114, 112, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 113, 59, 55, 64, 92, 94, 94, 92, 3, 3, 14, 15, 6, 7, 6, 7, 3, 3],
-    [3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 9, 6, 7, 9, 3, 3, 3, 9, 77, 87, 87, 80, 2, 55, 55, 55, 2, 41, 83, 117, 41, 2, 3, 3, 3, 16, 3, 3, 16, 46, 45, 34, 81, 36, 41, 41, 42, 9, 9, 3, 45, 45, 45, 49, 50, 55, 55, 55, 55, 64, 9, 46, 65, 65, 65, 25, 65, 65, 17, 65, 65, 65, 17, 65, 65, 42, 16, 3, 16, 3, 3, 6, 7, 17, 59, 55, 55, 55, 51, 51, 51, 51, 51, 51, 51, 51, 51, 51, 51, 51, 51, 51, 51, 51, 51, 51, 51, 51, 51, 51, 51, 52, 53, 114, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 110, 59, 55, 64, 94, 94, 3, 94, 3, 16, 23, 24, 10, 11, 14, 15, 3, 3],
-    [3, 3, 10, 11, 3, 3, 9, 3, 3, 3, 3, 77, 87, 87, 87, 87, 87, 87, 87, 87, 87, 87, 80, 3, 2, 55, 55, 55, 2, 41, 41, 3, 3, 2, 3, 3, 3, 3, 10, 11, 3, 46, 3, 38, 39, 40, 34, 36, 42, 3, 46, 45, 45, 45, 42, 56, 55, 55, 55, 55, 55, 70, 9, 3, 3, 3, 49, 50, 51, 51, 51, 51, 51, 51, 51, 51, 51, 52, 53, 3, 3, 16, 3, 3, 9, 3, 69, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 57, 3, 114, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 110, 59, 55, 64, 92, 94, 94, 3, 3, 3, 18, 11, 6, 7, 15, 14, 3, 9],
-    [9, 9, 6, 7, 25, 43, 43, 43, 43, 25, 77, 87, 87, 87, 87, 87, 87, 87, 87, 87, 87, 80, 10, 11, 17, 55, 55, 55, 2, 41, 3, 3, 3, 2, 3, 16, 3, 3, 6, 7, 3, 46, 3, 117, 83, 41, 38, 40, 42, 9, 46, 34, 81, 36, 42, 55, 55, 55, 55, 58, 75, 76, 3, 3, 3, 9, 56, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 57, 16, 3, 3, 3, 3, 3, 3, 71, 72, 58, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 64, 3, 112, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 113, 59, 55, 64, 94, 3, 3, 16, 3, 9, 6, 7, 15, 14, 10, 11, 3, 87],
-    [87, 87, 87, 87, 87, 87, 87, 87, 87, 87, 87, 87, 87, 25, 43, 43, 43, 43, 43, 43, 43, 9, 6, 7, 68, 55, 55, 55, 73, 43, 43, 43, 43, 44, 3, 3, 3, 3, 3, 3, 3, 46, 65, 65, 65, 65, 65, 65, 42, 3, 46, 38, 39, 40, 42, 55, 55, 55, 60, 65, 65, 65, 65, 65, 65, 9, 59, 55, 55, 55, 58, 58, 58, 58, 58, 55, 55, 55, 64, 9, 46, 45, 45, 45, 17, 45, 45, 42, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 62, 63, 55, 55, 55, 92, 108, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 116, 110, 59, 55, 64, 92, 94, 3, 3, 9, 3, 15, 14, 23, 24, 6, 7, 3, 87],
-    [87, 87, 87, 87, 87, 87, 87, 87, 87, 87, 87, 87, 80, 49, 50, 51, 51, 51, 51, 51, 51, 51, 51, 51, 55, 55, 55, 55, 25, 65, 65, 65, 65, 65, 10, 11, 45, 45, 45, 42, 3, 3, 3, 9, 17, 3, 3, 9, 3, 3, 46, 41, 41, 41, 41, 55, 55, 55, 3, 42, 34, 81, 36, 3, 46, 9, 55, 55, 55, 60, 42, 34, 81, 36, 46, 63, 55, 55, 64, 16, 46, 34, 81, 36, 34, 81, 36, 42, 25, 82, 82, 82, 82, 82, 82, 82, 82, 82, 82, 82, 16, 82, 82, 82, 9, 16, 82, 82, 16, 82, 2, 3, 55, 55, 55, 3, 112, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 113, 114, 116, 116, 114, 114, 116, 114, 94, 68, 55, 55, 64, 84, 3, 12, 13, 3, 9, 14, 15, 10, 11, 10, 11, 3, 9],
-    [9, 10, 11, 45, 9, 10, 11, 43, 43, 43, 43, 43, 9, 56, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 70, 42, 41, 82, 82, 82, 82, 6, 7, 3, 3, 3, 42, 3, 3, 3, 3, 3, 17, 3, 3, 16, 3, 46, 34, 81, 36, 42, 55, 55, 55, 66, 42, 38, 39, 40, 65, 17, 68, 55, 55, 64, 3, 42, 38, 39, 40, 46, 9, 59, 55, 64, 9, 46, 38, 39, 40, 38, 39, 40, 42, 10, 11, 3, 3, 77, 78, 3, 61, 43, 62, 41, 41, 61, 43, 43, 43, 43, 43, 43, 43, 43, 43, 44, 68, 55, 55, 55, 94, 108, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 110, 49, 50, 51, 51, 51, 51, 51, 51, 55, 55, 55, 64, 86, 3, 12, 13, 3, 3, 23, 11, 8, 7, 6, 7, 3, 25],
-    [3, 6, 7, 3, 117, 6, 7, 3, 3, 3, 3, 17, 2, 59, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 75, 76, 34, 81, 36, 3, 3, 3, 46, 3, 34, 81, 36, 42, 3, 3, 3, 9, 3, 3, 3, 3, 3, 3, 46, 38, 39, 40, 42, 55, 55, 55, 55, 51, 51, 51, 51, 51, 51, 55, 55, 55, 64, 3, 42, 3, 3, 3, 46, 9, 59, 55, 55, 66, 46, 65, 65, 17, 65, 65, 65, 42, 6, 7, 3, 3, 79, 80, 3, 2, 16, 2, 41, 3, 2, 49, 50, 51, 51, 51, 51, 51, 51, 51, 51, 55, 55, 55, 64, 3, 112, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 110, 56, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 70, 92, 3, 3, 9, 3, 9, 6, 7, 18, 11, 10, 11, 3, 42],
-    [34, 81, 35, 36, 41, 3, 3, 3, 3, 3, 3, 3, 2, 55, 55, 55, 60, 3, 3, 9, 3, 3, 3, 3, 9, 17, 3, 46, 38, 39, 40, 41, 3, 3, 46, 3, 38, 39, 40, 42, 3, 9, 3, 3, 3, 3, 3, 3, 3, 3, 46, 65, 65, 65, 42, 69, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 70, 3, 45, 45, 45, 45, 45, 3, 59, 55, 55, 55, 51, 51, 51, 51, 51, 51, 51, 52, 53, 3, 9, 3, 3, 3, 3, 73, 43, 44, 41, 3, 2, 56, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 70, 92, 108, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 113, 59, 55, 55, 55, 55, 55, 55, 55, 55, 58, 75, 76, 92, 3, 3, 3, 12, 13, 10, 11, 6, 7, 8, 7, 3, 42],
-    [38, 39, 47, 40, 41, 3, 3, 3, 3, 3, 3, 3, 2, 55, 55, 64, 3, 3, 17, 25, 65, 65, 9, 3, 3, 3, 3, 46, 41, 83, 117, 41, 65, 65, 25, 65, 65, 83, 3, 25, 65, 65, 25, 3, 3, 3, 16, 3, 3, 3, 3, 3, 16, 3, 3, 71, 72, 55, 55, 55, 55, 55, 55, 55, 55, 58, 58, 75, 76, 16, 3, 3, 3, 3, 9, 3, 69, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 57, 16, 82, 82, 82, 82, 2, 41, 3, 3, 41, 3, 2, 59, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 58, 75, 76, 112, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 116, 92, 55, 55, 55, 60, 94, 92, 94, 3, 92, 92, 92, 92, 94, 30, 3, 3, 3, 9, 8, 21, 15, 14, 10, 11, 3, 42],
-    [41, 41, 41, 41, 41, 3, 9, 3, 3, 3, 3, 3, 2, 55, 55, 64, 10, 11, 9, 41, 77, 78, 42, 3, 3, 9, 10, 11, 49, 50, 51, 51, 51, 51, 51, 51, 51, 51, 51, 51, 52, 53, 42, 9, 3, 3, 3, 3, 16, 3, 3, 3, 3, 3, 9, 46, 34, 81, 36, 34, 81, 36, 34, 81, 36, 34, 81, 36, 65, 65, 65, 65, 16, 3, 10, 11, 71, 72, 58, 58, 58, 58, 58, 58, 58, 55, 55, 55, 64, 46, 45, 45, 45, 42, 2, 41, 41, 41, 41, 3, 2, 59, 55, 55, 60, 94, 43, 43, 43, 43, 94, 108, 107, 111, 107, 108, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 110, 92, 55, 55, 55, 94, 3, 22, 3, 94, 3, 5, 3, 3, 30, 3, 94, 3, 3, 3, 10, 11, 23, 24, 6, 7, 3, 42],
-    [41, 41, 41, 41, 9, 65, 65, 17, 65, 65, 65, 65, 25, 55, 55, 64, 6, 7, 41, 41, 79, 80, 42, 3, 3, 3, 6, 7, 56, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 57, 9, 17, 25, 65, 65, 9, 65, 17, 16, 3, 3, 3, 3, 46, 38, 39, 40, 38, 39, 40, 38, 39, 40, 38, 39, 40, 42, 3, 3, 46, 3, 3, 6, 7, 3, 46, 34, 81, 36, 34, 81, 36, 42, 63, 55, 55, 64, 46, 34, 81, 36, 42, 2, 82, 82, 82, 41, 3, 2, 55, 55, 64, 94, 92, 94, 92, 111, 107, 108, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 113, 94, 55, 55, 55, 66, 92, 94, 92, 92, 92, 94, 94, 92, 94, 92, 94, 14, 3, 14, 6, 21, 18, 11, 23, 24, 3, 42],
-    [82, 25, 41, 41, 41, 41, 41, 41, 41, 41, 41, 41, 41, 55, 55, 64, 3, 82, 34, 81, 36, 41, 42, 3, 9, 3, 3, 2, 59, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 64, 46, 82, 82, 82, 42, 3, 3, 42, 3, 3, 3, 9, 3, 46, 3, 3, 46, 3, 3, 46, 3, 3, 46, 3, 3, 46, 34, 81, 36, 46, 3, 9, 3, 3, 9, 46, 38, 39, 40, 38, 39, 40, 42, 9, 59, 55, 64, 46, 38, 39, 40, 42, 2, 3, 3, 3, 41, 3, 2, 55, 55, 64, 92, 94, 92, 112, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 107, 94, 55, 55, 55, 55, 51, 51, 51, 51, 51, 51, 51, 51, 52, 53, 94, 94, 9, 3, 18, 11, 8, 7, 15, 23, 24, 9],
-    [3, 46, 41, 41, 17, 45, 45, 10, 11, 41, 25, 45, 45, 55, 55, 55, 66, 3, 38, 39, 40, 65, 42, 3, 3, 9, 3, 2, 59, 55, 55, 60, 17, 45, 45, 45, 45, 25, 63, 55, 55, 64, 46, 34, 81, 36, 34, 81, 36, 42, 3, 16, 3, 3, 3, 46, 65, 65, 46, 65, 65, 46, 65, 65, 46, 65, 65, 46, 38, 39, 40, 46, 25, 3, 3, 3, 3, 46, 3, 3, 46, 3, 3, 3, 42, 17, 59, 55, 55, 66, 65, 65, 65, 42, 2, 3, 3, 3, 41, 3, 2, 55, 55, 64, 94, 111, 107, 108, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 107, 69, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 57, 92, 92, 3, 3, 6, 7, 10, 11, 10, 11, 3, 42],
-    [3, 17, 82, 82, 3, 3, 3, 6, 7, 41, 42, 3, 3, 59, 55, 55, 55, 55, 55, 55, 55, 55, 51, 52, 53, 3, 3, 2, 59, 55, 64, 25, 9, 3, 3, 3, 3, 9, 17, 59, 55, 55, 66, 38, 39, 40, 38, 39, 40, 25, 9, 65, 65, 65, 65, 65, 65, 65, 65, 17, 65, 65, 65, 65, 49, 50, 51, 51, 51, 51, 51, 51, 52, 53, 9, 3, 3, 46, 65, 65, 46, 65, 65, 65, 42, 16, 59, 55, 55, 55, 51, 51, 52, 53, 25, 65, 65, 65, 41, 3, 2, 55, 55, 64, 108, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 113, 71, 72, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 64, 94, 94, 3, 9, 23, 24, 6, 21, 6, 21, 3, 17],
-    [45, 45, 10, 11, 45, 45, 9, 41, 41, 41, 25, 3, 3, 69, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 57, 3, 3, 2, 59, 55, 64, 42, 3, 3, 3, 3, 3, 3, 9, 59, 55, 55, 55, 51, 51, 51, 51, 51, 51, 52, 53, 42, 3, 46, 3, 3, 46, 3, 3, 42, 42, 3, 3, 46, 56, 55, 55, 55, 55, 55, 55, 55, 55, 57, 3, 65, 65, 65, 65, 65, 65, 3, 16, 3, 10, 11, 69, 55, 55, 55, 55, 55, 55, 57, 34, 81, 36, 46, 41, 3, 2, 55, 55, 64, 112, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 107, 92, 3, 5, 3, 3, 3, 3, 22, 3, 3, 63, 55, 55, 64, 92, 92, 3, 3, 15, 14, 10, 24, 14, 15, 3, 3],
-    [3, 3, 6, 7, 3, 3, 3, 3, 45, 45, 45, 3, 3, 71, 72, 58, 58, 58, 58, 58, 58, 55, 55, 55, 64, 3, 3, 2, 59, 55, 64, 42, 3, 3, 3, 3, 3, 3, 17, 69, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 57, 34, 81, 35, 81, 35, 81, 36, 65, 42, 42, 34, 81, 36, 59, 55, 55, 55, 55, 55, 55, 55, 55, 64, 17, 42, 34, 81, 36, 41, 46, 3, 3, 3, 6, 7, 71, 72, 58, 58, 55, 55, 55, 64, 38, 39, 40, 46, 41, 3, 2, 55, 55, 64, 112, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 110, 94, 92, 94, 108, 107, 111, 107, 108, 107, 3, 59, 55, 64, 92, 92, 3, 3, 18, 11, 6, 7, 15, 14, 3, 43],
-    [43, 43, 43, 43, 43, 43, 43, 43, 25, 45, 34, 81, 35, 81, 35, 81, 35, 81, 35, 81, 36, 63, 55, 55, 64, 9, 3, 2, 59, 55, 64, 42, 3, 3, 3, 3, 3, 3, 9, 71, 72, 58, 58, 58, 58, 58, 58, 55, 55, 55, 64, 38, 39, 47, 47, 47, 47, 40, 55, 42, 42, 38, 39, 40, 59, 55, 55, 60, 16, 9, 63, 55, 55, 55, 66, 42, 38, 39, 40, 41, 46, 9, 3, 3, 9, 3, 9, 16, 41, 42, 63, 55, 55, 64, 3, 3, 3, 46, 41, 3, 2, 55, 55, 64, 108, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 107, 107, 111, 108, 115, 109, 109, 109, 109, 109, 110, 59, 55, 64, 94, 92, 3, 9, 6, 21, 23, 24, 10, 11, 3, 3],
-    [3, 3, 3, 3, 3, 3, 3, 3, 46, 3, 38, 39, 47, 39, 47, 39, 47, 39, 47, 39, 40, 65, 59, 55, 64, 3, 3, 2, 59, 55, 64, 25, 9, 45, 45, 25, 45, 45, 45, 25, 45, 45, 17, 45, 45, 45, 42, 63, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 42, 25, 65, 65, 65, 59, 55, 64, 9, 3, 3, 9, 59, 55, 55, 55, 51, 51, 51, 51, 51, 52, 53, 9, 3, 3, 25, 65, 46, 41, 10, 11, 55, 55, 64, 45, 45, 45, 25, 41, 3, 2, 55, 55, 64, 108, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 113, 59, 55, 64, 92, 92, 94, 3, 18, 24, 15, 14, 6, 21, 3, 3],
-    [3, 3, 3, 3, 3, 3, 10, 11, 46, 65, 3, 83, 46, 3, 46, 3, 3, 25, 3, 83, 41, 46, 59, 55, 64, 10, 11, 2, 59, 55, 64, 9, 3, 3, 3, 9, 3, 3, 3, 46, 3, 34, 81, 35, 81, 36, 46, 3, 55, 55, 55, 34, 81, 35, 81, 35, 81, 36, 55, 42, 42, 34, 81, 36, 59, 55, 64, 9, 3, 3, 3, 69, 55, 55, 55, 55, 55, 55, 55, 55, 55, 57, 42, 65, 65, 25, 41, 41, 41, 6, 7, 55, 55, 64, 34, 81, 36, 46, 41, 3, 2, 55, 55, 64, 112, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 110, 59, 55, 64, 92, 94, 92, 3, 23, 24, 14, 15, 18, 11, 3, 3],
-    [3, 3, 3, 9, 3, 3, 6, 7, 17, 25, 65, 41, 46, 65, 46, 65, 65, 46, 65, 65, 65, 46, 59, 55, 64, 6, 7, 2, 59, 55, 64, 9, 3, 10, 11, 17, 3, 3, 3, 46, 3, 38, 39, 47, 39, 40, 46, 68, 55, 55, 55, 38, 39, 47, 39, 47, 39, 40, 117, 42, 42, 38, 39, 40, 59, 55, 64, 3, 16, 3, 17, 71, 72, 58, 58, 55, 55, 55, 55, 55, 55, 55, 42, 41, 41, 41, 41, 45, 45, 3, 16, 55, 55, 64, 38, 39, 40, 46, 41, 3, 2, 55, 55, 64, 112, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 113, 59, 55, 64, 94, 94, 3, 9, 10, 11, 23, 24, 6, 7, 3, 9],
-    [3, 3, 3, 3, 3, 3, 3, 3, 3, 25, 41, 41, 41, 41, 41, 41, 41, 41, 41, 41, 41, 41, 59, 55, 64, 17, 3, 2, 59, 55, 64, 42, 3, 6, 7, 3, 3, 3, 3, 46, 65, 65, 49, 50, 51, 51, 51, 55, 55, 55, 64, 42, 3, 46, 3, 3, 46, 41, 41, 42, 25, 65, 65, 65, 59, 55, 64, 17, 46, 45, 45, 45, 45, 42, 9, 9, 9, 9, 63, 55, 55, 55, 41, 41, 45, 45, 45, 9, 3, 3, 9, 55, 55, 64, 3, 3, 3, 46, 41, 3, 2, 55, 55, 64, 108, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 116, 114, 116, 116, 114, 114, 114, 116, 116, 114, 116, 109, 109, 109, 115, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 113, 92, 59, 55, 64, 94, 92, 92, 3, 8, 21, 14, 23, 24, 15, 3, 3],
-    [3, 3, 3, 3, 3, 3, 3, 3, 3, 25, 45, 45, 45, 45, 45, 45, 45, 45, 45, 45, 45, 68, 55, 55, 64, 3, 3, 2, 59, 55, 64, 25, 3, 3, 46, 3, 3, 46, 45, 45, 45, 25, 56, 55, 55, 55, 55, 55, 55, 55, 70, 45, 45, 45, 45, 45, 45, 45, 45, 9, 42, 34, 81, 36, 59, 55, 64, 16, 46, 34, 81, 36, 3, 42, 46, 48, 48, 48, 9, 59, 55, 55, 42, 45, 3, 3, 3, 3, 3, 25, 9, 55, 55, 64, 45, 45, 45, 25, 41, 3, 2, 55, 55, 64, 108, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 113, 49, 50, 51, 51, 51, 51, 51, 52, 53, 108, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 110, 92, 59, 55, 64, 92, 92, 92, 92, 12, 13, 15, 14, 15, 14, 3, 3],
-    [3, 3, 3, 3, 3, 3, 3, 3, 3, 2, 49, 50, 51, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 64, 3, 9, 2, 59, 55, 64, 25, 3, 3, 46, 3, 3, 46, 3, 3, 3, 25, 59, 55, 55, 55, 58, 58, 58, 75, 76, 25, 3, 3, 3, 3, 3, 3, 3, 3, 42, 38, 39, 40, 59, 55, 55, 66, 46, 38, 39, 40, 65, 42, 46, 48, 48, 48, 9, 59, 55, 55, 42, 46, 45, 45, 25, 45, 45, 42, 9, 55, 55, 64, 34, 81, 36, 46, 41, 3, 2, 55, 55, 64, 112, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 110, 56, 55, 55, 55, 55, 55, 55, 55, 57, 112, 109, 109, 109, 109, 109, 115, 109, 109, 109, 109, 109, 109, 109, 109, 113, 94, 59, 55, 64, 94, 92, 92, 3, 3, 9, 18, 11, 16, 9, 3, 3],
-    [3, 3, 3, 3, 3, 3, 3, 3, 3, 2, 56, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 70, 3, 3, 2, 59, 55, 64, 42, 9, 3, 9, 3, 3, 46, 34, 81, 36, 25, 59, 55, 55, 60, 17, 3, 10, 11, 9, 3, 3, 3, 3, 3, 3, 3, 3, 3, 45, 45, 45, 45, 59, 55, 55, 55, 51, 51, 51, 51, 51, 52, 53, 65, 65, 65, 65, 59, 55, 55, 42, 46, 34, 81, 35, 81, 36, 42, 3, 55, 55, 64, 38, 39, 40, 46, 41, 3, 2, 55, 55, 64, 108, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 110, 59, 55, 55, 55, 55, 55, 55, 55, 55, 66, 114, 116, 116, 114, 114, 109, 109, 109, 109, 109, 109, 109, 109, 109, 107, 94, 59, 55, 64, 92, 92, 3, 9, 3, 3, 8, 21, 9, 3, 3, 3],
-    [3, 3, 3, 3, 9, 3, 3, 3, 9, 2, 59, 55, 55, 55, 58, 58, 58, 58, 58, 58, 58, 58, 58, 75, 76, 17, 3, 2, 59, 55, 64, 25, 3, 17, 46, 3, 3, 46, 38, 39, 40, 25, 59, 55, 55, 16, 3, 3, 6, 7, 9, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 69, 55, 55, 55, 55, 55, 55, 55, 55, 55, 57, 34, 81, 36, 46, 59, 55, 55, 25, 46, 38, 39, 47, 39, 40, 42, 16, 55, 55, 64, 3, 3, 3, 46, 41, 3, 2, 55, 55, 64, 108, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 113, 55, 55, 55, 60, 3, 3, 63, 55, 55, 55, 51, 51, 52, 53, 108, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 110, 59, 55, 64, 94, 94, 92, 14, 9, 14, 3, 9, 3, 9, 9, 3],
-    [3, 3, 3, 3, 3, 3, 3, 3, 3, 2, 59, 55, 55, 60, 34, 81, 36, 17, 42, 9, 9, 17, 9, 25, 25, 9, 3, 2, 59, 55, 64, 42, 10, 11, 46, 3, 3, 46, 117, 83, 3, 25, 59, 55, 55, 25, 3, 3, 3, 3, 3, 3, 3, 3, 3, 65, 65, 65, 65, 65, 65, 65, 65, 3, 71, 72, 58, 58, 58, 58, 58, 55, 55, 55, 64, 38, 39, 40, 46, 59, 55, 55, 66, 46, 65, 65, 25, 65, 65, 42, 68, 55, 55, 64, 45, 45, 45, 25, 41, 3, 2, 55, 55, 64, 112, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 116, 92, 55, 55, 64, 3, 10, 11, 3, 69, 55, 55, 55, 55, 55, 57, 108, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 113, 59, 55, 64, 92, 92, 3, 3, 23, 24, 15, 9, 3, 3, 9, 9],
-    [3, 3, 3, 17, 3, 3, 3, 3, 3, 2, 59, 55, 55, 17, 38, 39, 40, 3, 42, 3, 3, 9, 3, 9, 10, 11, 3, 2, 59, 55, 64, 42, 6, 7, 46, 3, 3, 46, 41, 41, 3, 25, 59, 55, 55, 16, 3, 17, 9, 3, 3, 3, 3, 3, 3, 42, 34, 81, 36, 34, 81, 36, 46, 3, 16, 42, 34, 81, 36, 65, 65, 63, 55, 55, 64, 3, 3, 3, 46, 59, 55, 55, 55, 51, 51, 51, 51, 51, 51, 51, 55, 55, 55, 64, 34, 81, 36, 46, 41, 3, 2, 55, 55, 64, 112, 115, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 113, 92, 3, 55, 55, 64, 3, 6, 7, 3, 71, 72, 58, 55, 55, 55, 64, 112, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 110, 59, 55, 64, 94, 92, 3, 3, 9, 14, 9, 14, 9, 14, 16, 78],
-    [9, 3, 3, 3, 3, 3, 3, 3, 84, 2, 59, 55, 55, 66, 3, 83, 65, 65, 42, 3, 9, 3, 3, 3, 6, 7, 9, 2, 59, 55, 64, 10, 11, 9, 46, 3, 3, 17, 45, 45, 45, 25, 59, 55, 55, 25, 65, 65, 65, 65, 65, 65, 65, 65, 65, 42, 38, 39, 40, 38, 39, 40, 46, 16, 3, 42, 38, 39, 40, 3, 46, 3, 59, 55, 64, 45, 45, 45, 17, 69, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 70, 38, 39, 40, 25, 41, 3, 2, 55, 55, 64, 108, 115, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 113, 92, 9, 55, 55, 64, 9, 3, 3, 30, 3, 9, 3, 63, 55, 55, 64, 108, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 110, 59, 55, 64, 94, 94, 3, 9, 3, 16, 16, 15, 16, 3, 3, 87],
-    [78, 10, 11, 3, 3, 3, 3, 3, 86, 2, 59, 55, 55, 55, 51, 51, 51, 52, 53, 46, 25, 45, 45, 45, 25, 9, 3, 2, 59, 55, 64, 6, 7, 41, 25, 3, 3, 3, 3, 3, 3, 16, 85, 85, 85, 9, 82, 82, 82, 10, 11, 3, 3, 3, 46, 49, 50, 51, 51, 51, 51, 51, 51, 52, 53, 17, 65, 65, 65, 65, 25, 16, 59, 55, 64, 34, 81, 36, 46, 71, 72, 58, 58, 55, 55, 55, 55, 55, 55, 55, 58, 58, 75, 76, 45, 45, 45, 45, 41, 3, 2, 55, 55, 64, 112, 116, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 110, 94, 3, 55, 55, 64, 9, 3, 16, 3, 3, 3, 3, 9, 59, 55, 55, 108, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 113, 59, 55, 64, 92, 92, 92, 12, 13, 9, 15, 23, 24, 16, 3, 87],
-    [87, 6, 7, 3, 3, 3, 3, 3, 3, 2, 69, 55, 55, 55, 55, 55, 55, 55, 57, 46, 34, 81, 36, 3, 42, 17, 3, 25, 59, 55, 64, 42, 41, 41, 41, 3, 3, 3, 3, 3, 3, 17, 59, 55, 55, 25, 34, 81, 36, 6, 7, 34, 81, 36, 46, 56, 55, 55, 55, 55, 55, 55, 55, 55, 57, 42, 3, 3, 3, 3, 46, 16, 59, 55, 64, 38, 39, 40, 46, 3, 42, 34, 81, 36, 34, 81, 36, 34, 81, 36, 34, 81, 36, 46, 41, 41, 41, 41, 41, 3, 2, 55, 55, 64, 92, 112, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 113, 92, 3, 55, 55, 64, 3, 3, 3, 3, 3, 9, 3, 9, 59, 55, 55, 112, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 113, 59, 55, 64, 94, 92, 3, 3, 16, 9, 15, 9, 9, 3, 16, 87],
-    [87, 17, 3, 3, 3, 3, 3, 3, 3, 2, 71, 72, 58, 55, 55, 55, 55, 55, 55, 66, 38, 39, 40, 3, 25, 65, 17, 68, 55, 55, 64, 42, 41, 34, 81, 36, 9, 9, 10, 11, 9, 17, 59, 55, 55, 66, 38, 39, 40, 3, 42, 38, 39, 40, 68, 55, 55, 55, 55, 55, 55, 55, 55, 55, 64, 25, 65, 34, 81, 36, 46, 3, 59, 55, 64, 3, 3, 3, 46, 3, 42, 38, 39, 40, 38, 39, 40, 38, 39, 40, 38, 39, 40, 46, 82, 82, 82, 82, 41, 9, 2, 55, 55, 64, 94, 108, 109, 109, 109, 109, 109, 109, 109, 109, 116, 114, 92, 94, 3, 55, 55, 64, 16, 3, 3, 3, 3, 3, 3, 9, 59, 55, 55, 66, 114, 114, 114, 116, 116, 114, 114, 114, 116, 114, 68, 55, 55, 64, 92, 92, 3, 3, 9, 9, 15, 16, 9, 3, 3, 87],
-    [80, 9, 3, 3, 3, 9, 3, 3, 3, 25, 45, 45, 17, 45, 45, 25, 63, 55, 55, 55, 51, 51, 51, 51, 51, 51, 51, 55, 55, 55, 64, 9, 41, 38, 39, 40, 3, 3, 6, 7, 3, 84, 59, 55, 55, 55, 123, 51, 51, 51, 51, 51, 51, 51, 55, 55, 55, 55, 60, 17, 3, 63, 55, 55, 55, 66, 25, 38, 39, 40, 46, 68, 55, 55, 64, 45, 45, 45, 17, 3, 42, 3, 3, 46, 3, 3, 46, 3, 3, 46, 3, 3, 3, 46, 3, 3, 3, 3, 41, 3, 2, 59, 55, 55, 66, 94, 114, 114, 116, 114, 114, 116, 116, 114, 94, 3, 94, 3, 68, 55, 55, 64, 16, 3, 3, 3, 16, 3, 3, 94, 59, 55, 55, 55, 51, 51, 51, 51, 51, 51, 51, 51, 51, 51, 55, 55, 55, 64, 92, 94, 92, 3, 9, 16, 9, 9, 9, 3, 3, 21],
-    [3, 3, 17, 3, 3, 3, 3, 3, 9, 2, 34, 81, 36, 34, 81, 36, 3, 69, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 70, 10, 11, 41, 83, 82, 9, 3, 3, 42, 3, 86, 59, 55, 55, 55, 123, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 70, 3, 34, 81, 36, 69, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 70, 34, 81, 36, 46, 3, 45, 45, 45, 45, 45, 45, 45, 45, 45, 45, 45, 45, 45, 45, 3, 3, 41, 41, 10, 11, 2, 69, 55, 55, 55, 51, 51, 51, 51, 51, 51, 51, 51, 51, 51, 51, 51, 51, 55, 55, 55, 70, 3, 3, 3, 3, 3, 3, 3, 94, 69, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 70, 94, 92, 3, 14, 16, 15, 14, 16, 14, 16, 3, 3],
-    [3, 3, 3, 9, 3, 3, 3, 3, 3, 2, 38, 39, 40, 38, 39, 40, 41, 71, 72, 55, 55, 55, 55, 55, 55, 55, 55, 55, 58, 75, 76, 6, 7, 9, 65, 65, 65, 65, 65, 25, 65, 68, 55, 58, 58, 55, 123, 55, 55, 55, 55, 55, 55, 55, 55, 55, 75, 76, 17, 38, 39, 40, 71, 72, 55, 55, 55, 55, 55, 55, 55, 55, 58, 75, 76, 38, 39, 40, 46, 3, 10, 11, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 9, 41, 3, 6, 7, 2, 71, 72, 58, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 58, 75, 76, 9, 3, 3, 3, 3, 3, 23, 24, 71, 72, 58, 58, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 75, 76, 94, 94, 94, 3, 9, 23, 24, 16, 9, 3, 15, 9],
-    [3, 3, 3, 3, 3, 17, 3, 3, 3, 2, 25, 82, 82, 42, 83, 10, 11, 17, 25, 41, 46, 45, 41, 45, 42, 41, 45, 42, 9, 10, 11, 25, 3, 3, 3, 3, 2, 59, 104, 105, 106, 55, 60, 3, 9, 16, 14, 16, 17, 16, 9, 14, 15, 23, 24, 16, 14, 16, 3, 42, 3, 46, 3, 17, 45, 45, 45, 45, 45, 45, 45, 45, 45, 25, 9, 45, 45, 45, 45, 3, 6, 7, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 41, 34, 36, 41, 3, 3, 3, 17, 67, 74, 74, 74, 74, 74, 74, 74, 74, 74, 74, 74, 74, 74, 74, 74, 74, 74, 74, 74, 4, 3, 3, 3, 3, 3, 3, 3, 14, 10, 11, 94, 92, 92, 92, 92, 92, 92, 92, 92, 92, 92, 92, 92, 92, 94, 92, 94, 92, 3, 3, 3, 14, 15, 15, 9, 3, 15, 10],
-    [11, 3, 3, 3, 3, 3, 3, 3, 3, 2, 46, 3, 9, 42, 41, 6, 7, 9, 46, 41, 46, 9, 41, 3, 42, 41, 3, 42, 3, 6, 7, 3, 9, 3, 3, 3, 2, 59, 55, 55, 55, 55, 3, 3, 15, 16, 14, 10, 11, 65, 65, 65, 3, 14, 3, 16, 3, 15, 3, 42, 3, 3, 45, 42, 34, 81, 35, 81, 35, 81, 35, 81, 36, 46, 16, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 41, 38, 40, 41, 3, 3, 9, 3, 67, 3, 3, 3, 3, 3, 3, 30, 3, 3, 3, 3, 5, 22, 3, 3, 3, 9, 3, 22, 4, 3, 3, 3, 3, 3, 3, 3, 3, 6, 7, 3, 94, 92, 94, 3, 92, 3, 92, 92, 94, 3, 3, 3, 94, 3, 94, 3, 3, 3, 9, 16, 9, 9, 9, 9, 3, 3, 6],
-    [7, 65, 25, 9, 43, 43, 25, 3, 3, 2, 17, 45, 45, 45, 45, 45, 17, 3, 46, 41, 34, 81, 35, 81, 35, 81, 36, 42, 9, 3, 3, 3, 3, 3, 3, 3, 2, 59, 124, 55, 55, 124, 9, 19, 20, 3, 3, 6, 7, 82, 82, 46, 3, 3, 9, 3, 3, 3, 3, 45, 45, 45, 45, 42, 38, 39, 47, 39, 47, 39, 47, 39, 40, 46, 3, 3, 3, 16, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 41, 41, 41, 41, 3, 3, 3, 3, 67, 3, 3, 5, 9, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 4, 3, 3, 3, 3, 3, 3, 3, 3, 3, 9, 3, 3, 3, 92, 3, 3, 3, 3, 3, 3, 3, 16, 3, 3, 3, 3, 3, 16, 3, 9, 3, 14, 16, 14, 9, 16, 3, 87],
-    [87, 87, 87, 87, 87, 78, 17, 9, 43, 25, 3, 10, 11, 3, 3, 17, 65, 65, 25, 41, 38, 39, 39, 47, 47, 39, 40, 42, 3, 3, 3, 3, 3, 3, 3, 3, 2, 59, 125, 55, 55, 126, 2, 10, 11, 9, 3, 3, 34, 81, 36, 46, 9, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 42, 3, 46, 3, 46, 3, 46, 3, 46, 3, 46, 3, 10, 11, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 77, 87, 115, 87, 115, 87, 87, 78, 3, 3, 67, 3, 22, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 30, 3, 3, 4, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 16, 3, 9, 14, 9, 14, 9, 3, 15, 9, 9, 9, 16, 16, 16, 87],
-    [87, 87, 87, 87, 87, 87, 87, 87, 87, 78, 9, 6, 7, 17, 9, 46, 41, 41, 41, 41, 9, 42, 41, 117, 42, 83, 41, 42, 3, 10, 11, 3, 3, 3, 3, 3, 73, 10, 11, 43, 43, 9, 44, 6, 7, 3, 3, 3, 38, 39, 40, 117, 17, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 42, 3, 46, 3, 46, 3, 46, 3, 46, 3, 46, 3, 6, 7, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 87, 87, 115, 87, 87, 87, 87, 87, 3, 3, 67, 3, 3, 3, 3, 3, 3, 3, 3, 3, 9, 3, 3, 3, 3, 3, 3, 3, 3, 3, 4, 3, 3, 3, 3, 9, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 9, 3, 3, 3, 3, 3, 12, 13, 23, 24, 3, 9, 16, 16, 9, 9, 14, 9, 16, 16, 3, 3, 34],
-    [35, 81, 36, 9, 79, 87, 87, 87, 87, 87, 87, 87, 87, 87, 87, 88, 41, 89, 87, 87, 78, 42, 9, 41, 42, 41, 17, 42, 3, 6, 7, 3, 9, 3, 25, 65, 65, 6, 7, 65, 17, 25, 9, 25, 3, 9, 3, 9, 9, 83, 117, 41, 3, 9, 9, 65, 25, 9, 3, 3, 3, 3, 3, 42, 3, 46, 3, 46, 3, 46, 3, 46, 3, 46, 3, 3, 3, 3, 3, 16, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 87, 87, 87, 87, 87, 87, 87, 87, 9, 3, 67, 30, 3, 3, 3, 3, 3, 3, 5, 3, 3, 3, 3, 3, 22, 3, 3, 3, 3, 3, 4, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 16, 14, 9, 16, 9, 15, 15, 9, 16, 23, 24, 9, 9, 3, 9, 3, 3, 38],
-    [47, 39, 40, 42, 3, 9, 45, 25, 79, 87, 87, 87, 87, 87, 87, 88, 41, 89, 87, 87, 87, 87, 87, 87, 87, 87, 87, 87, 87, 87, 87, 87, 87, 87, 87, 87, 87, 87, 87, 87, 87, 87, 87, 87, 87, 87, 87, 87, 87, 87, 87, 87, 87, 87, 87, 87, 87, 87, 78, 10, 11, 3, 3, 45, 45, 45, 45, 45, 45, 45, 45, 45, 45, 45, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 87, 87, 87, 87, 87, 87, 87, 87, 3, 3, 67, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 4, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 9, 9, 16, 16, 14, 9, 15, 9, 14, 16, 9, 9, 9, 3, 3, 3]
-]
 
 class Map:
     def __init__(self, game):
         self.game = game
-        self.map_data = map_data
-        self.mapsize_x = len(self.map_data[0])
-        self.mapsize_y = len(self.map_data)
+        # Map as array (height, width) of sprite numbers - renderers and collision checks share this array
+        self.map_data = load_map()
+        self.mapsize_y, self.mapsize_x = self.map_data.shape
+        # Track metadata (files/map.json)
+        self.info = load_map_info()
+        # Walkability grid - True where the car may drive (streets and green areas), built once for the track
+        self.walkable = np.isin(self.map_data, self.info['allowed_sprites'])
 
         print(f'Map Size: {self.mapsize_x} x {self.mapsize_y} Sprites - '
               f'{self.mapsize_x * self.game.sprites.size} x {self.mapsize_y * self.game.sprites.size} Pixels')
+        # How often each sprite number appears in the map
+        self.sprite_counts = np.bincount(self.map_data.ravel(), minlength=256)
+        print(f'Map uses {np.count_nonzero(self.sprite_counts)} of {len(self.game.sprites.sprites)} Sprites')
 
-    def draw(self, x, y):
+        # Render mode of the map - 'tiles', 'prerender' or 'chunks' (see settings.py)
+        self.render_mode = settings.MAP_RENDER_MODE
+        # Pre-rendered background of the whole map and its size in bytes
+        self.background = None
+        self.background_bytes = 0
+        # Pre-rendered chunks of the map in least recently used order - keyed by chunk position (cx, cy)
+        self.chunks = OrderedDict()
+        self.chunk_bytes = 0
+        # Chunk cache counters for tuning chunk size and budget
+        self.chunk_hits = 0
+        self.chunk_misses = 0
+        self.chunk_prefetches = 0
+        self.chunk_evictions = 0
+        # Previous background frame and the view rect it shows (for scrolling it by the camera movement)
+        self.frame = None
+        self.frame_view = None
+        # Scroll renderer counters - full repaints and pixels of sprites drawn in the last frame
+        self.frame_repaints = 0
+        self.frame_drawn_pixels = 0
+        # Sprites are drawn into the atlas on first use - draw the ones around the start position right away
+        self.game.sprites.warm_up(self.game.render_zoom,
+                                  self.get_sprites_near(self.game.player_map_x, self.game.player_map_y,
+                                                        settings.SPRITE_PREWARM_DISTANCE))
+        self.build_background()
+
+    def build_background(self):
+        # Compose the whole map for the current mode into one surface, so drawing is a single blit
+        self.background = None
+        self.background_bytes = 0
+        # Chunks and the previous frame of the previous mode are not valid anymore
+        self.chunks.clear()
+        self.chunk_bytes = 0
+        self.frame = None
+        if self.render_mode != 'prerender':
+            return
+
+        tile_size = self.game.sprites.size * self.game.render_zoom
+        width, height = self.mapsize_x * tile_size, self.mapsize_y * tile_size
+        # The pre-rendered map uses the format of the sprites (1 byte per pixel with palette, 4 without)
+        size = width * height * (1 if self.game.sprites.palette is not None else 4)
+        if size > settings.MAP_PRERENDER_BUDGET_MB * 1024 * 1024:
+            print(f'Pre-rendered map would need {size / 1024 / 1024:.1f} MB - budget is '
+                  f'{settings.MAP_PRERENDER_BUDGET_MB} MB - drawing tiles instead')
+            return
+
+        background = self.game.sprites.create_surface((width, height))
+        self.render_area(background, 0, 0, self.mapsize_x, self.mapsize_y)
+
+        self.background = background
+        self.background_bytes = size
+        print(f'Pre-rendered map: {width} x {height} Pixels - {size / 1024 / 1024:.1f} MB')
+
+    def render_area(self, surface, left, top, width, height):
+        # Render width x height sprites of the map starting at sprite left, top onto the surface
+        self.fill_background(surface)
+        atlas, areas = self.game.sprites.get_atlas(self.game.render_zoom)
+        tile_size = self.game.sprites.size * self.game.render_zoom
+        surface.blits([(atlas, (x * tile_size, y * tile_size), areas[sprite_index])
+                       for y, row in enumerate(self.get_area(left, top, width, height).tolist())
+                       for x, sprite_index in enumerate(row)], doreturn=False)
+
+    def render_view(self, surface, view, rect):
+        # Render the part rect of the surface, where the surface shows the view rect in zoomed map pixels
+        surface.set_clip(rect)
+        self.fill_background(surface, rect)
+        atlas, areas = self.game.sprites.get_atlas(self.game.render_zoom)
+        tile_size = self.game.sprites.size * self.game.render_zoom
+        left = max(0, (view.x + rect.left) // tile_size)
+        right = min(self.mapsize_x - 1, (view.x + rect.right - 1) // tile_size)
+        top = max(0, (view.y + rect.top) // tile_size)
+        bottom = min(self.mapsize_y - 1, (view.y + rect.bottom - 1) // tile_size)
+        area = self.get_area(left, top, right - left + 1, bottom - top + 1)
+        surface.blits([(atlas, (x * tile_size - view.x, y * tile_size - view.y), areas[sprite_index])
+                       for y, row in enumerate(area.tolist(), top)
+                       for x, sprite_index in enumerate(row, left)], doreturn=False)
+        surface.set_clip(None)
+        self.frame_drawn_pixels += rect.width * rect.height
+
+    def get_chunk(self, cx, cy):
+        # Return the pre-rendered chunk at chunk position cx, cy - render it if it is not in the cache
+        chunk = self.chunks.get((cx, cy))
+        if chunk is not None:
+            self.chunk_hits += 1
+            self.chunks.move_to_end((cx, cy))
+            return chunk
+        self.chunk_misses += 1
+        return self.build_chunk(cx, cy)
+
+    def build_chunk(self, cx, cy):
+        # Render a chunk of MAP_CHUNK_SIZE x MAP_CHUNK_SIZE sprites (smaller at the right and bottom border)
+        left, top = cx * settings.MAP_CHUNK_SIZE, cy * settings.MAP_CHUNK_SIZE
+        width = min(settings.MAP_CHUNK_SIZE, self.mapsize_x - left)
+        height = min(settings.MAP_CHUNK_SIZE, self.mapsize_y - top)
+        tile_size = self.game.sprites.size * self.game.render_zoom
+        chunk = self.game.sprites.create_surface((width * tile_size, height * tile_size))
+        self.render_area(chunk, left, top, width, height)
+        self.chunks[(cx, cy)] = chunk
+        self.chunk_bytes += chunk.get_width() * chunk.get_height() * chunk.get_bytesize()
+
+        # Drop the least recently used chunks until we are within the budget again (but keep the new one)
+        while self.chunk_bytes > settings.MAP_CHUNK_BUDGET_MB * 1024 * 1024 and len(self.chunks) > 1:
+            _, old = self.chunks.popitem(last=False)
+            self.chunk_bytes -= old.get_width() * old.get_height() * old.get_bytesize()
+            self.chunk_evictions += 1
+        return chunk
+
+    def get_chunk_range(self, rect):
+        # Chunk positions covered by a rect in zoomed map pixels - limited to the map
+        chunk_pixels = settings.MAP_CHUNK_SIZE * self.game.sprites.size * self.game.render_zoom
+        max_cx = (self.mapsize_x - 1) // settings.MAP_CHUNK_SIZE
+        max_cy = (self.mapsize_y - 1) // settings.MAP_CHUNK_SIZE
+        return (range(max(0, rect.left // chunk_pixels), min(max_cx, (rect.right - 1) // chunk_pixels) + 1),
+                range(max(0, rect.top // chunk_pixels), min(max_cy, (rect.bottom - 1) // chunk_pixels) + 1))
+
+    def get_cache_stats(self):
+        # Counters of the chunk cache or the scroll renderer (for the debug output)
+        if self.render_mode == 'scroll':
+            return (f'Scroll: repaints: {self.frame_repaints} - '
+                    f'drawn: {self.frame_drawn_pixels} of {self.game.canvas.get_width() * self.game.canvas.get_height()} Pixels')
+        if self.render_mode != 'chunks':
+            return None
+        return (f'Chunks: {len(self.chunks)} ({self.chunk_bytes / 1024 / 1024:.1f} MB) - '
+                f'hit: {self.chunk_hits} miss: {self.chunk_misses} '
+                f'pre: {self.chunk_prefetches} evict: {self.chunk_evictions}')
+
+    def get_sprite(self, x, y):
+        # Sprite number at map position x, y
+        return int(self.map_data[y, x])
+
+    def get_area(self, left, top, width, height):
+        # Sprite numbers of a rect of the map (clipped to the map) - a view of the map, no copy
+        return self.map_data[max(0, top):max(0, top + height), max(0, left):max(0, left + width)]
+
+    def get_used_sprites(self):
+        # Sprite numbers that appear in the map
+        return np.flatnonzero(self.sprite_counts).tolist()
+
+    def get_sprites_near(self, x, y, distance):
+        # Sprite numbers that appear within distance sprites around the map position x, y
+        area = self.get_area(x - distance, y - distance, 2 * distance + 1, 2 * distance + 1)
+        return np.unique(area).tolist()
+
+    def get_row(self, y, left=0, right=None):
+        # Sprite numbers of a row of the map from left up to (not including) right
+        return self.map_data[y, left:right]
+
+    def get_column(self, x, top=0, bottom=None):
+        # Sprite numbers of a column of the map from top up to (not including) bottom
+        return self.map_data[top:bottom, x]
+
+    def lookup(self, xs, ys):
+        # Sprite numbers at many map positions at once - positions outside are moved to the border of the map
+        xs = np.clip(xs, 0, self.mapsize_x - 1)
+        ys = np.clip(ys, 0, self.mapsize_y - 1)
+        return self.map_data[ys, xs]
+
+    def is_walkable(self, x, y):
+        # True if the car may drive on map position x, y
+        return bool(self.walkable[y, x])
+
+    def are_walkable(self, xs, ys):
+        # Walkability of many map positions at once (e.g. the corners of the car) - positions outside the map are
+        # not walkable
+        xs, ys = np.asarray(xs), np.asarray(ys)
+        inside = (xs >= 0) & (xs < self.mapsize_x) & (ys >= 0) & (ys < self.mapsize_y)
+        return inside & self.walkable[np.clip(ys, 0, self.mapsize_y - 1), np.clip(xs, 0, self.mapsize_x - 1)]
+
+    def sweep(self, x0, y0, x1, y1):
+        # Move from map pixel position x0, y0 to x1, y1 through the walkability grid - the tiles crossed by the
+        # movement are visited in order (Amanatides-Woo grid traversal), so even a fast car can not jump over a tile
+        # Returns the end position and None, or the position just before the first tile the car may not drive on
+        # and the contact point on its border
+        size = self.game.sprites.size
+        tile_x, tile_y = int(x0 // size), int(y0 // size)
+        end_x, end_y = int(x1 // size), int(y1 // size)
+        dx, dy = x1 - x0, y1 - y0
+        step_x = 1 if dx > 0 else -1
+        step_y = 1 if dy > 0 else -1
+        # Part of the movement (0 to 1) at which the next tile border is crossed and between two borders
+        if dx:
+            next_x = ((tile_x + (step_x > 0)) * size - x0) / dx
+            delta_x = size / abs(dx)
+        else:
+            next_x = delta_x = math.inf
+        if dy:
+            next_y = ((tile_y + (step_y > 0)) * size - y0) / dy
+            delta_y = size / abs(dy)
+        else:
+            next_y = delta_y = math.inf
+
+        while tile_x != end_x or tile_y != end_y:
+            if next_x < next_y:
+                t = next_x
+                next_x += delta_x
+                tile_x += step_x
+            else:
+                t = next_y
+                next_y += delta_y
+                tile_y += step_y
+            if t > 1:
+                break
+            if not (0 <= tile_x < self.mapsize_x and 0 <= tile_y < self.mapsize_y and self.walkable[tile_y, tile_x]):
+                # Stop a hundredth of a pixel before the border
+                stop = max(0.0, t - 0.01 / max(abs(dx), abs(dy)))
+                return x0 + dx * stop, y0 + dy * stop, (x0 + dx * t, y0 + dy * t)
+        return x1, y1, None
+
+    def set_palette(self, palette):
+        # Recolor the pre-rendered map, the chunks and the previous frame for a new mode
+        if self.background is not None:
+            self.background.set_palette(palette)
+        for chunk in self.chunks.values():
+            chunk.set_palette(palette)
+        if self.frame is not None:
+            self.frame.set_palette(palette)
+
+    def fill_background(self, surface, rect=None):
+        # Fill with the background color - surfaces with palette use the background index of the sprites
+        if surface.get_bitsize() == 8:
+            surface.fill(self.game.sprites.BACKGROUND, rect)
+        else:
+            surface.fill(self.get_background_color(), rect)
+
+    def get_background_color(self):
+        # Background color for the mode of the sprites (shines through transparent sprite pixels)
+        if self.game.sprites.mode == 'night':
+            return settings.BG_COLOR_NIGHT
+        elif self.game.sprites.mode == 'winter':
+            return settings.BG_COLOR_WINTER
+        return settings.BG_COLOR_DAY
+
+    def get_viewport(self, x, y):
         # Make Integer out of Float
         x = int(x)
         y = int(y)
@@ -162,30 +283,111 @@ class Map:
         if bgy > self.mapsize_y - self.game.sizey:
             bgy = self.mapsize_y - self.game.sizey
 
+        return bgx, bgy, shiftx, shifty
+
+    def draw(self, x, y):
+        bgx, bgy, shiftx, shifty = self.get_viewport(x, y)
+        # The whole screen changes if the camera moved or the mode changed
+        self.game.dirty.set_background((self.game.sprites.mode, bgx, bgy, shiftx, shifty))
+
+        if self.background is not None:
+            self.draw_prerendered(bgx, bgy, shiftx, shifty)
+        elif self.render_mode == 'chunks':
+            self.draw_chunks(bgx, bgy, shiftx, shifty)
+        elif self.render_mode == 'scroll':
+            self.draw_scrolled(bgx, bgy, shiftx, shifty)
+        else:
+            self.draw_tiles(bgx, bgy, shiftx, shifty)
+
+    def get_view_rect(self, bgx, bgy, shiftx, shifty):
+        # Visible part of the map in zoomed map pixels
+        tile_size = self.game.sprites.size * self.game.render_zoom
+        return pg.Rect(bgx * tile_size + shiftx * self.game.render_zoom,
+                       bgy * tile_size + shifty * self.game.render_zoom,
+                       self.game.canvas.get_width(), self.game.canvas.get_height())
+
+    def draw_prerendered(self, bgx, bgy, shiftx, shifty):
+        # Blit the visible part of the pre-rendered map in one go
+        view = self.get_view_rect(bgx, bgy, shiftx, shifty)
+        area = view.clip(self.background.get_rect())
+        self.game.canvas.blit(self.background, (area.x - view.x, area.y - view.y), area)
+
+    def draw_chunks(self, bgx, bgy, shiftx, shifty):
+        # Blit the visible chunks - with a chunk at least as big as the screen these are at most four
+        view = self.get_view_rect(bgx, bgy, shiftx, shifty)
+        chunk_pixels = settings.MAP_CHUNK_SIZE * self.game.sprites.size * self.game.render_zoom
+        range_x, range_y = self.get_chunk_range(view)
+        for cy in range_y:
+            for cx in range_x:
+                self.game.canvas.blit(self.get_chunk(cx, cy), (cx * chunk_pixels - view.x, cy * chunk_pixels - view.y))
+
+        # Render one chunk per frame that the camera is approaching, so it is ready before it gets visible
+        range_x, range_y = self.get_chunk_range(view.inflate(settings.MAP_CHUNK_PREFETCH * 2 * self.game.render_zoom,
+                                                             settings.MAP_CHUNK_PREFETCH * 2 * self.game.render_zoom))
+        for cy in range_y:
+            for cx in range_x:
+                if (cx, cy) not in self.chunks:
+                    self.chunk_prefetches += 1
+                    self.build_chunk(cx, cy)
+                    return
+
+    def draw_scrolled(self, bgx, bgy, shiftx, shifty):
+        # Scroll the previous frame by the camera movement and draw only the sprites of the uncovered strips
+        view = self.get_view_rect(bgx, bgy, shiftx, shifty)
+        self.frame_drawn_pixels = 0
+        if self.frame is None:
+            self.frame = self.game.sprites.create_surface(view.size)
+            self.frame_view = None
+
+        if self.frame_view is None:
+            dx = dy = view.width
+        else:
+            dx, dy = view.x - self.frame_view.x, view.y - self.frame_view.y
+
+        if abs(dx) > view.width // 2 or abs(dy) > view.height // 2:
+            # Mode switch or big jump (new race) - repaint everything
+            self.frame_repaints += 1
+            self.render_view(self.frame, view, self.frame.get_rect())
+        elif dx or dy:
+            self.frame.scroll(-dx, -dy)
+            # Uncovered columns at the left or right side
+            if dx > 0:
+                self.render_view(self.frame, view, pg.Rect(view.width - dx, 0, dx, view.height))
+            elif dx < 0:
+                self.render_view(self.frame, view, pg.Rect(0, 0, -dx, view.height))
+            # Uncovered rows at the top or bottom (without the corner that is already drawn)
+            if dy > 0:
+                self.render_view(self.frame, view, pg.Rect(max(0, -dx), view.height - dy,
+                                                           view.width - abs(dx), dy))
+            elif dy < 0:
+                self.render_view(self.frame, view, pg.Rect(max(0, -dx), 0, view.width - abs(dx), -dy))
+
+        self.frame_view = view
+        self.game.canvas.blit(self.frame, (0, 0))
+
+    def draw_tiles(self, bgx, bgy, shiftx, shifty):
+        # Atlas of the zoomed sprites from the cache of the sprites
+        atlas, areas = self.game.sprites.get_atlas(self.game.render_zoom)
+        tile_size = self.game.sprites.size * self.game.render_zoom
+        offset_x, offset_y = shiftx * self.game.render_zoom, shifty * self.game.render_zoom
+
         # Building Background + 1 more left and 1 more right than viewsize
         # we can shift pixel wise without "holes" in the background
-        for y in range(self.game.sizey+2):
-            for x in range(self.game.sizex+2):
-                # Getting the Sprite Index for given Position
-                sprite_index = self.map_data[y + bgy-1][x + bgx-1]
-                # Getting Sprite Image
-                sprite = pg.transform.scale(self.game.sprites.images[sprite_index-1],
-                                            (self.game.sprites.size * self.game.zoom_factor,
-                                             self.game.sprites.size * self.game.zoom_factor))
-                # Blitting Sprite to Background
-                self.game.screen.blit(sprite, ((x-1) * self.game.sprites.size * self.game.zoom_factor - shiftx * self.game.zoom_factor,
-                                               (y-1) * self.game.sprites.size * self.game.zoom_factor - shifty * self.game.zoom_factor))
+        left, top = max(0, bgx-1), max(0, bgy-1)
+        area = self.get_area(left, top, self.game.sizex+2, self.game.sizey+2)
+        # Blitting all zoomed Sprites to Background with one call
+        self.game.canvas.blits([(atlas, (x * tile_size - offset_x, y * tile_size - offset_y), areas[sprite_index])
+                                for y, row in enumerate(area.tolist(), top - bgy)
+                                for x, sprite_index in enumerate(row, left - bgx)], doreturn=False)
 
     def draw_debug_sprite(self, x, y):
-        sprite_index = self.map_data[y][x]
+        sprite_index = self.get_sprite(x, y)
 
         zoom = 8
 
         surface = pg.Surface(((self.game.sprites.size + 2) * zoom, (self.game.sprites.size + 2) * zoom))
         surface.fill((255, 255, 255))
-        self.game.screen.blit(surface, (800 - zoom, 100 - zoom))
-        sprite = pg.transform.scale(self.game.sprites.images[sprite_index - 1],
-                                    (self.game.sprites.size * zoom,
-                                     self.game.sprites.size * zoom))
-        self.game.screen.blit(sprite, (800, 100))
+        self.game.dirty.add(self.game.screen.blit(surface, (800 - zoom, 100 - zoom)))
+        atlas, areas = self.game.sprites.get_atlas(zoom)
+        self.game.screen.blit(atlas, (800, 100), areas[sprite_index])
         return sprite_index
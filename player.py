@@ -6,7 +6,9 @@
 #
 
 import pygame as pg
+import numpy as np
 import os
+from assets import load_sprite_assets
 
 
 class Player:
@@ -18,48 +20,53 @@ class Player:
         self.sprite_size = size
         self.usefiles = usefiles
         self.player_sprite = None
+        # Rotated player sprites and their top left offset to the center - keyed by direction in degrees
+        self.rotations = {}
 
-        self.allowed_sprites = [49, 50, 51, 52, 53, 55, 56, 57, 58, 59, 60, 63, 64, 66, 68, 69, 70, 71, 72,
-                                75, 76, 85, 99, 123, 3]
-
-        # Load the player sprite from PNG File or from sprites_array.py
+        # Load the player sprite from PNG File or from the sprite assets
         if self.usefiles:
-            self.player_sprite = self.load_sprite_from_file()
+            map_sprite = self.load_sprite_from_file()
         else:
-            # Import the sprite array from sprites_array.py
-            from sprites_array import player_sprite
-            from sprites_array import summer_color
-            self.player_sprite = pg.transform.scale(self.create_sprite_image(player_sprite,
-                                                                             summer_color,
-                                                                             self.sprite_size),
-                                                    (self.sprite_size * self.game.zoom_factor,
-                                                     self.sprite_size * self.game.zoom_factor))
+            assets = load_sprite_assets()
+            map_sprite = self.create_sprite_image(assets.player_sprite, assets.summer_color, self.sprite_size)
+        # The unzoomed player sprite in map pixels - the collision masks are made from it, so the collision does
+        # not depend on the zoom
+        self.map_sprite = map_sprite
+        self.set_sprite(pg.transform.scale(map_sprite, (self.sprite_size * self.game.render_zoom,
+                                                        self.sprite_size * self.game.render_zoom)))
 
     def load_sprite_from_file(self):
         sprite_path = os.path.join(self.sprites_directory, f"player.png")
         player_sprite = pg.transform.scale(pg.image.load(sprite_path).convert_alpha(),
-                                           (self.sprite_size * self.game.zoom_factor,
-                                            self.sprite_size * self.game.zoom_factor))
+                                           (self.sprite_size, self.sprite_size))
         return player_sprite
 
+    def set_sprite(self, player_sprite):
+        # Use a new (zoomed or recolored) player sprite - the rotations of the old one are not valid anymore
+        self.player_sprite = player_sprite
+        self.rotations = {}
+
+    def get_rotated(self, direction):
+        # Return the player sprite rotated by direction and the offset of its top left corner to its center
+        # Each direction is rotated only once
+        direction %= 360
+        rotated = self.rotations.get(direction)
+        if rotated is None:
+            rotated_player = pg.transform.rotate(self.player_sprite, direction)
+            rotated = (rotated_player, (-(rotated_player.get_width() // 2), -(rotated_player.get_height() // 2)))
+            self.rotations[direction] = rotated
+        return rotated
+
     def draw(self, direction):
         # Draw the player in the center
-        rotated_player = pg.transform.rotate(self.player_sprite, direction)
-        player_rect = rotated_player.get_rect(center=(self.game.screen_width // 2, self.game.screen_height // 2))
-        self.game.screen.blit(rotated_player, player_rect.topleft)
+        rotated_player, (offset_x, offset_y) = self.get_rotated(direction)
+        return self.game.canvas.blit(rotated_player, (self.game.canvas.get_width() // 2 + offset_x,
+                                                      self.game.canvas.get_height() // 2 + offset_y))
 
     def create_sprite_image(self, sprite_array, color, sprite_size):
-        # Create a new surface with the correct dimensions and transparency
-        surface = pg.Surface((sprite_size, sprite_size), pg.SRCALPHA)
-        # Iterate over the sprite array
-        for y, row in enumerate(sprite_array):
-            for x, pixel in enumerate(row):
-                finalpixel = color[pixel[0]] + (pixel[1],)
-                surface.set_at((x, y), finalpixel)
-        return surface
-
-    def check_allowed_area(self, x, y):
-        if self.game.map.map_data[y][x] in self.allowed_sprites:
-            return True
-        else:
-            return False
+        # Create a new surface out of color index and alpha of each pixel - one palette lookup for all pixels
+        sprite_array = np.array(sprite_array, dtype=np.uint8)
+        pixels = np.empty((sprite_size, sprite_size, 4), dtype=np.uint8)
+        pixels[..., :3] = np.array(color, dtype=np.uint8)[sprite_array[..., 0]]
+        pixels[..., 3] = sprite_array[..., 1]
+        return pg.image.frombytes(pixels.tobytes(), (sprite_size, sprite_size), 'RGBA')
@@ -0,0 +1,71 @@
+#
+# Author: Marco Alexander Reinke (DG1YIQ)
+# Date: December 2023
+# License: GNU GPL 3.0
+# Description: This is a simple clone of StreetMachine for the CPC 464
+#
+
+from pygame._sdl2.video import Window, Renderer, Texture
+
+
+class TextureRenderer:
+    def __init__(self, game):
+        self.game = game
+        # Use the renderer pygame created for the SCALED display (so convert() of surfaces keeps working)
+        self.window = Window.from_display_module()
+        self.renderer = Renderer.from_window(self.window)
+        # Everything is drawn in CPC pixels - the renderer scales it by the zoom factor
+        self.renderer.logical_size = (self.game.sizex * self.game.sprite_size, self.game.sizey * self.game.sprite_size)
+
+        # Texture of the sprite atlas and the area of each sprite number in it - uploaded once per mode
+        self.atlas = None
+        self.areas = None
+        self.atlas_mode = None
+        # Player texture - rotated by the renderer when drawing (created with the first race frame, the player
+        # is loaded after the highscore screen)
+        self.player = None
+        # HUD and highscore screen are drawn on game.screen and uploaded into this texture every frame
+        self.overlay = Texture(self.renderer, (self.game.screen_width, self.game.screen_height), streaming=True)
+        self.overlay.blend_mode = 1  # SDL_BLENDMODE_BLEND
+
+    def upload_atlas(self):
+        # Upload the unzoomed sprite atlas of the current mode as one texture - with all sprites of the map drawn
+        # into it, the texture is not updated when the atlas gets new sprites
+        self.game.sprites.warm_up(1, self.game.map.get_used_sprites())
+        atlas, self.areas = self.game.sprites.get_atlas(1)
+        self.atlas = Texture.from_surface(self.renderer, atlas)
+        self.atlas_mode = self.game.sprites.mode
+
+    def draw_map(self, x, y):
+        # Draw the visible sprites of the map as textures - same layout as Map.draw_tiles in CPC pixels
+        if self.atlas_mode != self.game.sprites.mode:
+            self.upload_atlas()
+        bgx, bgy, shiftx, shifty = self.game.map.get_viewport(x, y)
+        size = self.game.sprites.size
+        self.renderer.draw_color = self.game.map.get_background_color() + (255,)
+        self.renderer.clear()
+        left, top = max(0, bgx-1), max(0, bgy-1)
+        area = self.game.map.get_area(left, top, self.game.sizex+2, self.game.sizey+2)
+        for y, row in enumerate(area.tolist(), top - bgy):
+            for x, sprite_index in enumerate(row, left - bgx):
+                self.atlas.draw(srcrect=self.areas[sprite_index],
+                                dstrect=(x * size - shiftx, y * size - shifty, size, size))
+
+    def draw_player(self, direction):
+        # Draw the player in the center - SDL rotates clockwise, pg.transform.rotate counterclockwise
+        size = self.game.sprites.size
+        if self.player is None:
+            self.player = Texture.from_surface(self.renderer, self.game.player.player_sprite)
+        center_x, center_y = self.renderer.logical_size[0] // 2, self.renderer.logical_size[1] // 2
+        self.player.draw(dstrect=(center_x - size // 2, center_y - size // 2, size, size), angle=-direction)
+
+    def present(self):
+        # Draw HUD (or highscore screen) over the frame and show it
+        if self.game.mode == 'highscore':
+            self.renderer.draw_color = (0, 0, 0, 255)
+            self.renderer.clear()
+        self.overlay.update(self.game.screen)
+        self.overlay.draw(dstrect=(0, 0) + self.renderer.logical_size)
+        self.renderer.present()
+        # The HUD of the next frame is drawn on a transparent screen again
+        self.game.screen.fill((0, 0, 0, 0))
@@ -13,5 +13,45 @@ BG_COLOR_WINTER = (247, 245, 242)
 # Display Settings
 ZOOM_FACTOR = 4
 
+# Renderer - 'surface' draws everything with pygame surfaces, 'texture' draws map and player as
+# textures with pygame._sdl2 (tiles uploaded once per mode, rotation and zoom done by the renderer)
+RENDERER = 'surface'
+# Use the SDL software renderer for the texture renderer (for machines without GPU)
+TEXTURE_RENDERER_SOFTWARE = False
+
+# Draw map and player in CPC resolution (256 x 192) and scale the frame once to the screen
+# instead of drawing zoomed sprites (the HUD is drawn in screen resolution on top)
+NATIVE_RESOLUTION = False
+
+# Update only the changed parts of the display instead of flipping the whole screen every frame
+DIRTY_RECTS = True
+
+# Map Rendering
+# 'tiles' draws every visible sprite, 'prerender' composes the whole map once per mode and blits the viewport,
+# 'chunks' renders blocks of sprites on demand and keeps the recently used ones,
+# 'scroll' scrolls the previous frame by the camera movement and draws only the uncovered sprites
+MAP_RENDER_MODE = 'chunks'
+# Memory budget for the pre-rendered map in MB - if the zoomed map needs more, the sprites are drawn one by one
+MAP_PRERENDER_BUDGET_MB = 128
+# Size of a chunk in sprites - with chunks at least as big as the screen at most four are visible
+MAP_CHUNK_SIZE = 16
+# Memory budget for the chunk cache in MB - least recently used chunks are dropped above it
+MAP_CHUNK_BUDGET_MB = 32
+# Distance in (unzoomed) pixels around the screen in which chunks are rendered in advance
+MAP_CHUNK_PREFETCH = 32
+
+# Cache the zoomed sprite atlases on disk - they are rebuilt automatically if the sprites change
+SPRITE_CACHE = True
+SPRITE_CACHE_DIR = "cache"
+# Sprites are drawn into the zoomed atlas on first use - the ones within this distance (in sprites) around
+# the start position are drawn before the first frame
+SPRITE_PREWARM_DISTANCE = 16
+# Prepare the sprites of the next mode on a worker thread during a race - the mode switch only swaps them
+SPRITE_PREPARE_NEXT_MODE = True
+
+# Collision - 'mask' checks the pixels of the car against the solid pixels of the sprites under it,
+# 'tiles' checks only if the sprite under the center of the car may be driven on
+COLLISION = 'mask'
+
 # Debug Settings
 DEBUG = True
@@ -6,10 +6,23 @@
 #
 
 import pygame as pg
+import numpy as np
 import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+import settings
+from assets import load_sprite_assets, get_atlas_key, load_atlas, save_atlas
+from atlasareas import AtlasAreas
 
 
 class Sprites:
+    # Palette index of the background color of the mode (shines through transparent sprite pixels)
+    BACKGROUND = 254
+    # Palette index of transparent sprite pixels (colorkey)
+    TRANSPARENT = 255
+    # Mode that follows a mode in a race - its sprites are prepared in the background
+    NEXT_MODE = {"day": "night", "night": "winter", "winter": "day"}
+
     def __init__(self, game, size=16, usefiles=False):
         self.game = game
         # Directory containing your sprite images
@@ -19,36 +32,198 @@ class Sprites:
         # List to store loaded sprite images
         self.images = None
         self.usefiles = usefiles
-        self.color = None
+        # 256 color palette of the current mode - None if the sprites are loaded from PNG files
+        self.palette = None
+        # Palette indices of all sprites - the sprite images share this buffer
+        self.pixels = None
+        # All sprites below each other in one surface - the sprite images are subsurfaces of it
+        self.strip = None
+        # Mode the sprite images were created for (day, night or winter)
+        self.mode = None
+        # Atlases of the zoomed sprites - keyed by zoom factor, each entry is (atlas, areas) (see get_atlas)
+        self.atlas_cache = {}
+        # Palette indices of the atlases and the areas of the sprites in them - keyed by zoom factor,
+        # the atlases of all modes share these
+        self.atlas_pixels = {}
+        self.atlas_areas = {}
+        # How each atlas was created - keyed by zoom factor, (seconds, 'disk cache' or 'built')
+        self.atlas_stats = {}
+
+        # Worker thread preparing the surfaces of the next mode (and writing the disk cache) and the mode it
+        # prepares them for
+        self.worker = None
+        self.prepared_mode = None
+        self.prepared = None
+        # Mode switches that had to wait for the surfaces of the new mode and the total waiting time in seconds
+        self.stalls = 0
+        self.stall_time = 0.0
 
-        # Import the sprite array from sprites_array.py
-        from sprites_array import sprites
-        self.sprites = sprites
+        # Sprite assets from files/sprites.bin (or sprites_array.py)
+        self.assets = load_sprite_assets()
+        # Sprite array of shape (sprites, size, size, 2) with color index and alpha of each pixel
+        self.sprites = self.assets.sprites
 
         # Load the sprites
         self.load_sprites()
 
     def load_sprites(self):
-        from sprites_array import summer_color, winter_color, night_color
-        self.images = []
-        # Load the sprites from PNG Files or from sprites_array.py
+        # Highscore screen uses the day sprites
+        mode = self.game.mode if self.game.mode in ("day", "night", "winter") else "day"
+        # Nothing to do if the sprites for this mode are already loaded
+        if self.images and mode == self.mode:
+            return
+        self.mode = mode
+        print(self.mode)
+
+        # Load the sprites from PNG Files or from the sprite assets
         if self.usefiles:
+            # PNG Files have no palette - the atlases and the map have to be created again
+            self.atlas_cache = {}
+            self.images = []
             self.load_sprite_from_files()
+            self.strip = self.create_strip(self.images)
+            if self.game.map is not None:
+                self.game.map.build_background()
+        elif self.images:
+            # The sprites are palette based - switch to the surfaces of the mode prepared in the background
+            self.swap_surfaces(self.take_prepared(self.mode))
+            self.prepare(self.NEXT_MODE[self.mode])
         else:
             # Create the sprite images
-            # Iterate over the sprite array
-            print(self.game.mode)
-            if self.game.mode == "day":
-                self.color = summer_color
-            elif self.game.mode == "winter":
-                self.color = winter_color
-            elif self.game.mode == "night":
-                self.color = night_color
+            self.palette = self.get_palette(self.mode)
+            self.pixels, self.strip, self.images = self.create_sprite_images(self.sprites, self.palette, self.size)
+            self.prepare(self.NEXT_MODE[self.mode])
+
+    def prepare(self, mode):
+        # Start creating the surfaces of a mode on the worker thread
+        if not settings.SPRITE_PREPARE_NEXT_MODE:
+            return
+        self.prepared_mode = mode
+        self.prepared = self.get_worker().submit(self.create_mode_surfaces, mode)
+
+    def get_worker(self):
+        if self.worker is None:
+            self.worker = ThreadPoolExecutor(max_workers=1, thread_name_prefix="sprites")
+        return self.worker
+
+    def take_prepared(self, mode):
+        # Return the surfaces of a mode - wait for the worker if it is not done yet (or create them now if
+        # another mode was prepared) and count that as a stall
+        start = time.perf_counter()
+        prepared = self.prepared is not None and self.prepared_mode == mode
+        stalled = not prepared or not self.prepared.done()
+        surfaces = self.prepared.result() if prepared else self.create_mode_surfaces(mode)
+        if stalled:
+            stall = time.perf_counter() - start
+            self.stalls += 1
+            self.stall_time += stall
+            print(f'Sprites for {mode} not prepared - stall: {stall * 1000:.2f} ms')
+        self.prepared_mode = self.prepared = None
+        return surfaces
+
+    def create_mode_surfaces(self, mode):
+        # Create the surfaces of a mode on the pixel buffers of the current ones - only the palette differs
+        # (runs on the worker thread, so it must not change anything the game uses)
+        palette = self.get_palette(mode)
+        strip, images = self.create_strip_images(self.pixels, palette, self.size)
+        atlases = {zoom_factor: (self.create_atlas_surface(pixels, palette), self.atlas_areas[zoom_factor])
+                   for zoom_factor, pixels in list(self.atlas_pixels.items())}
+        return palette, strip, images, atlases
+
+    def swap_surfaces(self, surfaces):
+        # Use the surfaces of a mode - atlases of zoom factors used since they were prepared are created on demand
+        self.palette, self.strip, self.images, self.atlas_cache = surfaces
+        if self.game.map is not None:
+            self.game.map.set_palette(self.palette)
+
+    def get_palette(self, mode):
+        # 256 color palette of a mode - sprite colors, background color and transparent color
+        if mode == "winter":
+            color, background = self.assets.winter_color, settings.BG_COLOR_WINTER
+        elif mode == "night":
+            color, background = self.assets.night_color, settings.BG_COLOR_NIGHT
+        else:
+            color, background = self.assets.summer_color, settings.BG_COLOR_DAY
+        palette = list(color) + [(0, 0, 0)] * (256 - len(color))
+        palette[self.BACKGROUND] = background
+        return palette
+
+    def create_surface(self, size):
+        # Create a surface in the format of the sprites (8 bit with the current palette if possible)
+        if self.palette is None:
+            return pg.Surface(size).convert()
+        surface = pg.Surface(size, depth=8)
+        surface.set_palette(self.palette)
+        return surface
+
+    def get_atlas(self, zoom_factor):
+        # Return the atlas of all sprites scaled by zoom_factor and the area of each sprite number in it
+        # (areas[sprite number] - the sprite numbers of the map start with 1)
+        # An atlas is scaled only once per zoom factor - a mode switch only changes its palette
+        atlas = self.atlas_cache.get(zoom_factor)
+        if atlas is None:
+            if self.palette is None:
+                start = time.perf_counter()
+                tile_size = self.size * zoom_factor
+                surface = pg.transform.scale(self.strip, (tile_size, tile_size * len(self.images))).convert_alpha()
+                self.atlas_stats[zoom_factor] = (time.perf_counter() - start, 'built')
+                atlas = (surface, AtlasAreas(tile_size))
             else:
-                self.color = summer_color
-            for sprite_array in self.sprites:
-                sprite_surface = self.create_sprite_image(sprite_array, self.color, self.size)
-                self.images.append(sprite_surface)
+                # The palette indices are shared by all modes
+                if zoom_factor not in self.atlas_pixels:
+                    self.load_atlas_pixels(zoom_factor)
+                atlas = (self.create_atlas_surface(self.atlas_pixels[zoom_factor], self.palette),
+                         self.atlas_areas[zoom_factor])
+            self.atlas_cache[zoom_factor] = atlas
+        return atlas
+
+    def warm_up(self, zoom_factor, sprite_numbers):
+        # Draw sprites into the atlas of a zoom factor before they are used the first time
+        atlas, areas = self.get_atlas(zoom_factor)
+        for sprite_number in sprite_numbers:
+            areas[sprite_number]
+
+    def load_atlas_pixels(self, zoom_factor):
+        # Load the palette indices of the zoomed atlas from the disk cache - without it start with an empty atlas,
+        # draw each sprite into it the first time it is used and write the complete atlas to the cache in the
+        # background
+        start = time.perf_counter()
+        tile_size = self.size * zoom_factor
+        width, height = tile_size, tile_size * len(self.pixels)
+        key = get_atlas_key(self.sprites, zoom_factor) if settings.SPRITE_CACHE else None
+        pixels = load_atlas(settings.SPRITE_CACHE_DIR, key, zoom_factor, width, height) if key else None
+        if pixels is not None:
+            areas = AtlasAreas(tile_size)
+            source = 'disk cache'
+        else:
+            pixels = np.full((height, width), self.TRANSPARENT, np.uint8)
+            areas = AtlasAreas(tile_size, lambda sprite_number, area:
+                               self.draw_atlas_sprite(pixels, zoom_factor, sprite_number, area))
+            source = 'on demand'
+            if key:
+                self.get_worker().submit(self.save_scaled_atlas, key, zoom_factor)
+        # Areas first - the worker thread uses the areas of all zoom factors it finds pixels for
+        self.atlas_areas[zoom_factor] = areas
+        self.atlas_pixels[zoom_factor] = pixels
+        self.atlas_stats[zoom_factor] = (time.perf_counter() - start, source)
+
+    def draw_atlas_sprite(self, pixels, zoom_factor, sprite_number, area):
+        # Scale one sprite into the palette indices of an atlas - all surfaces on them show it at once
+        pixels[area.top:area.bottom] = self.pixels[sprite_number - 1].repeat(zoom_factor, 0).repeat(zoom_factor, 1)
+
+    def save_scaled_atlas(self, key, zoom_factor):
+        # Scale all sprites and write them to the disk cache (runs on the worker thread)
+        tile_size = self.size * zoom_factor
+        pixels = self.pixels.repeat(zoom_factor, 1).repeat(zoom_factor, 2)
+        save_atlas(settings.SPRITE_CACHE_DIR, key, zoom_factor, pixels.reshape(-1, tile_size))
+
+    def create_atlas_surface(self, pixels, palette):
+        # 8 bit atlas surface on the palette indices of an atlas
+        height, width = pixels.shape
+        surface = pg.image.frombuffer(pixels, (width, height), 'P')
+        surface.set_palette(palette)
+        surface.set_colorkey(self.TRANSPARENT)
+        return surface
 
     def load_sprite_from_files(self):
         # Iterate over the range of sprite indices (1 to 126 in your case)
@@ -59,12 +234,28 @@ class Sprites:
             # Load and append the sprite image to the list
             self.images.append(pg.image.load(sprite_path).convert_alpha())
 
-    def create_sprite_image(self, sprite_array, color, sprite_size):
-        # Create a new surface with the correct dimensions and transparency
-        surface = pg.Surface((sprite_size, sprite_size), pg.SRCALPHA)
-        # Iterate over the sprite array
-        for y, row in enumerate(sprite_array):
-            for x, pixel in enumerate(row):
-                finalpixel = color[pixel[0]] + (pixel[1],)
-                surface.set_at((x, y), finalpixel)
-        return surface
+    def create_strip(self, images):
+        # Put sprite images below each other in one surface (for sprites from PNG files)
+        strip = pg.Surface((self.size, self.size * len(images)), pg.SRCALPHA)
+        for i, image in enumerate(images):
+            strip.blit(image, (0, i * self.size))
+        return strip
+
+    def create_sprite_images(self, sprite_arrays, palette, sprite_size):
+        # Create 8 bit surfaces of all sprites at once - transparent pixels get the colorkey index
+        pixels = np.where(sprite_arrays[..., 1] == 0, self.TRANSPARENT, sprite_arrays[..., 0]).astype(np.uint8)
+        strip, images = self.create_strip_images(pixels, palette, sprite_size)
+        return pixels, strip, images
+
+    def create_strip_images(self, pixels, palette, sprite_size):
+        # All sprites below each other in one surface on the pixel buffer - each sprite is a subsurface of it
+        strip = pg.image.frombuffer(pixels, (sprite_size, sprite_size * len(pixels)), 'P')
+        strip.set_palette(palette)
+        strip.set_colorkey(self.TRANSPARENT)
+        images = []
+        for i in range(len(pixels)):
+            image = strip.subsurface((0, i * sprite_size, sprite_size, sprite_size))
+            image.set_palette(palette)
+            image.set_colorkey(self.TRANSPARENT)
+            images.append(image)
+        return strip, images
@@ -0,0 +1,49 @@
+#
+# Author: Marco Alexander Reinke (DG1YIQ)
+# Date: December 2023
+# License: GNU GPL 3.0
+# Description: This is a simple clone of StreetMachine for the CPC 464
+#
+# Startup phase timing - import this module first, the imports of the game are the first phase
+#
+
+import json
+import time
+
+# Time the game started importing its modules
+STARTED = time.perf_counter()
+
+
+class StartupProfile:
+    def __init__(self):
+        # Phases of the startup in order as (name, seconds)
+        self.phases = []
+        self.last = STARTED
+        # Print the report when the startup is finished and write it as JSON to path (if not None)
+        self.report = False
+        self.path = None
+        # Extra values for the report - e.g. how the sprite atlas was created
+        self.info = {}
+
+    def phase(self, name):
+        # End a phase - everything since the end of the previous phase is counted for it
+        now = time.perf_counter()
+        self.phases.append((name, now - self.last))
+        self.last = now
+
+    def finish(self):
+        # Print and write the report if it was requested
+        if not self.report:
+            return
+        total = sum(seconds for name, seconds in self.phases)
+        print(f'Startup: {total * 1000:.1f} ms')
+        for name, seconds in self.phases:
+            print(f'  {name:16s} {seconds * 1000:8.2f} ms')
+        for name, value in self.info.items():
+            print(f'  {name:16s} {value}')
+        if self.path:
+            with open(self.path, "w") as file:
+                json.dump({"total_ms": round(total * 1000, 3),
+                           "phases": [{"name": name, "ms": round(seconds * 1000, 3)} for name, seconds in self.phases],
+                           "info": self.info}, file, indent=2)
+            print(f'Startup report written to {self.path}')
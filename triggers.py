@@ -0,0 +1,51 @@
+#
+# Author: Marco Alexander Reinke (DG1YIQ)
+# Date: December 2023
+# License: GNU GPL 3.0
+# Description: This is a simple clone of StreetMachine for the CPC 464
+#
+
+import numpy as np
+
+
+class Triggers:
+    def __init__(self, game):
+        self.game = game
+        # Trigger zones of the track (start and finish line, checkpoints) from the map info - each zone has
+        # "tiles" [x, y, width, height] in sprites, "directions" [[from, to], ...] in degrees (both included)
+        # in which it triggers and an "action" - checkpoints have a "name" too
+        self.zones = game.map.info.get('triggers', [])
+        # Zones on each tile as index into cells (0 - no zone) - cells[index] is a tuple of
+        # (zone, direction intervals) in the order of the zones
+        self.grid, self.cells = self.compile_zones(self.zones, game.map.mapsize_x, game.map.mapsize_y)
+
+    def compile_zones(self, zones, width, height):
+        # Zone numbers on each tile - tiles with the same zones share a cell
+        tile_zones = {}
+        for number, zone in enumerate(zones):
+            x, y, zone_width, zone_height = zone['tiles']
+            for tile_y in range(max(0, y), min(height, y + zone_height)):
+                for tile_x in range(max(0, x), min(width, x + zone_width)):
+                    tile_zones[tile_y, tile_x] = tile_zones.get((tile_y, tile_x), ()) + (number,)
+
+        grid = np.zeros((height, width), dtype=np.int32)
+        cells = [()]
+        cell_index = {}
+        for (tile_y, tile_x), numbers in tile_zones.items():
+            if numbers not in cell_index:
+                cell_index[numbers] = len(cells)
+                cells.append(tuple((zones[number], tuple(tuple(interval) for interval in zones[number]['directions']))
+                                   for number in numbers))
+            grid[tile_y, tile_x] = cell_index[numbers]
+        return grid, cells
+
+    def get(self, x, y, direction):
+        # Zone that triggers for a car on map position x, y driving in direction - None if there is none
+        # (if zones overlap, the first one in the map info wins)
+        if not (0 <= x < self.game.map.mapsize_x and 0 <= y < self.game.map.mapsize_y):
+            return None
+        for zone, intervals in self.cells[self.grid[y, x]]:
+            for low, high in intervals:
+                if low <= direction <= high:
+                    return zone
+        return None
@@ -0,0 +1,126 @@
+#
+# Author: Marco Alexander Reinke (DG1YIQ)
+# Date: December 2023
+# License: GNU GPL 3.0
+# Description: This is a simple clone of StreetMachine for the CPC 464
+#
+
+import math
+import numpy as np
+import settings as settings
+
+
+class Vehicles:
+    # Sine and cosine of every full degree - directions are whole degrees, so the cars never call sin and cos
+    SIN = np.array([math.sin(math.radians(direction)) for direction in range(360)])
+    COS = np.array([math.cos(math.radians(direction)) for direction in range(360)])
+
+    def __init__(self, game, count=1):
+        self.game = game
+        # State of all cars - one array per value, index 0 is the player
+        self.x = np.zeros(count)
+        self.y = np.zeros(count)
+        self.direction = np.zeros(count, dtype=np.int64)
+        self.speed = np.zeros(count)
+        self.damage = np.zeros(count)
+        # Car is in an allowed area (street or green area)
+        self.allowed = np.ones(count, dtype=bool)
+        # Car hit a tile it may not drive on in the last move (tile based collision) and the point where it hit it
+        self.hit = np.zeros(count, dtype=bool)
+        self.contact_x = np.zeros(count)
+        self.contact_y = np.zeros(count)
+
+    def __len__(self):
+        return len(self.x)
+
+    def step(self):
+        # Advance all cars by one frame - move, check the allowed area and damage the cars that left it
+        self.move()
+        self.collide()
+        self.apply_damage()
+
+    def move(self):
+        # Move all cars by their speed in their direction and keep them inside the map
+        # speed is divided by 10 to get a better feeling of speed
+        game = self.game
+        size = game.sprite_size
+        direction = self.direction % 360
+        speed = self.speed / 10
+        x = np.clip(self.x - self.SIN[direction] * speed, game.sizex // 2 * size,
+                    game.map.mapsize_x * size - game.sizex // 2 * size - size)
+        y = np.clip(self.y - self.COS[direction] * speed, game.sizey // 2 * size,
+                    game.map.mapsize_y * size - game.sizey // 2 * size - size)
+
+        # Tile based collision - stop before the first tile a car may not drive on (without this a fast car could
+        # cut the corner of a tile between two frames)
+        self.hit[:] = False
+        if settings.COLLISION == 'tiles' and game.check_allowed_area:
+            x, y = self.sweep(x, y)
+        self.x[:] = x
+        self.y[:] = y
+
+    def sweep(self, x1, y1):
+        # Grid traversal of all cars from their position to x1, y1 at once - a move shorter than a tile crosses at
+        # most one vertical and one horizontal tile border, so it enters at most two tiles (the one behind the first
+        # border and the end tile), longer moves are swept one by one by the map
+        # Returns the positions where the cars stop, the cars that hit a tile are marked in hit
+        size = self.game.sprite_size
+        walkable = self.game.map.are_walkable
+        x0, y0 = self.x, self.y
+        dx, dy = x1 - x0, y1 - y0
+        tile_x0, tile_y0 = (x0 // size).astype(np.int64), (y0 // size).astype(np.int64)
+        tile_x1, tile_y1 = (x1 // size).astype(np.int64), (y1 // size).astype(np.int64)
+        cross_x, cross_y = tile_x1 != tile_x0, tile_y1 != tile_y0
+        # Part of the move (0 to 1) at which the vertical and horizontal border is crossed (inf if it is not)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            t_x = np.where(cross_x, (np.maximum(tile_x0, tile_x1) * size - x0) / dx, np.inf)
+            t_y = np.where(cross_y, (np.maximum(tile_y0, tile_y1) * size - y0) / dy, np.inf)
+        x_first = t_x < t_y
+        # The tile between start and end tile is only entered if both borders are crossed
+        middle_hit = (cross_x & cross_y) & ~walkable(np.where(x_first, tile_x1, tile_x0),
+                                                     np.where(x_first, tile_y0, tile_y1))
+        end_hit = (cross_x | cross_y) & ~walkable(tile_x1, tile_y1)
+        hit = middle_hit | end_hit
+        t = np.where(middle_hit, np.minimum(t_x, t_y), np.where(cross_x & cross_y, np.maximum(t_x, t_y),
+                                                                  np.minimum(t_x, t_y)))
+
+        x, y = x1.copy(), y1.copy()
+        cars = np.flatnonzero(hit)
+        if len(cars):
+            # Stop a hundredth of a pixel before the border
+            hit_t, hit_dx, hit_dy = t[cars], dx[cars], dy[cars]
+            stop = np.maximum(0.0, hit_t - 0.01 / np.maximum(np.abs(hit_dx), np.abs(hit_dy)))
+            x[cars] = x0[cars] + hit_dx * stop
+            y[cars] = y0[cars] + hit_dy * stop
+            self.contact_x[cars] = x0[cars] + hit_dx * hit_t
+            self.contact_y[cars] = y0[cars] + hit_dy * hit_t
+        self.hit[:] = hit
+
+        for i in np.flatnonzero((np.abs(dx) >= size) | (np.abs(dy) >= size)):
+            x[i], y[i], contact = self.game.map.sweep(x0[i], y0[i], x1[i], y1[i])
+            self.hit[i] = contact is not None
+            if contact is not None:
+                self.contact_x[i], self.contact_y[i] = contact
+        return x, y
+
+    def collide(self):
+        # Check if the cars are in an allowed area - no pixel of a car on a solid pixel of the map (checked car by
+        # car) or (tile based) no hit in the last move and the center of the car on a sprite it may drive on
+        if settings.COLLISION == 'mask':
+            collides = self.game.collision.collides
+            self.allowed[:] = [not collides(x, y, direction) for x, y, direction in
+                               zip(self.x.tolist(), self.y.tolist(), self.direction.tolist())]
+        else:
+            size = self.game.sprite_size
+            self.allowed[:] = ~self.hit & self.game.map.are_walkable((self.x // size).astype(np.int64),
+                                                                      (self.y // size).astype(np.int64))
+
+    def apply_damage(self):
+        # Cars that are not in an allowed area stop - the fast ones are damaged (100 is a crash)
+        if not self.game.check_allowed_area:
+            return
+        outside = ~self.allowed
+        fast = outside & (self.speed > 20)
+        self.damage[fast] += self.speed[fast] * 1.5
+        np.minimum(self.damage, 100, out=self.damage)
+        self.speed[outside] = 0